@@ -1,16 +1,37 @@
 """
 PPE Compliance Monitoring System - Ultra Fast Version
 Optimized for speed with cancellation support and enhanced UI
+
+Performance notes:
+- UI reruns are bound by Streamlit's websocket and markdown rendering, not Python
+  CPU; keep the number and size of st.markdown emissions per rerun low.
+- Static CSS/HTML lives in module-level constants (minified at import); themed
+  blocks are Template constants substituted once per theme via lru_cache.
+- Per-session caches in st.session_state are single-entry or pruned with the
+  history they belong to; don't let them grow with the session.
+- There is no numeric kernel here; SIMD/GPU work belongs in the detection engine.
 """
 
 import streamlit as st
+import cv2
 import numpy as np
 from PIL import Image
 import tempfile
 import os
 import time
+import functools
+import hashlib
+import json
+import re
+import csv
 import io
+import gzip
+import itertools
 import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from string import Template
 from datetime import datetime, date, timedelta
 
 # Import custom modules
@@ -27,580 +48,2580 @@ except ImportError:
     ATTENDANCE_AVAILABLE = False
     st.warning("⚠️ Attendance management not available. Please check installation.")
 
+# Optional fast JSON encoder for export downloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Application Constants
 PROGRESS_UPDATE_INTERVAL = 0.5  # seconds
 RESULTS_HISTORY_LIMIT = 10  # maximum number of results to keep in history
 MODEL_FILE_PATH = "best.pt"  # default model file path
+HISTORY_PAGE_SIZE = 5  # history sessions rendered per page
+INV_MB = 1.0 / (1024 * 1024)  # bytes -> megabytes multiplier
+
+# Quoted strings and ${name} placeholders are matched first so they are left untouched
+CSS_MINIFY_RE = re.compile(r'("[^"]*"|\'[^\']*\'|\$\{\w+\})|\s*/\*.*?\*/\s*|\s*([{}:;,>])\s*|\s+', re.S)
+
+def minify_css(css):
+    """Strip comments and whitespace around CSS punctuation once, at import time"""
+    return CSS_MINIFY_RE.sub(lambda m: m.group(1) or m.group(2) or ' ', css).strip()
+
+# Theme palettes keyed by theme name; configs are shared, never rebuilt per rerun
+THEMES = theme_manager.themes
+
+# Theme-driven HTML blocks, parsed once at import and filled per theme
+VIDEO_TAB_HEADER_TMPL = Template("""
+<div style="
+    background: linear-gradient(135deg, ${accent_color}15 0%, ${info_color}10 100%);
+    backdrop-filter: blur(10px);
+    border: 1px solid ${border_color};
+    border-radius: 20px;
+    padding: 2rem;
+    margin-bottom: 2rem;
+    text-align: center;
+    box-shadow: 0 8px 32px ${shadow};
+">
+    <h2 style="
+        color: ${text_primary};
+        margin: 0;
+        font-weight: 700;
+        font-size: 2rem;
+        background: linear-gradient(135deg, ${accent_color}, ${info_color});
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+    ">
+        🚀 Ultra-Fast Video Processing
+    </h2>
+    <p style="
+        color: ${text_secondary};
+        margin: 0.5rem 0 0 0;
+        font-size: 1.1rem;
+        font-weight: 500;
+    ">
+        Advanced AI-powered PPE compliance analysis with lightning-fast processing
+    </p>
+</div>
+""")
+
+UPLOAD_GUIDELINES_TMPL = Template("""
+<div style="
+    margin-top: 1.5rem;
+    padding: 2rem;
+    background: linear-gradient(135deg, ${accent_color}08 0%, ${info_color}05 100%);
+    backdrop-filter: blur(10px);
+    border-radius: 20px;
+    border: 1px solid ${border_color};
+    box-shadow: 0 4px 20px ${shadow};
+">
+    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+        <div style="
+            background: linear-gradient(135deg, ${accent_color}, ${info_color});
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            background-clip: text;
+            font-size: 1.5rem;
+            margin-right: 0.8rem;
+        ">💡</div>
+        <h4 style="
+            color: ${text_primary};
+            margin: 0;
+            font-weight: 700;
+            font-size: 1.3rem;
+        ">Upload Guidelines for Best Results</h4>
+    </div>
+    <div style="
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+        gap: 1rem;
+        margin-top: 1rem;
+    ">
+        <div style="
+            background: ${card_bg}80;
+            backdrop-filter: blur(10px);
+            padding: 1.2rem;
+            border-radius: 12px;
+            border: 1px solid ${border_color};
+        ">
+            <div style="color: ${success_color}; font-size: 1.2rem; margin-bottom: 0.5rem;">🎯</div>
+            <strong style="color: ${text_primary};">Best Quality:</strong>
+            <p style="color: ${text_secondary}; margin: 0.3rem 0 0 0; font-size: 0.9rem;">
+                Use 1080p or higher resolution videos for optimal detection accuracy
+            </p>
+        </div>
+        <div style="
+            background: ${card_bg}80;
+            backdrop-filter: blur(10px);
+            padding: 1.2rem;
+            border-radius: 12px;
+            border: 1px solid ${border_color};
+        ">
+            <div style="color: ${warning_color}; font-size: 1.2rem; margin-bottom: 0.5rem;">💡</div>
+            <strong style="color: ${text_primary};">Good Lighting:</strong>
+            <p style="color: ${text_secondary}; margin: 0.3rem 0 0 0; font-size: 0.9rem;">
+                Ensure people and PPE equipment are clearly visible
+            </p>
+        </div>
+        <div style="
+            background: ${card_bg}80;
+            backdrop-filter: blur(10px);
+            padding: 1.2rem;
+            border-radius: 12px;
+            border: 1px solid ${border_color};
+        ">
+            <div style="color: ${info_color}; font-size: 1.2rem; margin-bottom: 0.5rem;">📹</div>
+            <strong style="color: ${text_primary};">Stable Footage:</strong>
+            <p style="color: ${text_secondary}; margin: 0.3rem 0 0 0; font-size: 0.9rem;">
+                Avoid shaky or blurry videos for better analysis
+            </p>
+        </div>
+        <div style="
+            background: ${card_bg}80;
+            backdrop-filter: blur(10px);
+            padding: 1.2rem;
+            border-radius: 12px;
+            border: 1px solid ${border_color};
+        ">
+            <div style="color: ${accent_color}; font-size: 1.2rem; margin-bottom: 0.5rem;">🔄</div>
+            <strong style="color: ${text_primary};">Multiple Angles:</strong>
+            <p style="color: ${text_secondary}; margin: 0.3rem 0 0 0; font-size: 0.9rem;">
+                Include different viewpoints for comprehensive analysis
+            </p>
+        </div>
+    </div>
+</div>
+""")
 
-# Try to import webcam component
-try:
-    from webcam_component import create_webcam_interface
-    WEBCAM_AVAILABLE = True
-except ImportError:
-    WEBCAM_AVAILABLE = False
-
-# Page configuration
-st.set_page_config(
-    page_title="PPE Monitor Pro",
-    page_icon="🦺",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Ultra-modern CSS with enhanced animations and micro-interactions
-st.markdown("""
+VIDEO_UPLOAD_CSS_TMPL = Template(minify_css("""
 <style>
-    /* Hide Streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {visibility: hidden;}
+/* Modern upload container with glassmorphism */
+.modern-upload-container {
+    position: relative;
+    margin: 2rem 0;
+}
+
+.modern-upload-section {
+    border: 2px dashed ${accent_color}80;
+    border-radius: 24px;
+    padding: 3rem 2rem;
+    text-align: center;
+    background: linear-gradient(135deg, ${card_bg}90 0%, ${secondary_bg}70 100%);
+    backdrop-filter: blur(20px);
+    transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
+    position: relative;
+    overflow: hidden;
+    margin-bottom: 1.5rem;
+    box-shadow: 0 8px 32px ${shadow};
+}
+
+.modern-upload-section::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    bottom: 0;
+    background: linear-gradient(45deg, transparent 30%, ${accent_color}20 50%, transparent 70%);
+    transform: translateX(-100%);
+    transition: transform 0.8s ease;
+}
+
+.modern-upload-section:hover {
+    border-color: ${accent_color};
+    background: linear-gradient(135deg, ${card_bg}95 0%, ${secondary_bg}80 100%);
+    transform: translateY(-4px);
+    box-shadow: 0 16px 48px ${shadow_hover};
+}
+
+.modern-upload-section:hover::before {
+    transform: translateX(100%);
+}
+
+.upload-icon-modern {
+    font-size: 4rem;
+    margin-bottom: 1.5rem;
+    opacity: 0.8;
+    transition: all 0.4s ease;
+    background: linear-gradient(135deg, ${accent_color}, ${info_color});
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    background-clip: text;
+}
+
+.modern-upload-section:hover .upload-icon-modern {
+    opacity: 1;
+    transform: scale(1.1) rotate(5deg);
+}
+
+.upload-text-modern {
+    font-size: 1.6rem;
+    font-weight: 700;
+    color: ${text_primary};
+    margin-bottom: 1rem;
+    text-shadow: 0 2px 4px ${shadow};
+}
+
+.upload-subtitle-modern {
+    font-size: 1.1rem;
+    color: ${text_secondary};
+    margin-bottom: 1.5rem;
+    font-weight: 500;
+    line-height: 1.6;
+}
+
+.supported-formats-modern {
+    font-size: 0.9rem;
+    color: ${text_muted};
+    margin-top: 1rem;
+    padding: 0.8rem 1.5rem;
+    background: ${tertiary_bg}80;
+    backdrop-filter: blur(10px);
+    border-radius: 25px;
+    display: inline-block;
+    font-weight: 500;
+    border: 1px solid ${border_color};
+}
+
+/* Enhanced file uploader styling */
+.stFileUploader {
+    margin-top: -1rem;
+}
+
+.stFileUploader > div {
+    border: none !important;
+    background: transparent !important;
+}
+
+.stFileUploader > div > div {
+    border: 2px dashed ${accent_color}80 !important;
+    border-radius: 24px !important;
+    background: linear-gradient(135deg, ${card_bg}90 0%, ${secondary_bg}70 100%) !important;
+    backdrop-filter: blur(20px) !important;
+    padding: 3rem 2rem !important;
+    text-align: center !important;
+    transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
+    position: relative !important;
+    overflow: hidden !important;
+    box-shadow: 0 8px 32px ${shadow} !important;
+    min-height: 180px !important;
+    display: flex !important;
+    flex-direction: column !important;
+    justify-content: center !important;
+    align-items: center !important;
+}
+
+.stFileUploader > div > div:hover {
+    border-color: ${accent_color} !important;
+    background: linear-gradient(135deg, ${card_bg}95 0%, ${secondary_bg}80 100%) !important;
+    transform: translateY(-4px) !important;
+    box-shadow: 0 16px 48px ${shadow_hover} !important;
+}
+
+/* Drag states with enhanced visual feedback */
+.stFileUploader > div > div[data-testid="stFileUploaderDropzone"] {
+    border: 2px dashed ${accent_color}80 !important;
+    border-radius: 24px !important;
+    background: linear-gradient(135deg, ${card_bg}90 0%, ${secondary_bg}70 100%) !important;
+    backdrop-filter: blur(20px) !important;
+    padding: 3rem 2rem !important;
+    text-align: center !important;
+    transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
+    min-height: 180px !important;
+    display: flex !important;
+    align-items: center !important;
+    justify-content: center !important;
+    flex-direction: column !important;
+    box-shadow: 0 8px 32px ${shadow} !important;
+}
+
+.stFileUploader > div > div[data-testid="stFileUploaderDropzone"]:hover {
+    border-color: ${accent_color} !important;
+    background: linear-gradient(135deg, ${card_bg}95 0%, ${secondary_bg}80 100%) !important;
+    transform: translateY(-4px) !important;
+    box-shadow: 0 16px 48px ${shadow_hover} !important;
+}
+
+/* Active drag state */
+.stFileUploader > div > div[data-testid="stFileUploaderDropzone"].st-emotion-cache-1kyxreq {
+    border-color: ${success_color} !important;
+    background: linear-gradient(135deg, ${success_color}15 0%, ${card_bg}90 100%) !important;
+    box-shadow: 0 16px 48px ${success_color}30 !important;
+    transform: scale(1.02) !important;
+}
+
+/* File uploader text styling */
+.stFileUploader label, .stFileUploader div, .stFileUploader span {
+    color: ${text_primary} !important;
+    font-weight: 500 !important;
+}
+</style>
+""") + """
+
+<script>
+// Enhanced drag and drop with smooth animations
+document.addEventListener('DOMContentLoaded', function() {
+    const fileUploaders = document.querySelectorAll('[data-testid="stFileUploaderDropzone"]');
+
+    fileUploaders.forEach(uploader => {
+        uploader.addEventListener('dragenter', function(e) {
+            e.preventDefault();
+            this.style.borderColor = '${success_color}';
+            this.style.background = 'linear-gradient(135deg, ${success_color}15 0%, ${card_bg}90 100%)';
+            this.style.transform = 'scale(1.02)';
+            this.style.boxShadow = '0 16px 48px ${success_color}30';
+        });
+
+        uploader.addEventListener('dragleave', function(e) {
+            e.preventDefault();
+            this.style.borderColor = '${accent_color}80';
+            this.style.background = 'linear-gradient(135deg, ${card_bg}90 0%, ${secondary_bg}70 100%)';
+            this.style.transform = 'scale(1)';
+            this.style.boxShadow = '0 8px 32px ${shadow}';
+        });
+
+        uploader.addEventListener('drop', function(e) {
+            this.style.borderColor = '${accent_color}80';
+            this.style.background = 'linear-gradient(135deg, ${card_bg}90 0%, ${secondary_bg}70 100%)';
+            this.style.transform = 'scale(1)';
+            this.style.boxShadow = '0 8px 32px ${shadow}';
+        });
+    });
+});
+</script>
+""")
+
+SUCCESS_BANNER_TMPL = Template("""
+<div style="
+    background: linear-gradient(135deg, ${success_color}15 0%, ${success_color}05 100%);
+    border: 1px solid ${success_color}40;
+    border-radius: 12px;
+    padding: 1rem;
+    margin: 1rem 0;
+    text-align: center;
+    color: ${text_primary};
+    font-weight: 600;
+    animation: bannerFadeOut 0.6s ease 0.4s forwards;
+">
+    ✅ ${text}
+</div>
+<style>
+@keyframes bannerFadeOut {
+    to { opacity: 0; }
+}
+</style>
+""")
 
-    /* Main container with enhanced styling */
-    .main .block-container {
-        padding-top: 0.5rem;
-        padding-bottom: 1rem;
-        max-width: 1400px;
+ACTION_CARDS_TMPL = Template("""
+<style>
+.modern-action-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+    gap: 1.5rem;
+    margin: 2rem 0;
+}
+
+.modern-action-card {
+    background: ${card_bg};
+    border: 1px solid ${border_color};
+    border-radius: 20px;
+    padding: 1.5rem;
+    text-align: center;
+    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    box-shadow: 0 4px 20px ${shadow};
+    backdrop-filter: blur(10px);
+    position: relative;
+    overflow: hidden;
+}
+
+.modern-action-card:hover {
+    transform: translateY(-4px);
+    box-shadow: 0 12px 40px ${shadow_hover};
+}
+
+.action-icon {
+    font-size: 2.5rem;
+    margin-bottom: 1rem;
+    display: block;
+}
+
+.action-title {
+    color: ${text_primary};
+    font-weight: 700;
+    font-size: 1.1rem;
+    margin-bottom: 0.8rem;
+}
+
+.action-description {
+    color: ${text_secondary};
+    font-size: 0.9rem;
+    margin-bottom: 1.5rem;
+    line-height: 1.5;
+}
+
+@media (max-width: 768px) {
+    .modern-action-grid {
+        grid-template-columns: 1fr;
+        gap: 1rem;
     }
-
-    /* Global animations and transitions */
-    * {
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    .modern-action-card {
+        padding: 1.2rem;
     }
+}
+</style>
 
-    /* Enhanced button hover effects */
-    .stButton > button {
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        border-radius: 12px !important;
-        font-weight: 600 !important;
-        position: relative;
-        overflow: hidden;
-    }
+<div class="modern-action-grid">
+    <div class="modern-action-card">
+        <div class="action-icon" style="color: ${accent_color};">🔄</div>
+        <div class="action-title">Process New Video</div>
+        <div class="action-description">Clear current results and start fresh analysis</div>
+    </div>
+    <div class="modern-action-card">
+        <div class="action-icon" style="color: ${info_color};">👁️</div>
+        <div class="action-title">View Results Again</div>
+        <div class="action-description">Redisplay the comprehensive analysis results</div>
+    </div>
+    <div class="modern-action-card">
+        <div class="action-icon" style="color: ${danger_color};">🗑️</div>
+        <div class="action-title">Clear Results</div>
+        <div class="action-description">Remove current results from memory</div>
+    </div>
+</div>
+""")
+
+IMAGE_TAB_HEADER_TMPL = Template("""
+<div style="
+    background: linear-gradient(135deg, ${accent_color}15 0%, ${info_color}15 100%);
+    padding: 2rem;
+    border-radius: 16px;
+    margin-bottom: 2rem;
+    border: 1px solid ${border_color};
+    box-shadow: 0 4px 20px ${shadow};
+">
+    <h2 style="
+        color: ${text_primary};
+        margin: 0;
+        font-size: 2rem;
+        font-weight: 700;
+        text-align: center;
+        background: linear-gradient(135deg, ${accent_color}, ${info_color});
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+    ">📷 Instant Image Analysis</h2>
+    <p style="
+        color: ${text_secondary};
+        text-align: center;
+        margin: 0.5rem 0 0 0;
+        font-size: 1.1rem;
+    ">Upload an image for real-time PPE compliance detection</p>
+</div>
+""")
 
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-    }
+IMAGE_TAB_CSS_TMPL = Template(minify_css("""
+<style>
+/* Modern file uploader with clean design */
+.stFileUploader > div > div {
+    border: 2px dashed ${accent_color}40 !important;
+    border-radius: 20px !important;
+    background: linear-gradient(135deg, ${card_bg} 0%, ${secondary_bg} 100%) !important;
+    padding: 4rem 2rem !important;
+    text-align: center !important;
+    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
+    position: relative !important;
+    overflow: hidden !important;
+    min-height: 220px !important;
+    box-shadow: 0 8px 32px ${shadow} !important;
+    display: flex !important;
+    flex-direction: column !important;
+    justify-content: center !important;
+    align-items: center !important;
+}
+
+.stFileUploader > div > div:hover {
+    border-color: ${accent_color}80 !important;
+    background: linear-gradient(135deg, ${accent_color}10 0%, ${info_color}10 100%) !important;
+    transform: translateY(-2px) scale(1.01) !important;
+    box-shadow: 0 12px 40px ${shadow_hover} !important;
+}
+
+.stFileUploader > div > div::before {
+    content: '📤';
+    position: absolute;
+    top: 50%;
+    left: 50%;
+    transform: translate(-50%, -80%);
+    font-size: 4rem;
+    opacity: 0.4;
+    animation: bounce 2s ease-in-out infinite;
+}
+
+.stFileUploader > div > div::after {
+    content: 'Drag & Drop your image here or click to browse\\ASupported: JPG, PNG, BMP • Max 10MB';
+    position: absolute;
+    top: 50%;
+    left: 50%;
+    transform: translate(-50%, 20%);
+    color: ${text_primary};
+    font-size: 1.1rem;
+    font-weight: 600;
+    text-align: center;
+    line-height: 1.5;
+    white-space: pre-line;
+}
+
+@keyframes bounce {
+    0%, 20%, 50%, 80%, 100% { transform: translate(-50%, -80%) translateY(0); }
+    40% { transform: translate(-50%, -80%) translateY(-10px); }
+    60% { transform: translate(-50%, -80%) translateY(-5px); }
+}
+
+/* Hide default upload text */
+.stFileUploader label {
+    display: none !important;
+}
+
+.stFileUploader > div > div > div {
+    display: none !important;
+}
+
+/* Style the browse button when it appears */
+.stFileUploader button {
+    background: ${accent_color} !important;
+    color: white !important;
+    border: none !important;
+    border-radius: 8px !important;
+    padding: 0.5rem 1rem !important;
+    font-weight: 600 !important;
+    margin-top: 1rem !important;
+}
+
+/* Enhanced button styling for instant analysis */
+.stButton > button {
+    background: linear-gradient(135deg, ${accent_color} 0%, ${info_color} 100%) !important;
+    color: white !important;
+    border: none !important;
+    border-radius: 12px !important;
+    font-weight: 700 !important;
+    font-size: 1.1rem !important;
+    padding: 0.75rem 2rem !important;
+    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
+    box-shadow: 0 4px 20px ${accent_color}30 !important;
+    text-transform: uppercase !important;
+    letter-spacing: 0.5px !important;
+}
+
+.stButton > button:hover {
+    transform: translateY(-2px) scale(1.05) !important;
+    box-shadow: 0 8px 30px ${accent_color}40 !important;
+    background: linear-gradient(135deg, ${info_color} 0%, ${accent_color} 100%) !important;
+}
+
+.stButton > button:active {
+    transform: translateY(0px) scale(1.02) !important;
+}
+
+/* Enhanced download button styling */
+.stDownloadButton > button {
+    background: linear-gradient(135deg, ${success_color} 0%, ${info_color} 100%) !important;
+    color: white !important;
+    border: none !important;
+    border-radius: 12px !important;
+    font-weight: 600 !important;
+    padding: 0.75rem 2rem !important;
+    transition: all 0.3s ease !important;
+    box-shadow: 0 4px 20px ${success_color}30 !important;
+}
+
+.stDownloadButton > button:hover {
+    transform: translateY(-2px) !important;
+    box-shadow: 0 8px 30px ${success_color}40 !important;
+}
+
+/* Image container styling */
+.stImage > img {
+    border-radius: 12px !important;
+    box-shadow: 0 8px 32px ${shadow} !important;
+    transition: transform 0.3s ease !important;
+}
+
+.stImage > img:hover {
+    transform: scale(1.02) !important;
+}
+
+/* Metric cards hover effects */
+.metric-card {
+    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
+}
+
+.metric-card:hover {
+    transform: translateY(-8px) scale(1.02) !important;
+    box-shadow: 0 16px 48px ${shadow_hover} !important;
+}
+</style>
+"""))
 
-    .stButton > button::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-        transition: left 0.5s;
-    }
+IMAGE_METRIC_CARD_CSS = minify_css("""
+<style>
+.metric-card {
+    background: linear-gradient(135deg, var(--card-color) 0%, var(--card-color-dark) 100%);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 12px;
+    text-align: center;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+    margin-bottom: 1rem;
+}
+.metric-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+}
+.metric-value {
+    font-size: 2rem;
+    font-weight: 800;
+    margin-bottom: 0.5rem;
+}
+.metric-label {
+    font-size: 0.9rem;
+    opacity: 0.9;
+    font-weight: 600;
+}
+</style>
+""")
+
+# Summary metric card; filled with str.format_map (accent, value, label, text_secondary, shadow)
+METRIC_CARD_TMPL = """
+<div style="
+    background: linear-gradient(135deg, {accent}15 0%, {accent}05 100%);
+    border: 1px solid {accent}40;
+    border-radius: 16px;
+    padding: 1.5rem;
+    text-align: center;
+    backdrop-filter: blur(10px);
+    box-shadow: 0 4px 20px {shadow};
+">
+    <div style="
+        font-size: 2rem;
+        font-weight: 800;
+        color: {accent};
+        margin-bottom: 0.5rem;
+    ">{value}</div>
+    <div style="
+        color: {text_secondary};
+        font-weight: 600;
+        font-size: 0.9rem;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    ">{label}</div>
+</div>
+"""
 
-    .stButton > button:hover::before {
-        left: 100%;
-    }
+# Four-up grid wrapper so a row of metric cards is sent as one element
+METRIC_GRID_TMPL = '<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">{cards}</div>'
 
-    /* Enhanced metric cards */
-    .metric-card {
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        border-radius: 16px !important;
-        backdrop-filter: blur(10px);
-    }
+IMAGE_METRIC_CARD_TMPL = """
+<div class="metric-card" style="--card-color: {color}; --card-color-dark: {color_dark};">
+    <div class="metric-value">{value}</div>
+    <div class="metric-label">{label}</div>
+</div>
+"""
 
-    .metric-card:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 12px 40px rgba(0,0,0,0.15);
-    }
+IMAGE_UPLOAD_SPLASH_TMPL = Template("""
+<div style="
+    text-align: center;
+    padding: 1.5rem;
+    margin: 1rem 0;
+    background: linear-gradient(135deg, ${accent08} 0%, ${info08} 100%);
+    border-radius: 12px;
+    border: 1px solid ${accent20};
+    animation: fadeIn 0.5s ease-out;
+">
+    <div style="font-size: 2.5rem; margin-bottom: 0.5rem; opacity: 0.7;">📸</div>
+    <h4 style="color: ${text_primary}; margin: 0 0 0.5rem 0; font-weight: 600;">
+        Ready for Analysis
+    </h4>
+    <p style="color: ${text_secondary}; margin: 0; font-size: 0.9rem;">
+        Upload a clear image with people wearing PPE for instant compliance detection
+    </p>
+</div>
 
-    /* Smooth scrolling */
-    html {
-        scroll-behavior: smooth;
-    }
+<style>
+@keyframes fadeIn {
+    from { opacity: 0; transform: translateY(10px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+</style>
+""")
 
-    /* Enhanced loading animations */
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
+# Compliance colour bands indexed by compliance_band(): below 60%, 60-79%, 80%+
+COMPLIANCE_COLOR_KEYS = ('danger_color', 'warning_color', 'success_color')
+IMAGE_COMPLIANCE_COLORS = (('#f44336', '#d32f2f'), ('#ff9800', '#f57c00'), ('#4CAF50', '#45a049'))
 
-    @keyframes slideInUp {
-        from {
-            opacity: 0;
-            transform: translateY(30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
 
-    @keyframes fadeInScale {
-        from {
-            opacity: 0;
-            transform: scale(0.95);
-        }
-        to {
-            opacity: 1;
-            transform: scale(1);
+# Results history stylesheet (header, session cards, metric cards, controls)
+HISTORY_TAB_CSS = minify_css("""
+<style>
+.history-header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 3rem 2rem;
+    border-radius: 25px;
+    margin: 2rem 0;
+    text-align: center;
+    box-shadow:
+        0 20px 40px rgba(102, 126, 234, 0.3),
+        0 10px 20px rgba(0, 0, 0, 0.1);
+    position: relative;
+    overflow: hidden;
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+}
+.history-header::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: -100%;
+    width: 100%;
+    height: 100%;
+    background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.1), transparent);
+    animation: shimmer 3s infinite;
+}
+.history-header::after {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 4px;
+    background: linear-gradient(90deg, #ff6b6b, #4ecdc4, #45b7d1, #96ceb4, #feca57);
+    background-size: 300% 100%;
+    animation: gradientShift 4s ease infinite;
+}
+.history-title {
+    font-size: clamp(1.8rem, 5vw, 2.5rem);
+    font-weight: 900;
+    color: white;
+    margin-bottom: 1rem;
+    text-shadow: 0 4px 8px rgba(0,0,0,0.3);
+    letter-spacing: -0.5px;
+}
+.history-subtitle {
+    color: rgba(255, 255, 255, 0.9);
+    font-weight: 600;
+    font-size: clamp(1.1rem, 3vw, 1.4rem);
+    background: rgba(255, 255, 255, 0.15);
+    padding: 0.8rem 1.5rem;
+    border-radius: 30px;
+    display: inline-block;
+    border: 2px solid rgba(255, 255, 255, 0.2);
+    backdrop-filter: blur(10px);
+    box-shadow: 0 8px 16px rgba(0, 0, 0, 0.1);
+}
+.session-card {
+    background: linear-gradient(145deg, #ffffff 0%, #f8fafc 100%);
+    border-radius: 25px;
+    border: 1px solid rgba(102, 126, 234, 0.1);
+    margin: 2rem 0;
+    box-shadow:
+        0 10px 30px rgba(0, 0, 0, 0.08),
+        0 4px 15px rgba(102, 126, 234, 0.1);
+    transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
+    overflow: hidden;
+    position: relative;
+}
+.session-card::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 3px;
+    background: linear-gradient(90deg, #667eea, #764ba2, #667eea);
+    background-size: 200% 100%;
+    animation: gradientShift 3s ease infinite;
+}
+.session-card:hover {
+    box-shadow:
+        0 20px 50px rgba(0, 0, 0, 0.15),
+        0 10px 25px rgba(102, 126, 234, 0.2);
+    transform: translateY(-8px) scale(1.02);
+    border-color: rgba(102, 126, 234, 0.3);
+}
+.session-header {
+    background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
+    padding: 2rem;
+    border-radius: 25px 25px 0 0;
+    border-bottom: 1px solid rgba(102, 126, 234, 0.1);
+    position: relative;
+}
+.session-metrics {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
+    gap: 2rem;
+    padding: 2.5rem;
+    background: rgba(248, 250, 252, 0.5);
+}
+.metric-card {
+    text-align: center;
+    padding: 2rem 1.5rem;
+    background: linear-gradient(145deg, #ffffff 0%, #f8fafc 100%);
+    border-radius: 20px;
+    border: 1px solid rgba(226, 232, 240, 0.8);
+    box-shadow:
+        0 8px 25px rgba(0, 0, 0, 0.06),
+        0 3px 10px rgba(0, 0, 0, 0.04);
+    transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
+    min-height: 120px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    position: relative;
+    overflow: hidden;
+    backdrop-filter: blur(10px);
+}
+.metric-card:hover {
+    transform: translateY(-5px) scale(1.05);
+    box-shadow:
+        0 15px 35px rgba(0, 0, 0, 0.12),
+        0 8px 20px rgba(0, 0, 0, 0.08);
+    border-color: var(--metric-color, #667eea);
+    background: linear-gradient(145deg, #ffffff 0%, #f1f5f9 100%);
+}
+.metric-card::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 5px;
+    background: linear-gradient(90deg, var(--metric-color, #667eea), var(--metric-color-light, #764ba2));
+    border-radius: 20px 20px 0 0;
+}
+.metric-card::after {
+    content: '';
+    position: absolute;
+    top: 50%;
+    left: 50%;
+    width: 100px;
+    height: 100px;
+    background: radial-gradient(circle, var(--metric-color, #667eea)10, transparent 70%);
+    transform: translate(-50%, -50%);
+    opacity: 0;
+    transition: opacity 0.3s ease;
+    pointer-events: none;
+}
+.metric-card:hover::after {
+    opacity: 0.05;
+}
+.metric-value {
+    font-size: clamp(1.6rem, 4vw, 2.2rem);
+    font-weight: 900;
+    color: var(--metric-color, #667eea);
+    margin-bottom: 0.8rem;
+    line-height: 1;
+    text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+    letter-spacing: -0.5px;
+    transition: all 0.3s ease;
+}
+.metric-label {
+    font-size: clamp(0.85rem, 2vw, 1rem);
+    color: #64748b;
+    text-transform: uppercase;
+    font-weight: 600;
+    letter-spacing: 1px;
+    line-height: 1.3;
+    opacity: 0.8;
+    transition: all 0.3s ease;
+}
+.metric-card:hover .metric-value {
+    transform: scale(1.1);
+    color: var(--metric-color, #667eea);
+}
+.metric-card:hover .metric-label {
+    opacity: 1;
+    color: #475569;
+}
+
+/* Enhanced animations */
+@keyframes shimmer {
+    0% { left: -100%; }
+    100% { left: 100%; }
+}
+
+.session-card {
+    animation: fadeInUp 0.6s ease-out;
+}
+/* Enhanced responsive design */
+@media (max-width: 768px) {
+    .history-header {
+        padding: 2rem 1.5rem;
+        margin: 1rem 0;
+    }
+    .session-metrics {
+        grid-template-columns: repeat(2, 1fr);
+        gap: 1.5rem;
+        padding: 2rem 1.5rem;
+    }
+    .metric-card {
+        padding: 1.5rem 1rem;
+        min-height: 100px;
+    }
         }
+@media (max-width: 480px) {
+    .history-header {
+        padding: 1.5rem 1rem;
     }
-
-    /* Apply animations to cards */
-    .modern-action-card,
-    .modern-upload-section,
-    .result-panel {
-        animation: slideInUp 0.6s ease-out;
+    .session-metrics {
+        grid-template-columns: 1fr;
+        gap: 1rem;
+        padding: 1.5rem 1rem;
     }
-
-    /* Enhanced focus states for accessibility */
-    .stButton > button:focus,
-    .stSelectbox > div > div:focus,
-    .stFileUploader > div:focus {
-        outline: 2px solid var(--accent-color);
-        outline-offset: 2px;
+    .metric-card {
+        padding: 1.2rem 0.8rem;
+        min-height: 90px;
     }
-    
-    /* Ultra-modern header with theme support */
-    .ultra-header {
-        background: linear-gradient(135deg, var(--accent-color) 0%, var(--secondary-bg) 100%);
-        color: var(--text-primary);
-        padding: 1.5rem;
-        border-radius: 15px;
-        text-align: center;
-        margin-bottom: 1.5rem;
-        box-shadow: 0 8px 32px var(--shadow);
-        backdrop-filter: blur(10px);
-        border: 1px solid var(--border-color);
-        position: relative;
     }
 
-    /* Help icon in corner */
-    .help-icon {
-        position: fixed;
-        top: 20px;
-        right: 20px;
-        z-index: 9999;
-        background: var(--accent-color);
-        color: white;
-        width: 50px;
-        height: 50px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
+
+/* History detection tabs; colours come from the --history-results-* theme properties */
+.history-detection-results .stTabs [data-baseweb="tab-list"] {
+    gap: 20px;
+    background: var(--history-results-list-bg);
+    border-radius: 28px;
+    padding: 24px;
+    margin: 2.5rem 0;
+    box-shadow: 0 12px 40px var(--history-results-shadow);
+    backdrop-filter: blur(25px);
+    border: 2px solid var(--history-results-border);
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    width: 100%;
+    overflow-x: auto;
+}
+
+.history-detection-results .stTabs [data-baseweb="tab"] {
+    background: var(--history-results-tab-bg);
+    border: 2px solid var(--history-results-border);
+    border-radius: 20px;
+    padding: 0 3rem;
+    margin: 0 6px;
+    min-width: 240px;
+    height: 75px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-weight: 700;
+    font-size: 1.2rem;
+    color: var(--history-results-text);
+    transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
+    position: relative;
+    overflow: hidden;
+    backdrop-filter: blur(15px);
+    text-shadow: 0 1px 2px rgba(0,0,0,0.1);
+    cursor: pointer;
+}
+
+.history-detection-results .stTabs [data-baseweb="tab"]:before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: -100%;
+    width: 100%;
+    height: 100%;
+    background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
+    transition: left 0.5s;
+}
+
+.history-detection-results .stTabs [data-baseweb="tab"]:hover {
+    transform: translateY(-3px) scale(1.02);
+    box-shadow: 0 12px 35px var(--history-results-shadow);
+    background: var(--history-results-tab-hover-bg);
+    border-color: var(--history-results-accent);
+}
+
+.history-detection-results .stTabs [data-baseweb="tab"]:hover:before {
+    left: 100%;
+}
+
+.history-detection-results .stTabs [data-baseweb="tab"][aria-selected="true"] {
+    background: var(--history-results-tab-selected-bg);
+    color: white;
+    border-color: var(--history-results-accent);
+    box-shadow: 0 12px 35px var(--history-results-accent-glow);
+    transform: translateY(-2px) scale(1.05);
+    text-shadow: 0 2px 4px rgba(0,0,0,0.3);
+}
+
+.history-detection-results .stTabs [data-baseweb="tab-panel"] {
+    background: var(--history-results-card-bg);
+    border-radius: 24px;
+    padding: 3rem;
+    margin-top: 1.5rem;
+    box-shadow: 0 12px 40px var(--history-results-shadow);
+    border: 2px solid var(--history-results-border);
+    backdrop-filter: blur(15px);
+    min-height: 400px;
+}
+
+/* Enhanced responsive design for broader tabs */
+@media (max-width: 768px) {
+    .history-detection-results .stTabs [data-baseweb="tab-list"] {
+        gap: 16px;
+        padding: 20px;
+        flex-wrap: wrap;
         justify-content: center;
-        cursor: pointer;
-        box-shadow: 0 4px 20px var(--shadow);
-        transition: all 0.3s ease;
-        font-size: 1.2rem;
-        font-weight: bold;
-        border: 2px solid var(--border-color);
     }
 
-    .help-icon:hover {
-        transform: scale(1.1);
-        box-shadow: 0 6px 25px var(--shadow);
-        background: var(--secondary-bg);
+    .history-detection-results .stTabs [data-baseweb="tab"] {
+        font-size: 1.1rem;
+        padding: 0 2rem;
+        min-width: 180px;
+        height: 65px;
     }
 
-
-    
-    .ultra-header h1 {
-        font-size: 2.2rem;
-        font-weight: 800;
-        margin: 0;
-        text-shadow: 2px 2px 4px var(--shadow);
-        color: var(--text-primary);
+    .history-detection-results .stTabs [data-baseweb="tab-panel"] {
+        padding: 2rem;
     }
+}
 
-    .ultra-header p {
+@media (max-width: 480px) {
+    .history-detection-results .stTabs [data-baseweb="tab"] {
         font-size: 1rem;
-        margin: 0.3rem 0 0 0;
-        opacity: 0.95;
-        color: var(--text-secondary);
+        padding: 0 1.5rem;
+        min-width: 160px;
+        height: 60px;
     }
 
-    /* Enhanced file uploader styling for main content */
-    .stFileUploader {
-        background: var(--card-bg) !important;
-        border: 2px dashed var(--accent-color) !important;
-        border-radius: 12px !important;
-        padding: 1rem !important;
+    .history-detection-results .stTabs [data-baseweb="tab-list"] {
+        gap: 12px;
+        padding: 16px;
     }
 
-    .stFileUploader label {
-        color: var(--text-primary) !important;
-        font-weight: 600 !important;
+    .history-detection-results .stTabs [data-baseweb="tab-panel"] {
+        padding: 1.5rem;
     }
+}
 
-    .stFileUploader [data-testid="stFileUploaderDropzone"] {
-        background: var(--secondary-bg) !important;
-        border: 2px dashed var(--accent-color) !important;
-        border-radius: 8px !important;
-        color: var(--text-primary) !important;
-        padding: 2rem !important;
-        text-align: center !important;
-    }
+.history-detection-results {
+    animation: fadeInUp 0.6s ease-out;
+}
+</style>
+""")
 
-    .stFileUploader [data-testid="stFileUploaderDropzoneInstructions"] {
-        color: var(--text-primary) !important;
-        font-size: 1.1rem !important;
-        font-weight: 600 !important;
-    }
 
-    .stFileUploader [data-testid="stFileUploaderDropzoneInstructions"] div {
-        color: var(--text-secondary) !important;
-        font-size: 0.9rem !important;
-        margin-top: 0.5rem !important;
-    }
-    
-    /* Speed metrics */
-    .speed-card {
+# History metric card styles as (color, light, icon): violations indexed by bool(violations),
+# compliance and processing time by the first bucket whose bound matches
+VIOLATION_STYLE = (("#10b981", "#34d399", "✅"), ("#ef4444", "#f87171", "⚠️"))
+COMPLIANCE_BUCKETS = (
+    (90, ("#10b981", "#34d399", "🏆")),
+    (75, ("#f59e0b", "#fbbf24", "📊")),
+    (float('-inf'), ("#ef4444", "#f87171", "📉")),
+)
+TIME_BUCKETS = (
+    (30, ("#8b5cf6", "#a78bfa", "⚡")),
+    (120, ("#06b6d4", "#22d3ee", "⏱️")),
+    (float('inf'), ("#f59e0b", "#fbbf24", "🕐")),
+)
+
+# Results history dashboard header; filled with str.format_map (total_sessions, total_frames, avg_compliance)
+HISTORY_HEADER_TMPL = """
+<div class="history-header">
+    <div class="history-title">🎬 Processing History Dashboard</div>
+    <div class="history-subtitle">
+        {total_sessions} Sessions • {total_frames:,} Frames • {avg_compliance:.1f}% Avg Compliance
+    </div>
+</div>
+"""
+
+# Results history session metric card; filled with str.format (color, light, value, icon, label)
+HISTORY_METRIC_CARD_TMPL = (
+    '<div class="metric-card" style="--metric-color: {color}; --metric-color-light: {light};">'
+    '<div class="metric-value">{value}</div>'
+    '<div class="metric-label">{icon} {label}</div>'
+    '</div>'
+)
+
+
+# Theme colours for the history detection tabs, exposed as CSS custom properties
+HISTORY_RESULTS_THEME_TMPL = Template(minify_css("""
+<style>
+:root {
+    --history-results-list-bg: linear-gradient(135deg, ${card_bg}98 0%, ${secondary_bg}85 100%);
+    --history-results-tab-bg: linear-gradient(135deg, ${accent_color}25 0%, ${info_color}20 100%);
+    --history-results-tab-hover-bg: linear-gradient(135deg, ${accent_color}35 0%, ${info_color}30 100%);
+    --history-results-tab-selected-bg: linear-gradient(135deg, ${accent_color} 0%, ${info_color} 100%);
+    --history-results-accent-glow: ${accent_color}50;
+    --history-results-shadow: ${shadow};
+    --history-results-border: ${border_color};
+    --history-results-text: ${text_primary};
+    --history-results-accent: ${accent_color};
+    --history-results-card-bg: ${card_bg};
+}
+</style>
+"""))
+
+
+# History "View Results" confirmation card
+HISTORY_VIEW_BANNER_TMPL = Template("""
+<div style="
+    background: linear-gradient(135deg, ${success_color}15 0%, ${info_color}10 100%);
+    border: 2px solid ${success_color};
+    border-radius: 16px;
+    padding: 1.5rem;
+    margin: 1rem 0;
+    text-align: center;
+    animation: slideIn 0.5s ease-out;
+">
+    <div style="
+        color: ${success_color};
+        font-size: 1.2rem;
+        font-weight: 700;
+        margin-bottom: 0.5rem;
+    ">✅ Success!</div>
+    <div style="
+        color: ${text_primary};
+        font-size: 1rem;
+    ">Detection results will be displayed in broader horizontal tabs below</div>
+</div>
+
+<style>
+@keyframes slideIn {
+    from { opacity: 0; transform: translateY(-20px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+</style>
+""")
+
+# Export tab banner (static)
+EXPORT_TAB_BANNER = """
+<div style="
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 1.5rem 2rem;
+    border-radius: 15px;
+    text-align: center;
+    margin-bottom: 2rem;
+    box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
+    position: relative;
+    overflow: hidden;
+">
+    <div style="
+        position: absolute;
+        top: -50%;
+        left: -50%;
+        width: 200%;
+        height: 200%;
+        background: linear-gradient(45deg, transparent, rgba(255,255,255,0.1), transparent);
+        animation: shimmer 3s ease-in-out infinite;
+    "></div>
+    <div style="position: relative; z-index: 1;">
+        <h2 style="margin: 0 0 0.5rem 0; font-size: 2rem; text-shadow: 0 2px 10px rgba(0,0,0,0.3);">
+            📊 Export Session Data
+        </h2>
+        <p style="margin: 0; font-size: 1.1rem; opacity: 0.9; text-shadow: 0 1px 5px rgba(0,0,0,0.3);">
+            Comprehensive analytics and download center
+        </p>
+    </div>
+</div>
+
+<style>
+@keyframes shimmer {
+    0% { transform: translateX(-100%) translateY(-100%) rotate(45deg); }
+    100% { transform: translateX(100%) translateY(100%) rotate(45deg); }
+}
+</style>
+"""
+
+# Export tab overview heading (static)
+EXPORT_OVERVIEW_HEADING = """
+<div style="
+    background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
+    border-radius: 15px;
+    padding: 1.5rem;
+    margin: 1.5rem 0;
+    border-left: 5px solid #667eea;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.05);
+">
+    <h4 style="margin: 0 0 1rem 0; color: #2c3e50; font-size: 1.3rem;">
+        📈 Session Overview & Key Metrics
+    </h4>
+</div>
+"""
+
+# Export tab download center heading (static)
+EXPORT_DOWNLOAD_HEADING = """
+<div style="
+    background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
+    border-radius: 15px;
+    padding: 2rem;
+    margin: 2rem 0;
+    border-left: 5px solid #28a745;
+    box-shadow: 0 6px 20px rgba(0,0,0,0.08);
+    position: relative;
+    overflow: hidden;
+">
+    <div style="
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        height: 3px;
+        background: linear-gradient(90deg, #28a745, #20c997, #28a745);
+        background-size: 200% 100%;
+        animation: gradientShift 3s ease-in-out infinite;
+    "></div>
+    <h4 style="margin: 0 0 1rem 0; color: #2c3e50; font-size: 1.4rem; display: flex; align-items: center; gap: 0.5rem;">
+        📥 Download Center
+        <span style="font-size: 0.8rem; background: #28a745; color: white; padding: 0.2rem 0.6rem; border-radius: 12px; font-weight: 600;">
+            Ready
+        </span>
+    </h4>
+    <p style="margin: 0; color: #6c757d; font-size: 1rem;">
+        Export your session data in multiple formats for analysis and reporting
+    </p>
+</div>
+"""
+
+# Export tab session header; filled with str.format_map (frame_count, duration_text)
+EXPORT_HEADER_TMPL = """
+<div class="export-header">
+    <h2 style="margin: 0 0 1rem 0;">📊 Session Export Ready</h2>
+    <p style="margin: 0; font-size: 1.1rem; opacity: 0.9;">
+        {frame_count:,} frames processed • {duration_text} session duration
+    </p>
+</div>
+"""
+
+# Export tab metric card; filled with str.format (accent, value, label)
+EXPORT_METRIC_CARD_TMPL = (
+    '<div class="export-metric-card" style="--card-accent: {accent};">'
+    '<div class="export-metric-value">{value}</div>'
+    '<div class="export-metric-label">{label}</div>'
+    '</div>'
+)
+
+# Static history-tab empty state, rendered with st.html (no markdown parsing)
+HISTORY_EMPTY_STATE_HTML = """
+<div style="
+    background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
+    border-radius: 25px;
+    padding: 4rem 2rem;
+    text-align: center;
+    margin: 2rem 0;
+    border: 1px solid rgba(102, 126, 234, 0.1);
+    box-shadow: 0 10px 30px rgba(0, 0, 0, 0.05);
+">
+    <div style="font-size: 4rem; margin-bottom: 1rem;">🎬</div>
+    <h3 style="color: #475569; margin-bottom: 1rem; font-weight: 700;">
+        No Processing History Yet
+    </h3>
+    <p style="color: #64748b; font-size: 1.1rem; margin-bottom: 2rem; max-width: 500px; margin-left: auto; margin-right: auto;">
+        Start processing videos to build your analysis history. All your sessions will appear here with detailed insights and downloadable results.
+    </p>
+</div>
+
+<h3>✨ What You'll Get</h3>
+"""
+
+HISTORY_FEATURE_CARDS_HTML = """
+<div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;">
+    <div style="
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 20px;
+        margin: 1rem 0;
+        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.3);
+    ">
+        <h4 style="margin: 0 0 1rem 0; display: flex; align-items: center; gap: 0.5rem;">
+            📊 <span>Detailed Analytics</span>
+        </h4>
+        <ul style="margin: 0; padding-left: 1rem; line-height: 1.6;">
+            <li>Frame-by-frame analysis</li>
+            <li>Compliance rate tracking</li>
+            <li>Violation timeline</li>
+            <li>Performance metrics</li>
+        </ul>
+    </div>
+    <div style="
         background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
         color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        margin: 0.5rem 0;
-        box-shadow: 0 4px 15px rgba(255, 107, 107, 0.3);
-    }
-    
-    .speed-value {
-        font-size: 1.8rem;
-        font-weight: bold;
-        margin: 0;
-    }
-    
-    .speed-label {
-        font-size: 0.8rem;
-        opacity: 0.9;
-        margin: 0;
-    }
-    
-    /* Status cards */
-    .status-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-        border-left: 4px solid #667eea;
-        margin: 0.5rem 0;
-        transition: all 0.3s ease;
-        text-align: center;
-        min-height: 100px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
+        padding: 2rem;
+        border-radius: 20px;
+        margin: 1rem 0;
+        box-shadow: 0 8px 25px rgba(255, 107, 107, 0.3);
+    ">
+        <h4 style="margin: 0 0 1rem 0; display: flex; align-items: center; gap: 0.5rem;">
+            📥 <span>Export Options</span>
+        </h4>
+        <ul style="margin: 0; padding-left: 1rem; line-height: 1.6;">
+            <li>Download processed videos</li>
+            <li>JSON analysis reports</li>
+            <li>Session comparisons</li>
+            <li>Historical data access</li>
+        </ul>
+    </div>
+</div>
+"""
 
-    .status-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 30px rgba(0,0,0,0.12);
+HISTORY_PRO_TIP_HTML = """
+<div style="
+    background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 15px;
+    margin: 2rem 0;
+    text-align: center;
+    box-shadow: 0 6px 20px rgba(16, 185, 129, 0.3);
+">
+    <strong>💡 Pro Tip:</strong> History automatically keeps your last 10 processing sessions with full data retention
+</div>
+"""
+
+# Video results dashboard tab styling; filled per theme
+DETECTION_RESULTS_TABS_CSS_TMPL = Template(minify_css("""
+<style>
+/* Enhanced broader tab styling for detection results */
+.detection-results-tabs .stTabs [data-baseweb="tab-list"] {
+    gap: 12px;
+    background: linear-gradient(135deg, ${card_bg}95 0%, ${secondary_bg}80 100%);
+    border-radius: 20px;
+    padding: 16px;
+    margin: 2rem 0;
+    box-shadow: 0 8px 32px ${shadow};
+    backdrop-filter: blur(20px);
+    border: 1px solid ${border_color};
+}
+
+.detection-results-tabs .stTabs [data-baseweb="tab"] {
+    height: 60px;
+    min-width: 200px;
+    padding: 0 2rem;
+    background: linear-gradient(135deg, ${accent_color}10 0%, ${accent_color}05 100%);
+    border: 1px solid ${accent_color}30;
+    border-radius: 16px;
+    color: ${text_primary};
+    font-weight: 600;
+    font-size: 1rem;
+    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    text-align: center;
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+}
+
+.detection-results-tabs .stTabs [data-baseweb="tab"]:hover {
+    background: linear-gradient(135deg, ${accent_color}20 0%, ${accent_color}10 100%);
+    border-color: ${accent_color}50;
+    transform: translateY(-2px);
+    box-shadow: 0 6px 20px ${shadow};
+}
+
+.detection-results-tabs .stTabs [data-baseweb="tab"][aria-selected="true"] {
+    background: linear-gradient(135deg, ${accent_color} 0%, ${accent_color}80 100%);
+    border-color: ${accent_color};
+    color: white;
+    box-shadow: 0 8px 25px ${accent_color}40;
+    transform: translateY(-3px);
+}
+
+.detection-results-tabs .stTabs [data-baseweb="tab-panel"] {
+    padding: 2rem;
+    background: ${card_bg};
+    border-radius: 20px;
+    border: 1px solid ${border_color};
+    box-shadow: 0 4px 20px ${shadow};
+    margin-top: 1rem;
+}
+
+/* Perfect text fitting in metric cards */
+.detection-results-tabs .metric-card {
+    background: linear-gradient(135deg, var(--card-color, ${accent_color})15 0%, var(--card-color, ${accent_color})05 100%);
+    border: 1px solid var(--card-color, ${accent_color})30;
+    border-radius: 16px;
+    padding: 1.5rem;
+    text-align: center;
+    transition: all 0.3s ease;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    height: 120px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    align-items: center;
+}
+
+.detection-results-tabs .metric-card:hover {
+    transform: translateY(-4px);
+    box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+    border-color: var(--card-color, ${accent_color})50;
+}
+
+.detection-results-tabs .metric-value {
+    font-size: 2.2rem;
+    font-weight: 800;
+    color: var(--card-color, ${accent_color});
+    margin-bottom: 0.5rem;
+    line-height: 1;
+}
+
+.detection-results-tabs .metric-label {
+    font-size: 0.9rem;
+    color: ${text_secondary};
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    line-height: 1.2;
+}
+
+/* Responsive design for broader tabs */
+@media (max-width: 1200px) {
+    .detection-results-tabs .stTabs [data-baseweb="tab"] {
+        min-width: 160px;
+        padding: 0 1.5rem;
+        font-size: 0.9rem;
     }
+}
 
-    .status-value {
-        font-size: 2rem;
-        font-weight: 800;
-        color: #2c3e50;
-        margin: 0 0 0.3rem 0;
-        line-height: 1.2;
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+@media (max-width: 768px) {
+    .detection-results-tabs .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+        padding: 12px;
+        flex-wrap: wrap;
     }
 
-    .status-label {
-        color: #5a6c7d;
-        font-size: 0.9rem;
-        font-weight: 600;
-        margin: 0;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        line-height: 1.3;
+    .detection-results-tabs .stTabs [data-baseweb="tab"] {
+        min-width: 140px;
+        height: 50px;
+        padding: 0 1rem;
+        font-size: 0.85rem;
     }
 
-    /* Enhanced metric cards for better visibility */
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
+    .detection-results-tabs .stTabs [data-baseweb="tab-panel"] {
         padding: 1.5rem;
-        border-radius: 12px;
-        text-align: center;
-        margin: 0.5rem 0;
-        box-shadow: 0 6px 25px rgba(102, 126, 234, 0.3);
-        transition: all 0.3s ease;
-        min-height: 100px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
     }
+}
 
-    .metric-card:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 8px 35px rgba(102, 126, 234, 0.4);
+@media (max-width: 480px) {
+    .detection-results-tabs .stTabs [data-baseweb="tab"] {
+        min-width: 120px;
+        height: 45px;
+        padding: 0 0.8rem;
+        font-size: 0.8rem;
     }
+}
+</style>
+"""))
 
-    .metric-value {
-        font-size: 2.2rem;
-        font-weight: 800;
-        margin: 0 0 0.3rem 0;
-        line-height: 1.1;
-        text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
+# Export tab cards, download section and animations; minified once at import
+EXPORT_TAB_CSS = minify_css("""
+<style>
+@keyframes slideInLeft {
+    from {
+        opacity: 0;
+        transform: translateX(-30px);
+    }
+    to {
+        opacity: 1;
+        transform: translateX(0);
     }
+}
 
-    .metric-label {
-        font-size: 0.9rem;
-        font-weight: 600;
-        margin: 0;
-        opacity: 0.95;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        line-height: 1.3;
+@keyframes pulse {
+    0% {
+        box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
     }
-    
-    /* Progress styling */
-    .stProgress > div > div > div {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        border-radius: 10px;
+    50% {
+        box-shadow: 0 12px 40px rgba(102, 126, 234, 0.5);
     }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+    100% {
+        box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
     }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
+}
+
+.export-header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 2rem;
+    border-radius: 20px;
+    text-align: center;
+    margin-bottom: 2rem;
+    box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
+    animation: fadeInUp 0.8s ease-out, pulse 3s ease-in-out infinite;
+    position: relative;
+    overflow: hidden;
+}
+
+.export-header::before {
+    content: '';
+    position: absolute;
+    top: -50%;
+    left: -50%;
+    width: 200%;
+    height: 200%;
+    background: linear-gradient(45deg, transparent, rgba(255,255,255,0.1), transparent);
+    transform: rotate(45deg);
+    animation: shimmer 3s ease-in-out infinite;
+}
+
+@keyframes shimmer {
+    0% {
+        transform: translateX(-100%) translateY(-100%) rotate(45deg);
     }
-    
-    /* Enhanced Stop button styling */
-    .stop-button {
-        background: linear-gradient(135deg, #ff4757 0%, #ff3838 100%) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 12px !important;
-        font-weight: 700 !important;
-        font-size: 1.1rem !important;
-        padding: 0.8rem 2rem !important;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        box-shadow: 0 6px 20px rgba(255, 71, 87, 0.4) !important;
-        text-transform: uppercase !important;
-        letter-spacing: 0.5px !important;
-        position: relative !important;
-        overflow: hidden !important;
-        min-height: 50px !important;
-        display: flex !important;
-        align-items: center !important;
-        justify-content: center !important;
-        gap: 0.5rem !important;
+    50% {
+        transform: translateX(100%) translateY(100%) rotate(45deg);
     }
-
-    .stop-button:hover {
-        background: linear-gradient(135deg, #ff3838 0%, #ff2f2f 100%) !important;
-        transform: translateY(-3px) scale(1.05) !important;
-        box-shadow: 0 10px 30px rgba(255, 71, 87, 0.6) !important;
+    100% {
+        transform: translateX(-100%) translateY(-100%) rotate(45deg);
     }
-
-    .stop-button:active {
-        transform: translateY(-1px) scale(1.02) !important;
-        box-shadow: 0 4px 15px rgba(255, 71, 87, 0.5) !important;
+}
+
+.export-metric-card {
+    background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+    border: 2px solid #e9ecef;
+    border-radius: 20px;
+    padding: 1.8rem;
+    text-align: center;
+    box-shadow: 0 6px 20px rgba(0,0,0,0.08);
+    transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
+    min-height: 140px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    position: relative;
+    overflow: hidden;
+    animation: slideInLeft 0.6s ease-out;
+    backdrop-filter: blur(10px);
+}
+
+.export-metric-card:hover {
+    transform: translateY(-8px) scale(1.02);
+    box-shadow: 0 15px 35px rgba(0,0,0,0.15);
+    border-color: var(--card-accent, #667eea);
+    background: linear-gradient(135deg, #ffffff 0%, #f0f8ff 100%);
+}
+
+.export-metric-card::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 5px;
+    background: linear-gradient(90deg, var(--card-accent, #667eea), var(--card-accent-light, #8fa4f3));
+    border-radius: 20px 20px 0 0;
+    transition: height 0.3s ease;
+}
+
+.export-metric-card:hover::before {
+    height: 8px;
+}
+
+.export-metric-card::after {
+    content: '';
+    position: absolute;
+    top: 50%;
+    left: 50%;
+    width: 0;
+    height: 0;
+    background: radial-gradient(circle, rgba(102, 126, 234, 0.1) 0%, transparent 70%);
+    border-radius: 50%;
+    transform: translate(-50%, -50%);
+    transition: all 0.4s ease;
+    z-index: 0;
+}
+
+.export-metric-card:hover::after {
+    width: 200px;
+    height: 200px;
+}
+
+.export-metric-value {
+    font-size: clamp(2rem, 4vw, 3rem);
+    font-weight: 900;
+    margin: 0 0 0.5rem 0;
+    color: #2c3e50;
+    line-height: 1;
+    position: relative;
+    z-index: 1;
+    transition: all 0.3s ease;
+    background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    background-clip: text;
+    text-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    word-break: keep-all;
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+}
+
+.export-metric-card:hover .export-metric-value {
+    transform: scale(1.05);
+    background: linear-gradient(135deg, var(--card-accent, #667eea) 0%, var(--card-accent-light, #8fa4f3) 100%);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    background-clip: text;
+}
+
+.export-metric-label {
+    font-size: 0.85rem;
+    color: #6c757d;
+    font-weight: 700;
+    text-transform: uppercase;
+    letter-spacing: 1px;
+    position: relative;
+    z-index: 1;
+    transition: all 0.3s ease;
+    line-height: 1.2;
+    word-wrap: break-word;
+    overflow-wrap: break-word;
+    hyphens: auto;
+}
+
+.export-metric-card:hover .export-metric-label {
+    color: var(--card-accent, #667eea);
+    transform: translateY(-2px);
+}
+
+.download-section {
+    background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
+    border: 2px solid #dee2e6;
+    border-radius: 20px;
+    padding: 2.5rem;
+    margin: 2rem 0;
+    box-shadow: 0 8px 25px rgba(0,0,0,0.08);
+    animation: fadeInUp 0.8s ease-out 0.2s both;
+    position: relative;
+    overflow: hidden;
+}
+
+.download-section::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 4px;
+    background: linear-gradient(90deg, #667eea, #764ba2, #667eea);
+    background-size: 200% 100%;
+    animation: gradientShift 3s ease-in-out infinite;
+}
+
+.download-card {
+    background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+    border: 2px solid #e9ecef;
+    border-radius: 18px;
+    padding: 2rem;
+    text-align: center;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.06);
+    transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
+    height: 100%;
+    position: relative;
+    overflow: hidden;
+    backdrop-filter: blur(5px);
+}
+
+.download-card:hover {
+    transform: translateY(-8px) scale(1.02);
+    box-shadow: 0 12px 30px rgba(0,0,0,0.15);
+    border-color: #667eea;
+    background: linear-gradient(135deg, #ffffff 0%, #f0f8ff 100%);
+}
+
+.download-card::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: -100%;
+    width: 100%;
+    height: 100%;
+    background: linear-gradient(90deg, transparent, rgba(102, 126, 234, 0.1), transparent);
+    transition: left 0.5s ease;
+}
+
+.download-card:hover::before {
+    left: 100%;
+}
+
+.download-icon {
+    font-size: 3rem;
+    margin-bottom: 1.2rem;
+    display: block;
+    transition: all 0.3s ease;
+    filter: drop-shadow(0 2px 4px rgba(0,0,0,0.1));
+}
+
+.download-card:hover .download-icon {
+    transform: scale(1.1) rotate(5deg);
+    filter: drop-shadow(0 4px 8px rgba(102, 126, 234, 0.3));
+}
+
+.download-title {
+    font-size: 1.2rem;
+    font-weight: 800;
+    color: #2c3e50;
+    margin-bottom: 0.8rem;
+    transition: all 0.3s ease;
+    position: relative;
+    z-index: 1;
+}
+
+.download-card:hover .download-title {
+    color: #667eea;
+    transform: translateY(-2px);
+}
+
+.download-description {
+    font-size: 0.9rem;
+    color: #6c757d;
+    margin-bottom: 1.5rem;
+    line-height: 1.5;
+    transition: all 0.3s ease;
+    position: relative;
+    z-index: 1;
+    word-wrap: break-word;
+    overflow-wrap: break-word;
+    hyphens: auto;
+}
+
+.download-card:hover .download-description {
+    color: #5a6c7d;
+}
+
+.status-indicator {
+    display: inline-flex;
+    align-items: center;
+    gap: 0.8rem;
+    padding: 0.8rem 1.5rem;
+    border-radius: 30px;
+    font-weight: 700;
+    font-size: 1rem;
+    transition: all 0.3s ease;
+    animation: fadeInUp 0.6s ease-out 0.4s both;
+    box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+    backdrop-filter: blur(10px);
+}
+
+.status-indicator:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 6px 18px rgba(0,0,0,0.15);
+}
+
+.status-ready {
+    background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
+    color: #155724;
+    border: 2px solid #28a745;
+    animation: pulse 2s ease-in-out infinite;
+}
+
+.status-processing {
+    background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
+    color: #856404;
+    border: 2px solid #ffc107;
+    animation: pulse 2s ease-in-out infinite;
+}
+
+.chart-container {
+    background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+    border-radius: 20px;
+    padding: 1.5rem;
+    box-shadow: 0 6px 20px rgba(0,0,0,0.08);
+    border: 2px solid #e9ecef;
+    transition: all 0.3s ease;
+    animation: fadeInUp 0.8s ease-out 0.6s both;
+    backdrop-filter: blur(5px);
+}
+
+.chart-container:hover {
+    transform: translateY(-3px);
+    box-shadow: 0 10px 30px rgba(0,0,0,0.12);
+    border-color: #667eea;
+}
+
+/* Responsive design improvements */
+@media (max-width: 768px) {
+    .export-metric-card {
+        min-height: 120px;
+        padding: 1.2rem;
     }
 
-    .stop-button::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.2), transparent);
-        transition: left 0.5s ease;
+    .export-metric-value {
+        font-size: 1.8rem;
     }
 
-    .stop-button:hover::before {
-        left: 100%;
-    }
-    
-    /* File uploader */
-    .stFileUploader > div {
-        border: 2px dashed #667eea;
-        border-radius: 12px;
-        padding: 2rem;
-        background: linear-gradient(135deg, #f8f9ff 0%, #e3e7ff 100%);
-        text-align: center;
-    }
-    
-    /* Tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 10px;
-        background: #f8f9fa;
-        padding: 0.5rem;
-        border-radius: 10px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: white;
-        border-radius: 8px;
-        padding: 0.7rem 1.5rem;
-        border: none;
-        font-weight: 600;
-        transition: all 0.3s ease;
+    .export-metric-label {
+        font-size: 0.75rem;
     }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+
+    .download-card {
+        padding: 1.5rem;
     }
-    
-    /* Sidebar */
-    .css-1d391kg {
-        background: linear-gradient(180deg, #f8f9fa 0%, #e9ecef 100%);
+
+    .download-icon {
+        font-size: 2.5rem;
     }
 
-    /* Enhanced text readability */
-    .stMarkdown {
-        line-height: 1.6;
+    .download-title {
+        font-size: 1rem;
     }
 
-    .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, .stMarkdown h4 {
-        color: #2c3e50;
-        font-weight: 700;
-        line-height: 1.3;
-        margin-bottom: 1rem;
+    .download-description {
+        font-size: 0.8rem;
     }
+}
+</style>
+""")
+
+# Download card headers for the three export formats, laid out above the button columns
+EXPORT_DOWNLOAD_CARDS_HTML = """
+<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-bottom: 1rem;">
+    <div class="download-card">
+        <div class="download-icon">📄</div>
+        <div class="download-title">JSON Report</div>
+        <div class="download-description">Complete detection data in JSON format for developers and analysts</div>
+    </div>
+    <div class="download-card">
+        <div class="download-icon">📊</div>
+        <div class="download-title">CSV Data</div>
+        <div class="download-description">Timeline data for spreadsheet analysis and further processing</div>
+    </div>
+    <div class="download-card">
+        <div class="download-icon">📋</div>
+        <div class="download-title">Summary Report</div>
+        <div class="download-description">Human-readable executive summary with key insights and recommendations</div>
+    </div>
+</div>
+"""
 
-    .stMarkdown p {
-        color: #34495e;
-        line-height: 1.6;
-        margin-bottom: 0.8rem;
-    }
+# Shared layout for the export tab's live charts
+LIVE_CHART_LAYOUT = dict(
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='#2c3e50'),
+    margin=dict(l=40, r=40, t=60, b=40)
+)
 
-    /* Improved dataframe styling */
-    .stDataFrame {
+# Export tab placeholder shown until the detector has enough frames to chart
+EXPORT_CHARTS_PLACEHOLDER_HTML = """
+<div style="
+    background: linear-gradient(135deg, #e3f2fd 0%, #f3e5f5 100%);
+    border-radius: 15px;
+    padding: 2rem;
+    margin: 2rem 0;
+    border-left: 5px solid #2196f3;
+    box-shadow: 0 4px 15px rgba(33, 150, 243, 0.1);
+    text-align: center;
+">
+    <h4 style="margin: 0 0 1rem 0; color: #1976d2; display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
+        📊 Analytics Dashboard
+        <span style="font-size: 0.7rem; background: #ff9800; color: white; padding: 0.2rem 0.5rem; border-radius: 10px; font-weight: 600;">
+            BUILDING
+        </span>
+    </h4>
+    <p style="margin: 0 0 1.5rem 0; color: #424242; font-size: 1.1rem;">
+        Charts will appear after more detection data is collected
+    </p>
+    <div style="
+        background: rgba(255,255,255,0.7);
+        border-radius: 10px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        text-align: left;
+    ">
+        <h5 style="margin: 0 0 1rem 0; color: #2c3e50;">📈 Available Charts:</h5>
+        <ul style="margin: 0; color: #424242; line-height: 1.8;">
+            <li>🔄 Compliance rate timeline</li>
+            <li>👥 People detection trends</li>
+            <li>📊 Combined analytics overview</li>
+            <li>📈 Real-time performance metrics</li>
+        </ul>
+    </div>
+    <div style="
+        background: rgba(255, 193, 7, 0.1);
+        border: 1px solid #ffc107;
         border-radius: 8px;
-        overflow: hidden;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        padding: 1rem;
+        margin-top: 1rem;
+    ">
+        <strong style="color: #856404;">⏱️ Minimum data needed:</strong>
+        <span style="color: #424242;"> 2+ processed frames with analytics</span>
+    </div>
+</div>
+"""
+
+EXPORT_READY_HTML = """
+<div style="
+    background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
+    border: 2px solid #28a745;
+    border-radius: 15px;
+    padding: 1.5rem 2rem;
+    margin: 2rem 0;
+    text-align: center;
+    box-shadow: 0 6px 20px rgba(40, 167, 69, 0.2);
+    position: relative;
+    overflow: hidden;
+">
+    <div style="
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        height: 3px;
+        background: linear-gradient(90deg, #28a745, #20c997, #28a745);
+        background-size: 200% 100%;
+        animation: gradientShift 2s ease-in-out infinite;
+    "></div>
+    <h4 style="margin: 0 0 0.5rem 0; color: #155724; font-size: 1.3rem; display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
+        ✅ Export Interface Ready!
+        <span style="font-size: 0.7rem; background: #28a745; color: white; padding: 0.2rem 0.5rem; border-radius: 10px; font-weight: 600;">
+            ACTIVE
+        </span>
+    </h4>
+    <p style="margin: 0; color: #155724; font-size: 1rem; opacity: 0.9;">
+        All download options and analytics are available above. Your session data is ready for export!
+    </p>
+</div>
+"""
+
+# Plain-text export summary; filled with str.format_map
+EXPORT_SUMMARY_TMPL = """PPE Detection Session Summary
+Generated: {generated}
+
+SESSION OVERVIEW
+================
+• Total Frames Processed: {frame_count:,}
+• Session Duration: {duration_text}
+• People Detected: {total_people:,}
+• Violations Found: {total_violations:,}
+• Compliance Rate: {compliance_rate:.1f}%
+
+PERFORMANCE METRICS
+==================
+• Average FPS: {average_fps:.1f}
+• Detection Accuracy: High
+• System Status: Operational
+
+RECOMMENDATIONS
+===============
+• Continue monitoring for optimal safety compliance
+• Review violation patterns for improvement opportunities
+• Regular equipment checks recommended
+
+Generated by PPE Monitor Pro v2.1
+"""
+
+# Attendance counter card; filled per theme with color, value and label
+ATTENDANCE_STAT_CARD_TMPL = Template("""
+<div style="
+    background: ${card_bg};
+    border-radius: 15px;
+    padding: 1.5rem;
+    text-align: center;
+    border: 1px solid ${border_color};
+    box-shadow: 0 4px 20px ${shadow};
+">
+    <div style="font-size: 2rem; color: ${color}; margin-bottom: 0.5rem;">
+        ${value}
+    </div>
+    <div style="color: ${text_secondary}; font-size: 0.9rem;">
+        ${label}
+    </div>
+</div>
+""")
+
+# Try to import webcam component
+try:
+    from webcam_component import create_webcam_interface, create_webcam_analytics, create_comprehensive_export_data
+    WEBCAM_AVAILABLE = True
+except ImportError:
+    WEBCAM_AVAILABLE = False
+
+# Page configuration
+st.set_page_config(
+    page_title="PPE Monitor Pro",
+    page_icon="🦺",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Ultra-modern CSS with enhanced animations and micro-interactions
+st.markdown("""
+<style>
+    /* Hide Streamlit elements */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    .stDeployButton {visibility: hidden;}
+
+    /* Main container with enhanced styling */
+    .main .block-container {
+        padding-top: 0.5rem;
+        padding-bottom: 1rem;
+        max-width: 1400px;
     }
 
-    /* Better metric display */
-    .stMetric {
-        background: white;
-        padding: 1rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-        border-left: 3px solid #667eea;
+    /* Global animations and transitions */
+    * {
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
     }
 
-    .stMetric [data-testid="metric-container"] {
-        background: transparent;
+    /* Enhanced button hover effects */
+    .stButton > button {
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        border-radius: 12px !important;
+        font-weight: 600 !important;
+        position: relative;
+        overflow: hidden;
     }
 
-    /* Enhanced info/success/error boxes */
-    .stAlert {
-        border-radius: 8px;
-        border: none;
-        font-weight: 500;
-        line-height: 1.5;
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 8px 25px rgba(0,0,0,0.15);
     }
 
-    .stSuccess {
-        background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-        color: #155724;
-        border-left: 4px solid #28a745;
+    .stButton > button::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: -100%;
+        width: 100%;
+        height: 100%;
+        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
+        transition: left 0.5s;
     }
 
-    .stInfo {
-        background: linear-gradient(135deg, #d1ecf1 0%, #bee5eb 100%);
-        color: #0c5460;
-        border-left: 4px solid #17a2b8;
+    .stButton > button:hover::before {
+        left: 100%;
     }
 
-    .stError {
-        background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
-        color: #721c24;
-        border-left: 4px solid #dc3545;
+    /* Enhanced metric cards */
+    .metric-card {
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        border-radius: 16px !important;
+        backdrop-filter: blur(10px);
     }
 
-    .stWarning {
-        background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
-        color: #856404;
-        border-left: 4px solid #ffc107;
+    .metric-card:hover {
+        transform: translateY(-4px);
+        box-shadow: 0 12px 40px rgba(0,0,0,0.15);
     }
 
-    /* Responsive design improvements */
-    @media (max-width: 768px) {
-        .metric-card, .status-card {
-            margin: 0.3rem 0;
-            padding: 1rem;
-        }
+    /* Smooth scrolling */
+    html {
+        scroll-behavior: smooth;
+    }
 
-        .metric-value, .status-value {
-            font-size: 1.8rem;
-        }
+    /* Enhanced loading animations */
+    @keyframes pulse {
+        0%, 100% { opacity: 1; }
+        50% { opacity: 0.5; }
+    }
 
-        .metric-label, .status-label {
-            font-size: 0.8rem;
+    @keyframes slideInUp {
+        from {
+            opacity: 0;
+            transform: translateY(30px);
         }
-
-        .ultra-header h1 {
-            font-size: 1.8rem;
+        to {
+            opacity: 1;
+            transform: translateY(0);
         }
+    }
 
-        .ultra-header p {
-            font-size: 0.9rem;
+    @keyframes fadeInScale {
+        from {
+            opacity: 0;
+            transform: scale(0.95);
+        }
+        to {
+            opacity: 1;
+            transform: scale(1);
         }
     }
 
-    /* Improved scrollbar styling */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
+    /* Shared by the history and export tabs */
+    @keyframes fadeInUp {
+        from {
+            opacity: 0;
+            transform: translateY(30px);
+        }
+        to {
+            opacity: 1;
+            transform: translateY(0);
+        }
     }
 
-    ::-webkit-scrollbar-track {
-        background: #f1f1f1;
-        border-radius: 4px;
+    @keyframes gradientShift {
+        0%, 100% { background-position: 0% 50%; }
+        50% { background-position: 100% 50%; }
     }
 
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 4px;
+    /* Apply animations to cards */
+    .modern-action-card,
+    .modern-upload-section,
+    .result-panel {
+        animation: slideInUp 0.6s ease-out;
     }
 
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #5a6fd8 0%, #6a4190 100%);
+    /* Enhanced focus states for accessibility */
+    .stButton > button:focus,
+    .stSelectbox > div > div:focus,
+    .stFileUploader > div:focus {
+        outline: 2px solid var(--accent-color);
+        outline-offset: 2px;
     }
     
-    /* Alert styling */
-    .stAlert {
-        border-radius: 10px;
-        border: none;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    /* Ultra-modern header with theme support */
+    .ultra-header {
+        background: linear-gradient(135deg, var(--accent-color) 0%, var(--secondary-bg) 100%);
+        color: var(--text-primary);
+        padding: 1.5rem;
+        border-radius: 15px;
+        text-align: center;
+        margin-bottom: 1.5rem;
+        box-shadow: 0 8px 32px var(--shadow);
+        backdrop-filter: blur(10px);
+        border: 1px solid var(--border-color);
+        position: relative;
     }
-</style>
-""", unsafe_allow_html=True)
-
-# Initialize session state
-if 'detection_engine' not in st.session_state:
-    st.session_state.detection_engine = None
-    st.session_state.model_loaded = False
-    st.session_state.processing = False
-    st.session_state.stop_processing = None
-    st.session_state.video_results = None
-    st.session_state.processed_video_path = None
 
-# Initialize attendance manager
-if 'attendance_manager' not in st.session_state and ATTENDANCE_AVAILABLE:
-    try:
-        st.session_state.attendance_manager = AttendanceManager()
-    except Exception as e:
-        st.error(f"❌ Failed to initialize attendance system: {e}")
-        st.session_state.attendance_manager = None
-    st.session_state.processed_video_data = None
-    st.session_state.show_results = False
-    st.session_state.show_results_in_tabs = False
+    /* Help icon in corner */
+    .help-icon {
+        position: fixed;
+        top: 20px;
+        right: 20px;
+        z-index: 9999;
+        background: var(--accent-color);
+        color: white;
+        width: 50px;
+        height: 50px;
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        cursor: pointer;
+        box-shadow: 0 4px 20px var(--shadow);
+        transition: all 0.3s ease;
+        font-size: 1.2rem;
+        font-weight: bold;
+        border: 2px solid var(--border-color);
+    }
+
+    .help-icon:hover {
+        transform: scale(1.1);
+        box-shadow: 0 6px 25px var(--shadow);
+        background: var(--secondary-bg);
+    }
+
+
+    
+    .ultra-header h1 {
+        font-size: 2.2rem;
+        font-weight: 800;
+        margin: 0;
+        text-shadow: 2px 2px 4px var(--shadow);
+        color: var(--text-primary);
+    }
+
+    .ultra-header p {
+        font-size: 1rem;
+        margin: 0.3rem 0 0 0;
+        opacity: 0.95;
+        color: var(--text-secondary);
+    }
+
+    /* Enhanced file uploader styling for main content */
+    .stFileUploader {
+        background: var(--card-bg) !important;
+        border: 2px dashed var(--accent-color) !important;
+        border-radius: 12px !important;
+        padding: 1rem !important;
+    }
+
+    .stFileUploader label {
+        color: var(--text-primary) !important;
+        font-weight: 600 !important;
+    }
+
+    .stFileUploader [data-testid="stFileUploaderDropzone"] {
+        background: var(--secondary-bg) !important;
+        border: 2px dashed var(--accent-color) !important;
+        border-radius: 8px !important;
+        color: var(--text-primary) !important;
+        padding: 2rem !important;
+        text-align: center !important;
+    }
+
+    .stFileUploader [data-testid="stFileUploaderDropzoneInstructions"] {
+        color: var(--text-primary) !important;
+        font-size: 1.1rem !important;
+        font-weight: 600 !important;
+    }
+
+    .stFileUploader [data-testid="stFileUploaderDropzoneInstructions"] div {
+        color: var(--text-secondary) !important;
+        font-size: 0.9rem !important;
+        margin-top: 0.5rem !important;
+    }
+    
+    /* Speed metrics */
+    .speed-card {
+        background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
+        color: white;
+        padding: 1rem;
+        border-radius: 10px;
+        text-align: center;
+        margin: 0.5rem 0;
+        box-shadow: 0 4px 15px rgba(255, 107, 107, 0.3);
+    }
+    
+    .speed-value {
+        font-size: 1.8rem;
+        font-weight: bold;
+        margin: 0;
+    }
+    
+    .speed-label {
+        font-size: 0.8rem;
+        opacity: 0.9;
+        margin: 0;
+    }
+    
+    /* Status cards */
+    .status-card {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 12px;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
+        border-left: 4px solid #667eea;
+        margin: 0.5rem 0;
+        transition: all 0.3s ease;
+        text-align: center;
+        min-height: 100px;
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+    }
+
+    .status-card:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 8px 30px rgba(0,0,0,0.12);
+    }
+
+    .status-value {
+        font-size: 2rem;
+        font-weight: 800;
+        color: #2c3e50;
+        margin: 0 0 0.3rem 0;
+        line-height: 1.2;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
+
+    .status-label {
+        color: #5a6c7d;
+        font-size: 0.9rem;
+        font-weight: 600;
+        margin: 0;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        line-height: 1.3;
+    }
+
+    /* Enhanced metric cards for better visibility */
+    .metric-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 12px;
+        text-align: center;
+        margin: 0.5rem 0;
+        box-shadow: 0 6px 25px rgba(102, 126, 234, 0.3);
+        transition: all 0.3s ease;
+        min-height: 100px;
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+    }
+
+    .metric-card:hover {
+        transform: translateY(-3px);
+        box-shadow: 0 8px 35px rgba(102, 126, 234, 0.4);
+    }
+
+    .metric-value {
+        font-size: 2.2rem;
+        font-weight: 800;
+        margin: 0 0 0.3rem 0;
+        line-height: 1.1;
+        text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
+    }
+
+    .metric-label {
+        font-size: 0.9rem;
+        font-weight: 600;
+        margin: 0;
+        opacity: 0.95;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        line-height: 1.3;
+    }
+    
+    /* Progress styling */
+    .stProgress > div > div > div {
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        border-radius: 10px;
+    }
+    
+    /* Button styling */
+    .stButton > button {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        font-weight: 600;
+        transition: all 0.3s ease;
+        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
+    }
+    
+    /* Enhanced Stop button styling */
+    .stop-button {
+        background: linear-gradient(135deg, #ff4757 0%, #ff3838 100%) !important;
+        color: white !important;
+        border: none !important;
+        border-radius: 12px !important;
+        font-weight: 700 !important;
+        font-size: 1.1rem !important;
+        padding: 0.8rem 2rem !important;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
+        box-shadow: 0 6px 20px rgba(255, 71, 87, 0.4) !important;
+        text-transform: uppercase !important;
+        letter-spacing: 0.5px !important;
+        position: relative !important;
+        overflow: hidden !important;
+        min-height: 50px !important;
+        display: flex !important;
+        align-items: center !important;
+        justify-content: center !important;
+        gap: 0.5rem !important;
+    }
+
+    .stop-button:hover {
+        background: linear-gradient(135deg, #ff3838 0%, #ff2f2f 100%) !important;
+        transform: translateY(-3px) scale(1.05) !important;
+        box-shadow: 0 10px 30px rgba(255, 71, 87, 0.6) !important;
+    }
+
+    .stop-button:active {
+        transform: translateY(-1px) scale(1.02) !important;
+        box-shadow: 0 4px 15px rgba(255, 71, 87, 0.5) !important;
+    }
+
+    .stop-button::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: -100%;
+        width: 100%;
+        height: 100%;
+        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.2), transparent);
+        transition: left 0.5s ease;
+    }
+
+    .stop-button:hover::before {
+        left: 100%;
+    }
+    
+    /* File uploader */
+    .stFileUploader > div {
+        border: 2px dashed #667eea;
+        border-radius: 12px;
+        padding: 2rem;
+        background: linear-gradient(135deg, #f8f9ff 0%, #e3e7ff 100%);
+        text-align: center;
+    }
+    
+    /* Tabs */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 10px;
+        background: #f8f9fa;
+        padding: 0.5rem;
+        border-radius: 10px;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        background: white;
+        border-radius: 8px;
+        padding: 0.7rem 1.5rem;
+        border: none;
+        font-weight: 600;
+        transition: all 0.3s ease;
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+    }
+    
+    /* Sidebar */
+    .css-1d391kg {
+        background: linear-gradient(180deg, #f8f9fa 0%, #e9ecef 100%);
+    }
+
+    /* Enhanced text readability */
+    .stMarkdown {
+        line-height: 1.6;
+    }
+
+    .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, .stMarkdown h4 {
+        color: #2c3e50;
+        font-weight: 700;
+        line-height: 1.3;
+        margin-bottom: 1rem;
+    }
+
+    .stMarkdown p {
+        color: #34495e;
+        line-height: 1.6;
+        margin-bottom: 0.8rem;
+    }
+
+    /* Improved dataframe styling */
+    .stDataFrame {
+        border-radius: 8px;
+        overflow: hidden;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    }
+
+    /* Better metric display */
+    .stMetric {
+        background: white;
+        padding: 1rem;
+        border-radius: 8px;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+        border-left: 3px solid #667eea;
+    }
+
+    .stMetric [data-testid="metric-container"] {
+        background: transparent;
+    }
+
+    /* Enhanced info/success/error boxes */
+    .stAlert {
+        border-radius: 8px;
+        border: none;
+        font-weight: 500;
+        line-height: 1.5;
+    }
+
+    .stSuccess {
+        background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
+        color: #155724;
+        border-left: 4px solid #28a745;
+    }
+
+    .stInfo {
+        background: linear-gradient(135deg, #d1ecf1 0%, #bee5eb 100%);
+        color: #0c5460;
+        border-left: 4px solid #17a2b8;
+    }
+
+    .stError {
+        background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
+        color: #721c24;
+        border-left: 4px solid #dc3545;
+    }
+
+    .stWarning {
+        background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
+        color: #856404;
+        border-left: 4px solid #ffc107;
+    }
+
+    /* Responsive design improvements */
+    @media (max-width: 768px) {
+        .metric-card, .status-card {
+            margin: 0.3rem 0;
+            padding: 1rem;
+        }
+
+        .metric-value, .status-value {
+            font-size: 1.8rem;
+        }
+
+        .metric-label, .status-label {
+            font-size: 0.8rem;
+        }
+
+        .ultra-header h1 {
+            font-size: 1.8rem;
+        }
+
+        .ultra-header p {
+            font-size: 0.9rem;
+        }
+    }
+
+    /* Improved scrollbar styling */
+    ::-webkit-scrollbar {
+        width: 8px;
+        height: 8px;
+    }
+
+    ::-webkit-scrollbar-track {
+        background: #f1f1f1;
+        border-radius: 4px;
+    }
+
+    ::-webkit-scrollbar-thumb {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 4px;
+    }
+
+    ::-webkit-scrollbar-thumb:hover {
+        background: linear-gradient(135deg, #5a6fd8 0%, #6a4190 100%);
+    }
+    
+    /* Alert styling */
+    .stAlert {
+        border-radius: 10px;
+        border: none;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# Initialize session state
+if 'detection_engine' not in st.session_state:
+    st.session_state.detection_engine = None
+    st.session_state.model_loaded = False
+    st.session_state.processing = False
+    st.session_state.stop_processing = None
+    st.session_state.video_results = None
+    st.session_state.processed_video_path = None
+    st.session_state.processed_video_ready = False
+    st.session_state.history_version = 0
+
+# Initialize attendance manager
+if 'attendance_manager' not in st.session_state and ATTENDANCE_AVAILABLE:
+    try:
+        st.session_state.attendance_manager = AttendanceManager()
+    except Exception as e:
+        st.error(f"❌ Failed to initialize attendance system: {e}")
+        st.session_state.attendance_manager = None
+    st.session_state.processed_video_data = None
+    st.session_state.show_results = False
+    st.session_state.show_results_in_tabs = False
     st.session_state.current_video_path = None
     st.session_state.results_history = []
 
@@ -614,6 +2635,482 @@ def load_detection_engine():
         st.error(f"⚠️ Model loading failed: {e}")
         return None, False
 
+@st.cache_resource
+def get_preview_executor():
+    """Shared worker pool for preview I/O kept off the script thread"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="preview")
+
+def read_first_frame(video_path, max_width=640):
+    """Decode the first frame of a video as an RGB thumbnail at most max_width wide, or None"""
+    cap = cv2.VideoCapture(video_path)
+    try:
+        ok, frame = cap.read()
+    finally:
+        cap.release()
+    if not ok:
+        return None
+    height, width = frame.shape[:2]
+    if width > max_width:
+        frame = cv2.resize(frame, (max_width, round(height * max_width / width)), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def get_preview_thumbnail(video_path):
+    """Start thumbnail extraction in the background; returns a future"""
+    return get_preview_executor().submit(read_first_frame, video_path)
+
+def render_preview_thumbnail(thumbnail, polling):
+    """Show a preview thumbnail future; while decoding, the fragment polls until it finishes"""
+    if not thumbnail.done():
+        st.info("🖼️ Preparing preview thumbnail...")
+        return
+    if polling:
+        # Rerun the page once so the fragment re-registers without a poll interval
+        st.rerun()
+    frame = thumbnail.result() if thumbnail.exception() is None else None
+    if frame is None:
+        st.info("🖼️ No preview available")
+    else:
+        st.image(frame, use_container_width=True)
+
+def prune_history_state():
+    """Drop per-entry session keys for sessions no longer in results_history"""
+    live = {id(entry) for entry in st.session_state.results_history}
+    for key in [k for k in st.session_state if k.startswith('history_entry_')]:
+        if id(st.session_state[key]) not in live:
+            del st.session_state[key]
+            st.session_state.pop('show_history_results_' + key.rsplit('_', 1)[1], None)
+
+def get_active_theme():
+    """Return the active theme key and its config dict"""
+    theme_key = theme_manager.get_current_theme()
+    return theme_key, THEMES.get(theme_key, THEMES['light'])
+
+@functools.lru_cache(maxsize=16)
+def render_success_banner(text, theme_name):
+    """Render a themed success banner, cached per message and theme"""
+    return SUCCESS_BANNER_TMPL.substitute(THEMES.get(theme_name, THEMES['light']), text=text)
+
+@functools.lru_cache(maxsize=4)
+def render_action_cards(theme_name):
+    """Render the video action card grid once per theme"""
+    return ACTION_CARDS_TMPL.substitute(THEMES.get(theme_name, THEMES['light']))
+
+@functools.lru_cache(maxsize=4)
+def render_image_tab_header(theme_name):
+    """Render the Instant Analysis header once per theme"""
+    return IMAGE_TAB_HEADER_TMPL.substitute(THEMES.get(theme_name, THEMES['light']))
+
+@functools.lru_cache(maxsize=4)
+def render_video_upload_css(theme_name):
+    """Render the Video Processing drag-and-drop styles once per theme"""
+    return VIDEO_UPLOAD_CSS_TMPL.substitute(THEMES.get(theme_name, THEMES['light']))
+
+@functools.lru_cache(maxsize=4)
+def render_image_tab_css(theme_name):
+    """Render the Instant Analysis uploader/button/image styles once per theme"""
+    return IMAGE_TAB_CSS_TMPL.substitute(THEMES.get(theme_name, THEMES['light']))
+
+@functools.lru_cache(maxsize=4)
+def get_theme_tints(theme_name):
+    """Precompute hex-alpha tints of the theme colors, e.g. tints['accent15']"""
+    theme_config = THEMES.get(theme_name, THEMES['light'])
+    return {
+        f"{color}{alpha}": theme_config[f"{color}_color"] + alpha
+        for color in ('accent', 'info', 'success', 'warning', 'danger')
+        for alpha in ('05', '08', '10', '15', '20', '30', '40', '60', '80')
+    }
+
+@functools.lru_cache(maxsize=4)
+def render_image_upload_splash(theme_name):
+    """Render the idle 'Ready for Analysis' panel once per theme"""
+    return IMAGE_UPLOAD_SPLASH_TMPL.substitute(THEMES.get(theme_name, THEMES['light']), **get_theme_tints(theme_name))
+
+def inject_image_tab_chrome(theme_name):
+    """Emit the Instant Analysis stylesheet and header in a single markdown call
+
+    Streamlit drops elements a rerun doesn't re-emit, so the CSS is sent on
+    every run; both strings come from per-theme caches.
+    """
+    st.markdown(render_image_tab_css(theme_name) + render_image_tab_header(theme_name), unsafe_allow_html=True)
+
+def get_png_bytes(image):
+    """PNG-encode an RGB array, reusing the last encoding if the pixels are unchanged"""
+    image = np.ascontiguousarray(image)
+    key = hashlib.blake2b(image, digest_size=16).hexdigest()
+    cached = st.session_state.get('png_cache')
+    if cached and cached[0] == key:
+        return cached[1]
+
+    # Encode straight from the array; fast zlib level since this is an interactive download
+    ok, png_buf = cv2.imencode('.png', cv2.cvtColor(image, cv2.COLOR_RGB2BGR), [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    if not ok:
+        raise ValueError("PNG encoding failed")
+    data = png_buf.tobytes()
+    st.session_state.png_cache = (key, data)
+    return data
+
+class ImageDetectionError(Exception):
+    """Raised inside the detection cache so failed analyses are never memoized"""
+
+def get_face_data_version():
+    """Token for the face database; changes on register, retrain, delete or threshold updates"""
+    face_engine = st.session_state.detection_engine.get_face_engine()
+    return face_engine.data_version() if face_engine else None
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _run_image_detection(image_bytes, _image_np, conf, iou, face_version, _executed):
+    """Detection on a cache miss; raises ImageDetectionError so failures skip the cache"""
+    _executed.append(True)
+    results = st.session_state.detection_engine.detect_objects(_image_np, conf, iou)
+    if 'error' in results:
+        raise ImageDetectionError(results['error'])
+    return results
+
+def run_image_detection(image_bytes, image_np, conf, iou, face_version):
+    """Run detection on an uploaded image, cached by its bytes, thresholds and face database
+
+    Returns (results, analysis_time, cached); analysis_time is this call's wall time.
+    Failures come back as {'error': ...} uncached, so pressing the button again retries.
+    """
+    executed = []
+    start_time = time.time()
+    try:
+        results = _run_image_detection(image_bytes, image_np, conf, iou, face_version, executed)
+    except ImageDetectionError as e:
+        results = {'error': str(e)}
+    return results, time.time() - start_time, not executed
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def draw_image_detections(image_bytes, _image_np, _results, conf, iou, face_version):
+    """Annotate an analyzed image; shares run_image_detection's cache key"""
+    return st.session_state.detection_engine.draw_detections(
+        _image_np, _results['detections'], True, _results.get('face_results', [])
+    )
+
+@functools.lru_cache(maxsize=32)
+def get_file_size_mb(path, mtime):
+    """Size of a file in MB, cached per (path, mtime)."""
+    return os.path.getsize(path) * INV_MB
+
+def compliance_band(rate):
+    """Band index for a compliance rate: 0 below 60%, 1 below 80%, 2 otherwise."""
+    return (rate >= 60) + (rate >= 80)
+
+@functools.lru_cache(maxsize=256)
+def render_image_metric_card(value, label, color, color_dark):
+    """Instant Analysis metric card HTML, cached on its display values."""
+    return IMAGE_METRIC_CARD_TMPL.format(value=value, label=label, color=color, color_dark=color_dark)
+
+@functools.lru_cache(maxsize=256)
+def render_attendance_stat_card(value, label, color_key, theme_name):
+    """Attendance counter card HTML, cached on its display value and theme"""
+    theme_config = THEMES.get(theme_name, THEMES['light'])
+    return ATTENDANCE_STAT_CARD_TMPL.substitute(theme_config, color=theme_config[color_key], value=value, label=label)
+
+def get_history_summary():
+    """Session, frame, violation and compliance totals for the results history, cached per history version"""
+    version = st.session_state.get('history_version', 0)
+    cached = st.session_state.get('history_summary')
+    if cached and cached[0] == version:
+        return cached[1]
+
+    history = st.session_state.results_history
+    total_sessions = len(history)
+    total_frames = total_violations = total_compliance = 0
+    # One pass over the entries instead of one per statistic
+    for entry in history:
+        results = entry['results']
+        total_frames += results['processed_frames']
+        total_violations += results['total_violations']
+        total_compliance += results.get('average_compliance_rate', 0)
+    avg_compliance = total_compliance / total_sessions if total_sessions > 0 else 0
+    summary = (total_sessions, total_frames, total_violations, avg_compliance)
+    st.session_state.history_summary = (version, summary)
+    return summary
+
+@functools.lru_cache(maxsize=4)
+def render_history_results_css(theme_name):
+    """History detection-tabs theme properties for a theme"""
+    return HISTORY_RESULTS_THEME_TMPL.substitute(THEMES.get(theme_name, THEMES['light']))
+
+@functools.lru_cache(maxsize=4)
+def render_detection_results_tabs_css(theme_name):
+    """Video results dashboard tab styling for a theme"""
+    return DETECTION_RESULTS_TABS_CSS_TMPL.substitute(THEMES.get(theme_name, THEMES['light']))
+
+def get_history_order(search_term, sort_order):
+    """Indices into results_history in display order, cached per history version, search and sort"""
+    key = (st.session_state.get('history_version', 0), search_term, sort_order)
+    cached = st.session_state.get('history_order')
+    if cached and cached[0] == key:
+        return cached[1]
+
+    history = st.session_state.results_history
+    # Newest First (the default) walks the indices backwards; ranges slice without copying
+    if sort_order in ("Oldest First", "Most Violations", "Best Compliance"):
+        order = range(len(history))
+    else:
+        order = range(len(history) - 1, -1, -1)
+
+    # Apply search filter
+    if search_term:
+        needle = search_term.lower()
+        order = [idx for idx in order if needle in history[idx]['search_key']]
+
+    # Apply sorting
+    if sort_order == "Most Violations":
+        order = sorted(order, key=lambda idx: history[idx]['results'].get('total_violations', 0), reverse=True)
+    elif sort_order == "Best Compliance":
+        order = sorted(order, key=lambda idx: history[idx]['results'].get('average_compliance_rate', 0), reverse=True)
+
+    st.session_state.history_order = (key, order)
+    return order
+
+def get_history_report(entry, session_num):
+    """JSON report for a history session, memoized on the entry until its session number shifts"""
+    cached = entry.get('report_cache')
+    if cached and cached[0] == session_num:
+        return cached[1]
+
+    report_data = {
+        'session_info': {
+            'session_number': session_num,
+            'timestamp': entry['timestamp'],
+            'processing_time': entry['processing_time'],
+            'settings': entry['settings']
+        },
+        'results': entry['results'],
+        'summary': {
+            'total_frames': entry['results']['processed_frames'],
+            'total_violations': entry['results']['total_violations'],
+            'compliance_rate': entry['results'].get('average_compliance_rate', 0),
+            'processing_speed': entry['processing_speed']
+        }
+    }
+    report = json.dumps(report_data, indent=2, default=str)
+    entry['report_cache'] = (session_num, report)
+    return report
+
+@functools.lru_cache(maxsize=4)
+def render_history_view_banner(theme_name):
+    """History "View Results" confirmation card for a theme"""
+    return HISTORY_VIEW_BANNER_TMPL.substitute(THEMES.get(theme_name, THEMES['light']))
+
+def get_export_data(latest_stats, webcam_detector):
+    """Comprehensive export data, rebuilt only when a new frame is processed or the session stops"""
+    # latest_stats carries a wall-clock session_duration, so it is left out of the key
+    key = (webcam_detector.session_id, webcam_detector.frame_count, webcam_detector.session_active)
+    cached = st.session_state.get('export_data_cache')
+    if cached and cached[0] == key:
+        return cached[1]
+
+    export_data = create_comprehensive_export_data(latest_stats, webcam_detector)
+    st.session_state.export_data_cache = (key, export_data)
+    return export_data
+
+def get_export_json(export_data, pretty=False):
+    """Serialize export data to JSON bytes once per export snapshot; compact unless pretty"""
+    cached = st.session_state.get('export_json_cache')
+    if cached and cached[0] is export_data and cached[1] == pretty:
+        return cached[2]
+
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        json_bytes = orjson.dumps(export_data, default=str, option=option)
+    elif pretty:
+        json_bytes = json.dumps(export_data, indent=2, default=str).encode('utf-8')
+    else:
+        json_bytes = json.dumps(export_data, separators=(',', ':'), default=str).encode('utf-8')
+    st.session_state.export_json_cache = (export_data, pretty, json_bytes)
+    return json_bytes
+
+def build_timeline_csv(compliance_history, people_history, violation_history):
+    """Write the per-frame timeline as CSV rows; shorter histories are padded with zeros"""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(['Frame', 'Compliance_Rate', 'People_Count', 'Violations'])
+    writer.writerows(zip(
+        range(1, len(compliance_history) + 1),
+        compliance_history,
+        itertools.chain(people_history, itertools.repeat(0)),
+        itertools.chain(violation_history, itertools.repeat(0))
+    ))
+    return buf.getvalue()
+
+def get_timeline_csv(webcam_detector):
+    """Timeline CSV for the live session, rebuilt only when new frames are recorded"""
+    key = (webcam_detector.session_id, webcam_detector.frame_count, len(webcam_detector.compliance_history))
+    cached = st.session_state.get('timeline_csv_cache')
+    if cached and cached[0] == key:
+        return cached[1]
+
+    csv_data = build_timeline_csv(
+        webcam_detector.compliance_history,
+        webcam_detector.people_history,
+        webcam_detector.violation_history
+    )
+    st.session_state.timeline_csv_cache = (key, csv_data)
+    return csv_data
+
+def build_live_chart_figures():
+    """Create the export tab's live charts with empty traces; plotly is imported on first use"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    # Compliance and people timelines side by side in one figure
+    fig_timelines = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("📊 Compliance Rate Timeline", "👥 People Detection Timeline"),
+        horizontal_spacing=0.12
+    )
+    fig_timelines.add_trace(go.Scatter(
+        y=[],
+        mode='lines+markers',
+        name='Compliance Rate',
+        line=dict(color='#4CAF50', width=3),
+        marker=dict(size=6, color='#4CAF50'),
+        fill='tozeroy',
+        fillcolor='rgba(76, 175, 80, 0.1)'
+    ), row=1, col=1)
+    fig_timelines.add_trace(go.Scatter(
+        y=[],
+        mode='lines+markers',
+        name='People Detected',
+        line=dict(color='#2196F3', width=3),
+        marker=dict(size=6, color='#2196F3'),
+        fill='tozeroy',
+        fillcolor='rgba(33, 150, 243, 0.1)'
+    ), row=1, col=2)
+
+    fig_timelines.update_layout(height=350, showlegend=False, **LIVE_CHART_LAYOUT)
+    fig_timelines.update_xaxes(title_text="Frame Number", gridcolor='rgba(0,0,0,0.1)')
+    fig_timelines.update_yaxes(title_text="Compliance Rate (%)", range=[0, 100], gridcolor='rgba(0,0,0,0.1)', row=1, col=1)
+    fig_timelines.update_yaxes(title_text="Number of People", gridcolor='rgba(0,0,0,0.1)', row=1, col=2)
+
+    # Create subplot with secondary y-axis
+    fig_combined = make_subplots(
+        specs=[[{"secondary_y": True}]],
+        subplot_titles=["📊 Combined Analytics Overview"]
+    )
+
+    # Add compliance rate
+    fig_combined.add_trace(
+        go.Scatter(
+            y=[],
+            mode='lines',
+            name='Compliance Rate (%)',
+            line=dict(color='#4CAF50', width=2)
+        ),
+        secondary_y=False,
+    )
+
+    # Add people count; hidden until people have been detected
+    fig_combined.add_trace(
+        go.Scatter(
+            y=[],
+            mode='lines',
+            name='People Count',
+            line=dict(color='#2196F3', width=2)
+        ),
+        secondary_y=True,
+    )
+
+    # Update layout
+    fig_combined.update_layout(height=400, **LIVE_CHART_LAYOUT)
+
+    fig_combined.update_yaxes(title_text="Compliance Rate (%)", secondary_y=False)
+    fig_combined.update_yaxes(title_text="Number of People", secondary_y=True)
+    fig_combined.update_xaxes(title_text="Frame Number")
+
+    return fig_timelines, fig_combined
+
+def get_live_chart_figures():
+    """Live chart figures built once per session; reruns only swap in new trace data"""
+    figures = st.session_state.get('live_chart_figures')
+    if figures is None:
+        figures = build_live_chart_figures()
+        st.session_state.live_chart_figures = figures
+    return figures
+
+@functools.lru_cache(maxsize=4)
+def gzip_download(data):
+    """Gzip a download payload at a fast compression level, once per payload"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return gzip.compress(data, compresslevel=1)
+
+@st.cache_data(ttl=30, show_spinner=False, max_entries=8)
+def load_employees(db_path, db_version, _attendance_manager):
+    """Registered employees, re-queried only when the attendance database changes"""
+    return _attendance_manager.get_all_employees()
+
+def get_all_employees(attendance_manager):
+    """Cached employee list for an attendance manager"""
+    return load_employees(attendance_manager.db_path, attendance_manager.data_version(), attendance_manager)
+
+@st.cache_data(ttl=5, show_spinner=False, max_entries=8)
+def load_today_attendance(db_path, db_version, day, _attendance_manager):
+    """Attendance records for a day, re-queried only when the attendance database changes"""
+    return _attendance_manager.get_today_attendance()
+
+@st.cache_data(ttl=5, show_spinner=False, max_entries=8)
+def load_attendance_stats(db_path, db_version, day, _attendance_manager):
+    """Attendance counts for a day, re-queried only when the attendance database changes"""
+    return _attendance_manager.get_attendance_stats(day)
+
+def remove_temp_files(paths):
+    """Unlink every path in a set, ignoring files that are already gone"""
+    for path in list(paths):
+        paths.discard(path)
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+class SessionTempFiles:
+    """Temp files owned by one browser session; any left over are deleted when the session is dropped"""
+
+    def __init__(self):
+        self.paths = set()
+        # Runs when session_state is garbage collected, or at interpreter exit
+        weakref.finalize(self, remove_temp_files, self.paths)
+
+    def add(self, path):
+        self.paths.add(path)
+        return path
+
+    def remove(self, path):
+        self.paths.discard(path)
+        remove_temp_files({path})
+
+def get_session_temp_files():
+    """The session's SessionTempFiles, created on first use"""
+    if 'temp_files' not in st.session_state:
+        st.session_state.temp_files = SessionTempFiles()
+    return st.session_state.temp_files
+
+def release_upload_preview():
+    """Delete the temp file written for the session's current upload, if any"""
+    cached = st.session_state.pop('upload_preview', None)
+    if cached:
+        get_session_temp_files().remove(cached[1])
+
+def get_upload_preview_path(uploaded_file):
+    """Write an uploaded video to disk once per upload; the previous upload's file is removed"""
+    cached = st.session_state.get('upload_preview')
+    if cached and cached[0] == uploaded_file.file_id and os.path.exists(cached[1]):
+        return cached[1]
+
+    release_upload_preview()
+    suffix = os.path.splitext(uploaded_file.name)[1] or '.mp4'
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        tmp.write(uploaded_file.getbuffer())
+    st.session_state.upload_preview = (uploaded_file.file_id, get_session_temp_files().add(tmp.name))
+    return tmp.name
+
 def create_speed_sidebar():
     """Create speed-optimized sidebar"""
     # Get current theme for consistent styling
@@ -1023,1426 +3520,1154 @@ def process_video_with_cancellation(video_path, output_path, settings):
             output_path,
             settings['conf'],
             settings['iou'],
-            update_progress,
-            settings['skip'],
-            settings['res'],
-            stop_flag,
-            persistent_overlay=settings.get('smooth_detections', True)
-        )
-
-        processing_time = time.time() - start_time
-
-        if stop_flag.is_set() or results.get('cancelled'):
-            st.warning("⏹️ Processing cancelled by user")
-            return None
-
-        if 'error' not in results:
-            # Read and store the processed video data
-            if os.path.exists(output_path):
-                with open(output_path, 'rb') as f:
-                    video_data = f.read()
-                st.session_state.processed_video_data = video_data
-
-            # Store results in session state for persistence
-            st.session_state.video_results = results
-            st.session_state.processed_video_path = output_path
-            st.session_state.show_results = True
-
-            # Add to history
-            # Ensure datetime is available (defensive import)
-            try:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            except NameError:
-                from datetime import datetime
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-            history_entry = {
-                'timestamp': timestamp,
-                'results': results,
-                'video_data': st.session_state.processed_video_data,
-                'processing_time': processing_time,
-                'settings': settings
-            }
-            st.session_state.results_history.append(history_entry)
-
-            # Keep only last N results in history
-            if len(st.session_state.results_history) > RESULTS_HISTORY_LIMIT:
-                st.session_state.results_history = st.session_state.results_history[-RESULTS_HISTORY_LIMIT:]
-
-            # Display comprehensive results using the results viewer
-            create_results_dashboard(results, output_path, processing_time, settings, unique_id="main")
-
-            return results
-        else:
-            st.error(f"❌ Processing failed: {results['error']}")
-            return None
-
-    except Exception as e:
-        st.error(f"❌ Error: {e}")
-        return None
-
-    finally:
-        st.session_state.processing = False
-        st.session_state.stop_processing = None
-
-def main():
-    """Main application"""
-
-    # Initialize and apply theme
-    theme_manager.apply_theme_css()
-
-    # Add theme toggle to sidebar with enhanced styling
-    with st.sidebar:
-        st.markdown("---")
-
-        # Theme settings header with proper styling
-        current_theme = theme_manager.get_current_theme()
-        theme_config = theme_manager.get_theme_config(current_theme)
-
-        st.markdown(f"""
-        <h3 style="color: {theme_config['text_primary']} !important; font-weight: 600; margin-bottom: 1rem;">
-            🎨 Theme Settings
-        </h3>
-        """, unsafe_allow_html=True)
-
-        theme_manager.create_theme_toggle()
-
-        # Show current theme indicator with proper theming
-        st.markdown(f"""
-        <div style="
-            background: {theme_config['accent_color']};
-            color: white;
-            padding: 0.5rem;
-            border-radius: 8px;
-            text-align: center;
-            margin: 0.5rem 0;
-            font-weight: 600;
-            border: 1px solid {theme_config['border_color']};
-        ">
-            {theme_config['icon']} {theme_config['name']} Active
-        </div>
-        """, unsafe_allow_html=True)
-
-
-
-    # Enhanced ultra-modern header with status
-    webcam_status = "🟢 Available" if WEBCAM_AVAILABLE else "🔴 Unavailable"
-    model_status = "🟢 Ready" if st.session_state.model_loaded else "🔴 Error"
-
-    st.markdown(f"""
-    <div class="ultra-header">
-        <h1>🦺 PPE Monitor Pro</h1>
-        <p>Ultra-fast AI workplace safety monitoring with real-time analytics</p>
-        <div style="margin-top: 1rem; font-size: 0.9rem; opacity: 0.9;">
-            <span style="margin-right: 2rem;">🤖 AI Model: {model_status}</span>
-            <span style="margin-right: 2rem;">📹 Live Detection: {webcam_status}</span>
-            <span>⚡ Processing: Ultra-Fast Mode</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-
-    
-    # Load detection engine
-    if st.session_state.detection_engine is None:
-        with st.spinner("🔄 Loading AI model..."):
-            engine, loaded = load_detection_engine()
-            st.session_state.detection_engine = engine
-            st.session_state.model_loaded = loaded
-    
-    if not st.session_state.model_loaded:
-        st.error("❌ AI model not available. Please check your model file.")
-        st.stop()
-    
-    # Speed sidebar
-    settings = create_speed_sidebar()
-
-    # Initialize help modal state
-    if 'show_help_modal' not in st.session_state:
-        st.session_state.show_help_modal = False
-
-    # Help modal using Streamlit dialog
-    if st.session_state.show_help_modal:
-        # Create modal using Streamlit's dialog
-        @st.dialog("ℹ️ Help & Status Guide")
-        def show_help_dialog():
-            # Getting Started section
-            st.markdown("### 🚀 Getting Started")
-            st.markdown("""
-            - **Live Detection:** Click START to begin camera detection
-            - **Video Processing:** Upload MP4/AVI files for analysis
-            - **Image Analysis:** Upload JPG/PNG for instant detection
-            - **Results History:** View and download previous analyses
-            """)
-
-            st.markdown("---")
-
-            # Analytics Timeline section
-            st.markdown("### 📊 Analytics Timeline")
-            st.markdown("""
-            - **0-3 frames:** 🔄 Initializing detection engine
-            - **3-10 frames:** 📊 Building analytics report
-            - **10+ frames:** ✅ Full analytics available
-            - **30+ frames:** 🎯 High quality analytics & insights
-            """)
-
-            st.markdown("---")
-
-            # Detection Colors section
-            st.markdown("### 🎨 Detection Colors")
-            st.markdown("""
-            - 🟢 **Green:** PPE present (compliant)
-            - 🔴 **Red:** PPE missing (violation)
-            - 🟡 **Yellow:** Person detected
-            - 🟠 **Orange:** Safety equipment
-            - 🟣 **Purple:** Machinery/vehicles
-            """)
-
-            st.markdown("---")
-
-            # Control Functions section
-            st.markdown("### 🎛️ Control Functions")
-            st.markdown("""
-            - **🔄 Reset:** Complete system reset
-            - **📊 Refresh:** Force immediate display update
-            - **⏸️ Pause/▶️ Resume:** Pause/resume analytics
-            - **💾 Export:** Download session statistics
-            - **🚀 Process:** Start video/image analysis
-            """)
-
-            st.markdown("---")
-
-            # Performance Info section
-            st.markdown("### ⏱️ Performance Info")
-            st.markdown("""
-            - **Basic stats:** Available immediately
-            - **Analytics report:** Ready in ~3-5 seconds
-            - **High quality data:** Achieved after ~30 seconds
-            - **Ultra-fast mode:** Up to 8x processing speed
-            """)
-
-            st.markdown("---")
-
-            # System Status section
-            st.markdown("### 🔧 System Status")
-            st.markdown(f"""
-            - **AI Model:** {model_status}
-            - **Live Detection:** {webcam_status}
-            - **Processing Mode:** Ultra-Fast
-            - **Version:** PPE Monitor Pro v2.1
-            """)
-
-            st.markdown("---")
-
-            # Close button
-            _, col2, _ = st.columns([1, 1, 1])
-            with col2:
-                if st.button("✕ Close", type="primary", use_container_width=True):
-                    st.session_state.show_help_modal = False
-                    st.rerun()
-
-        show_help_dialog()
-
-    # Main interface
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(["📹 Live Detection", "🎥 Ultra-Fast Video", "📷 Instant Analysis", "📋 Results History", "📊 Export Session Data", "👤 Face Recognition", "📊 Live Attendance"])
-    
-    with tab1:
-        if WEBCAM_AVAILABLE:
-            # Import the analytics function
-            from webcam_component import create_webcam_analytics
-
-            # Create the main webcam interface
-            webrtc_ctx = create_webcam_interface(st.session_state.detection_engine, settings)
-
-            # Add analytics section below the webcam interface
-            st.markdown("---")
+            update_progress,
+            settings['skip'],
+            settings['res'],
+            stop_flag,
+            persistent_overlay=settings.get('smooth_detections', True)
+        )
 
-            # Enhanced analytics with better error handling and status display
-            if webrtc_ctx and hasattr(st.session_state, 'webcam_detector'):
-                try:
-                    # Check if camera is active
-                    camera_active = webrtc_ctx.state.playing
+        processing_time = time.time() - start_time
 
-                    # Track camera state changes and manage session accordingly
-                    if 'previous_camera_state_main' not in st.session_state:
-                        st.session_state.previous_camera_state_main = False
+        if stop_flag.is_set() or results.get('cancelled'):
+            st.warning("⏹️ Processing cancelled by user")
+            return None
 
-                    # Detect camera state changes
-                    if camera_active != st.session_state.previous_camera_state_main:
-                        if camera_active:
-                            # Camera just started
-                            st.session_state.webcam_detector.start_session()
-                        else:
-                            # Camera just stopped
-                            st.session_state.webcam_detector.stop_session()
-                        st.session_state.previous_camera_state_main = camera_active
+        if 'error' not in results:
+            # Read and store the processed video data
+            if os.path.exists(output_path):
+                with open(output_path, 'rb') as f:
+                    video_data = f.read()
+                st.session_state.processed_video_data = video_data
 
-                    if camera_active:
-                        # Get latest stats with error handling
-                        try:
-                            latest_stats = st.session_state.webcam_detector.get_latest_stats()
-                        except Exception as e:
-                            st.error(f"Error retrieving analytics: {str(e)}")
-                            latest_stats = None
+            # Store results in session state for persistence
+            st.session_state.video_results = results
+            st.session_state.processed_video_path = output_path
+            # The output file is removed after processing; View Results Again rematerializes it once
+            st.session_state.processed_video_ready = False
+            st.session_state.show_results = True
 
-                        if latest_stats and latest_stats['frame_count'] > 0:
-                            # Enhanced analytics readiness status
-                            frame_count = latest_stats['frame_count']
-                            if frame_count < 3:
-                                st.info(f"🔄 **Initializing Analytics...** ({frame_count}/3 frames)")
-                                progress = frame_count / 3
-                                st.progress(progress, text=f"Processing frame {frame_count}")
-                            elif frame_count < 10:
-                                st.warning(f"📊 **Building Report...** ({frame_count}/10 frames for full analytics)")
-                                progress = frame_count / 10
-                                st.progress(progress, text=f"Analytics quality: {progress*100:.0f}%")
-                            else:
-                                st.success("✅ **Full Analytics Available**")
+            # Add to history
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-                        # Show the comprehensive analytics
-                        create_webcam_analytics(st.session_state.webcam_detector)
+            history_entry = {
+                'timestamp': timestamp,
+                'search_key': timestamp.lower(),  # lower-cased once for the history search
+                'file_timestamp': timestamp.replace(':', '-').replace(' ', '_'),  # download filenames
+                'processing_speed': f"{results['processed_frames'] / processing_time:.1f} FPS" if processing_time > 0 else "N/A",
+                'results': results,
+                'video_data': st.session_state.processed_video_data,
+                'processing_time': processing_time,
+                'settings': settings
+            }
+            st.session_state.results_history.append(history_entry)
 
-                    else:
-                        st.info("📹 **Start the camera to see live analytics**")
+            # Keep only last N results in history
+            if len(st.session_state.results_history) > RESULTS_HISTORY_LIMIT:
+                st.session_state.results_history = st.session_state.results_history[-RESULTS_HISTORY_LIMIT:]
+                prune_history_state()
+            st.session_state.history_version = st.session_state.get('history_version', 0) + 1
 
-                        # Enhanced last session data display
-                        try:
-                            latest_stats = st.session_state.webcam_detector.get_latest_stats()
-                            if latest_stats and latest_stats['frame_count'] > 0:
-                                st.markdown("---")
-                                st.markdown("### 📊 **Last Session Summary**")
+            # Display comprehensive results using the results viewer
+            create_results_dashboard(results, output_path, processing_time, settings, unique_id="main")
 
-                                # Enhanced metrics display
-                                col1, col2, col3, col4 = st.columns(4)
-                                with col1:
-                                    st.metric("Frames Processed", f"{latest_stats['frame_count']:,}")
-                                with col2:
-                                    duration = latest_stats.get('session_duration', 0)
-                                    minutes = int(duration // 60)
-                                    seconds = int(duration % 60)
-                                    st.metric("Duration", f"{minutes:02d}:{seconds:02d}")
-                                with col3:
-                                    st.metric("Final Compliance", f"{latest_stats['compliance_rate']:.0f}%")
-                                with col4:
-                                    total_people = latest_stats.get('total_people_session', 0)
-                                    st.metric("Total People", f"{total_people:,}")
+            return results
+        else:
+            st.error(f"❌ Processing failed: {results['error']}")
+            return None
 
-                                # Additional session info
-                                if latest_stats.get('avg_compliance_rate', 0) > 0:
-                                    avg_compliance = latest_stats['avg_compliance_rate']
-                                    if avg_compliance >= 90:
-                                        st.success(f"🟢 **Excellent Session** - {avg_compliance:.1f}% average compliance")
-                                    elif avg_compliance >= 75:
-                                        st.info(f"✅ **Good Session** - {avg_compliance:.1f}% average compliance")
-                                    elif avg_compliance >= 50:
-                                        st.warning(f"⚠️ **Fair Session** - {avg_compliance:.1f}% average compliance")
-                                    else:
-                                        st.error(f"❌ **Poor Session** - {avg_compliance:.1f}% average compliance")
-                        except Exception as e:
-                            st.warning(f"Could not retrieve last session data: {str(e)}")
+    except Exception as e:
+        st.error(f"❌ Error: {e}")
+        return None
 
-                except Exception as e:
-                    st.error(f"Analytics system error: {str(e)}")
+    finally:
+        st.session_state.processing = False
+        st.session_state.stop_processing = None
 
-            else:
-                st.info("📊 **Analytics will appear here once you start the camera**")
+@st.fragment
+def render_video_results_tabs():
+    """Render the video results dashboard; reruns stay scoped to this fragment"""
+    if not (st.session_state.get('show_results_in_tabs') and st.session_state.video_results):
+        return
 
-                # Enhanced preview of analytics features
-                with st.expander("📈 **Preview: Available Analytics Features**", expanded=False):
-                    col_preview1, col_preview2 = st.columns(2)
+    current_theme = theme_manager.get_current_theme()
 
-                    with col_preview1:
-                        st.markdown("""
-                        **🔴 Real-time Monitoring:**
-                        - 👥 People detection count and trends
-                        - ⚠️ PPE violation tracking and alerts
-                        - 📊 Live compliance rate calculation
-                        - 🎥 Processing performance metrics
+    st.markdown("---")
 
-                        **📈 Session Statistics:**
-                        - ⏱️ Session duration and frame count
-                        - 📊 Average compliance over time
-                        - 🎯 Detection consistency analysis
-                        - ⚡ Real-time processing performance
-                        """)
+    # Broader tab styling, rendered once per theme
+    st.markdown(render_detection_results_tabs_css(current_theme), unsafe_allow_html=True)
 
-                    with col_preview2:
-                        st.markdown("""
-                        **🎯 Performance Indicators:**
-                        - ✅ Detection accuracy rates
-                        - 🔄 Frame processing speed (FPS)
-                        - 📊 Compliance trend analysis
-                        - 🎯 System performance metrics
+    # Create broader detection results tabs with perfect styling
+    with st.container():
+        st.markdown('<div class="detection-results-tabs">', unsafe_allow_html=True)
 
-                        **💾 Export Capabilities:**
-                        - 📄 JSON reports with complete data
-                        - 📊 CSV files for spreadsheet analysis
-                        - 📋 Executive summary reports
-                        - 📈 Timeline data and trends
-                        """)
-        else:
-            st.warning("⚠️ **Webcam features not available**")
-            st.info("Install streamlit-webrtc to enable live detection:")
-            st.code("pip install streamlit-webrtc", language="bash")
+        # Display results using the enhanced dashboard
+        create_results_dashboard(
+            st.session_state.video_results,
+            st.session_state.current_video_path if hasattr(st.session_state, 'current_video_path') else None,
+            0,  # Processing time not available
+            {'skip': 1}  # Default settings
+        )
 
-            # Show what features would be available
-            st.markdown("### 🔮 Available Features (After Installation)")
+        st.markdown('</div>', unsafe_allow_html=True)
 
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown("""
-                **🎥 Live Detection:**
-                - Real-time PPE compliance monitoring
-                - Webcam integration with detection overlay
-                - Live violation alerts and notifications
-                - Adjustable detection sensitivity
-                """)
+@st.fragment
+def render_video_results_section():
+    """Render action buttons, results and summary for the last processed video"""
+    current_theme, theme_config = get_active_theme()
+
+    # One-shot confirmation left by New Video / Clear Results before their rerun
+    notice = st.session_state.pop('video_results_notice', None)
+    if notice:
+        st.markdown(render_success_banner(notice, current_theme), unsafe_allow_html=True)
+
+    if not (st.session_state.show_results and st.session_state.video_results):
+        return
+
+    # Modern action buttons with enhanced styling
+    st.markdown(render_action_cards(current_theme), unsafe_allow_html=True)
+
+    # Action buttons sit in one row beneath the card grid
+    col_btn1, col_btn2, col_btn3 = st.columns(3, gap="large")
+
+    with col_btn1:
+        if st.button("🔄 Process New Video",
+                   use_container_width=True,
+                   type="primary",
+                   help="Clear current results and process a new video",
+                   key="new_video_btn"):
+            # Clear previous results
+            st.session_state.show_results = False
+            st.session_state.show_results_in_tabs = False
+            st.session_state.video_results = None
+            st.session_state.processed_video_path = None
+            st.session_state.processed_video_ready = False
+            st.session_state.current_video_path = None
+
+            # Confirm on the fragment's next run; anything drawn before the rerun is discarded
+            st.session_state.video_results_notice = "Ready for new video processing!"
+            st.rerun(scope="fragment")
+
+    with col_btn2:
+        if st.button("👁️ View Results Again",
+                   use_container_width=True,
+                   type="secondary",
+                   help="Redisplay the current analysis results",
+                   key="view_results_btn"):
+            # Show results again using comprehensive viewer with improved file handling
+            if st.session_state.video_results:
+                video_path = st.session_state.processed_video_path
 
-            with col2:
-                st.markdown("""
-                **📊 Live Analytics:**
-                - Real-time compliance statistics
-                - People counting and tracking
-                - Session performance metrics
-                - Exportable detection reports
-                """)
-    
-    with tab2:
-        # Get current theme for consistent styling
-        current_theme = theme_manager.get_current_theme()
-        theme_config = theme_manager.get_theme_config(current_theme)
+                # Trust the ready flag; only rewrite the file the first time it's needed
+                if not st.session_state.get('processed_video_ready'):
+                    # Try to recreate temporary file from session data
+                    if hasattr(st.session_state, 'processed_video_data') and st.session_state.processed_video_data:
+                        try:
+                            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
+                                tmp_file.write(st.session_state.processed_video_data)
+                                video_path = tmp_file.name
+                            st.session_state.processed_video_path = video_path
+                            st.session_state.processed_video_ready = True
+                            st.info("🔄 Video file recreated from session data")
+                        except Exception as e:
+                            st.error(f"❌ Could not recreate video file: {str(e)}")
+                            video_path = None
+                    else:
+                        st.warning("⚠️ Video data no longer available in session. Showing results without video.")
+                        video_path = None
 
-        # Modern header with glassmorphism effect
+                # Set flag to show results in broader tabs below
+                st.session_state.show_results_in_tabs = True
+                st.session_state.current_video_path = video_path
+            else:
+                st.error("❌ Previous results no longer available")
+
+    with col_btn3:
+        if st.button("🗑️ Clear Results",
+                   use_container_width=True,
+                   help="Remove current results from memory",
+                   key="clear_results_btn"):
+            # Clear results
+            st.session_state.show_results = False
+            st.session_state.show_results_in_tabs = False
+            st.session_state.video_results = None
+            st.session_state.processed_video_path = None
+            st.session_state.processed_video_ready = False
+            st.session_state.current_video_path = None
+
+            # Confirm on the fragment's next run; anything drawn before the rerun is discarded
+            st.session_state.video_results_notice = "Results cleared successfully!"
+            st.rerun(scope="fragment")
+
+    # Display results in beautiful broader tabs below action buttons
+    render_video_results_tabs()
+
+    # Show modern summary of previous results
+    if st.session_state.video_results:
+        results = st.session_state.video_results
+
+        # Modern summary header
         st.markdown(f"""
         <div style="
-            background: linear-gradient(135deg, {theme_config['accent_color']}15 0%, {theme_config['info_color']}10 100%);
-            backdrop-filter: blur(10px);
+            background: linear-gradient(135deg, {theme_config['card_bg']}95 0%, {theme_config['secondary_bg']}80 100%);
+            backdrop-filter: blur(20px);
             border: 1px solid {theme_config['border_color']};
             border-radius: 20px;
             padding: 2rem;
-            margin-bottom: 2rem;
-            text-align: center;
+            margin: 2rem 0;
             box-shadow: 0 8px 32px {theme_config['shadow']};
         ">
-            <h2 style="
+            <h4 style="
                 color: {theme_config['text_primary']};
-                margin: 0;
+                margin: 0 0 1.5rem 0;
                 font-weight: 700;
-                font-size: 2rem;
-                background: linear-gradient(135deg, {theme_config['accent_color']}, {theme_config['info_color']});
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-            ">
-                🚀 Ultra-Fast Video Processing
-            </h2>
-            <p style="
-                color: {theme_config['text_secondary']};
-                margin: 0.5rem 0 0 0;
-                font-size: 1.1rem;
-                font-weight: 500;
+                font-size: 1.4rem;
+                display: flex;
+                align-items: center;
+                gap: 0.8rem;
             ">
-                Advanced AI-powered PPE compliance analysis with lightning-fast processing
+                📊 Last Processing Summary
+            </h4>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Modern metrics grid, emitted as a single block
+        avg_compliance = results.get('average_compliance_rate', 0)
+        compliance_color = theme_config[COMPLIANCE_COLOR_KEYS[compliance_band(avg_compliance)]]
+
+        video_path = st.session_state.processed_video_path
+        if video_path and os.path.exists(video_path):
+            file_size = get_file_size_mb(video_path, os.path.getmtime(video_path))
+            status_text = f"{file_size:.1f} MB"
+            status_color = theme_config['success_color']
+            label_text = "Video Size"
+        else:
+            status_text = "Missing"
+            status_color = theme_config['warning_color']
+            label_text = "File Status"
+
+        card_values = [
+            (theme_config['info_color'], f"{results['processed_frames']:,}", 'Frames Processed'),
+            (theme_config['danger_color'], f"{results['total_violations']:,}", 'Violations Found'),
+            (compliance_color, f"{avg_compliance:.0f}%", 'Avg Compliance'),
+            (status_color, status_text, label_text),
+        ]
+        cards = "".join(
+            METRIC_CARD_TMPL.format_map({
+                'accent': accent,
+                'value': value,
+                'label': label,
+                'text_secondary': theme_config['text_secondary'],
+                'shadow': theme_config['shadow'],
+            })
+            for accent, value, label in card_values
+        )
+        st.markdown(METRIC_GRID_TMPL.format(cards=cards), unsafe_allow_html=True)
+
+@st.fragment
+def render_history_entry_results(i, entry):
+    """Render one history session's results dashboard; its widgets rerun only this panel"""
+    # Divider and wrapper open in one element
+    st.markdown(f'<hr><div class="history-detection-results" data-idx="{i}">', unsafe_allow_html=True)
+
+    # Display results using the enhanced dashboard; the video is served from the entry's bytes
+    create_results_dashboard(
+        entry['results'],
+        None,
+        entry['processing_time'],
+        entry['settings'],
+        unique_id=f"history_{i}",
+        video_data=entry['video_data']
+    )
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@st.fragment
+def render_history_tab():
+    """Render the results history tab; its widgets rerun only this fragment"""
+    st.markdown("### 📋 Results History")
+
+    if not st.session_state.results_history:
+        # Static empty state and feature showcase in a single element
+        st.html(HISTORY_EMPTY_STATE_HTML + HISTORY_FEATURE_CARDS_HTML + HISTORY_PRO_TIP_HTML)
+        return
+
+    # Theme name only; the themed CSS and banners below are cached per theme
+    current_theme = theme_manager.get_current_theme()
+
+    # Summary statistics only change when the history does
+    total_sessions, total_frames, total_violations, avg_compliance = get_history_summary()
+
+    # Stylesheet and header go out together as one element
+    st.markdown(
+        HISTORY_TAB_CSS + render_history_results_css(current_theme) + HISTORY_HEADER_TMPL.format_map({
+            'total_sessions': total_sessions,
+            'total_frames': total_frames,
+            'avg_compliance': avg_compliance,
+        }),
+        unsafe_allow_html=True
+    )
+
+    # Quick stats overview
+    if total_sessions > 0:
+        st.markdown("### 📈 Quick Overview")
+        overview_col1, overview_col2, overview_col3, overview_col4 = st.columns(4)
+
+        with overview_col1:
+            st.metric("Total Sessions", total_sessions, delta=None)
+
+        with overview_col2:
+            st.metric("Total Frames", f"{total_frames:,}", delta=None)
+
+        with overview_col3:
+            compliance_delta = "🟢 Excellent" if avg_compliance >= 90 else "🟡 Good" if avg_compliance >= 75 else "🔴 Needs Improvement"
+            st.metric("Avg Compliance", f"{avg_compliance:.1f}%", delta=compliance_delta)
+
+        with overview_col4:
+            violation_status = "🎉 Clean" if total_violations == 0 else f"⚠️ {total_violations} Total"
+            st.metric("Safety Status", violation_status, delta=None)
+
+    # Enhanced history controls with search and filters
+    col1, col2, col3 = st.columns([2, 1, 1])
+
+    with col1:
+        st.markdown("**🔍 Search & Filter Sessions:**")
+        search_term = st.text_input(
+            "Search by date or session number",
+            placeholder="e.g., 2024-01 or Session 5",
+            label_visibility="collapsed"
+        )
+
+    with col2:
+        sort_order = st.selectbox(
+            "Sort by",
+            ["Newest First", "Oldest First", "Most Violations", "Best Compliance"],
+            label_visibility="collapsed"
+        )
+
+    with col3:
+        if st.button("🗑️ Clear History",
+                   use_container_width=True,
+                   type="secondary",
+                   help="Remove all processing history"):
+            st.session_state.results_history = []
+            st.session_state.history_page = 0
+            prune_history_state()
+            st.session_state.history_version = st.session_state.get('history_version', 0) + 1
+            st.success("✅ History cleared successfully!")
+            time.sleep(0.5)
+            st.rerun(scope="fragment")
+
+    # Display order as indices into results_history, reused until the history or controls change
+    history_order = get_history_order(search_term, sort_order)
+
+    # Show filtered results count
+    if search_term or sort_order != "Newest First":
+        st.markdown(f"**📊 Showing {len(history_order)} of {len(st.session_state.results_history)} sessions**")
+
+    # Only render one page of sessions per rerun
+    page_count = max(1, -(-len(history_order) // HISTORY_PAGE_SIZE))
+    page = min(st.session_state.get('history_page', 0), page_count - 1)
+    page_start = page * HISTORY_PAGE_SIZE
+    visible_history = history_order[page_start:page_start + HISTORY_PAGE_SIZE]
+
+    if page_count > 1:
+        prev_col, page_col, next_col = st.columns([1, 2, 1])
+        with prev_col:
+            if st.button("◀ Prev", key="history_prev", use_container_width=True, disabled=page == 0):
+                st.session_state.history_page = page - 1
+                st.rerun(scope="fragment")
+        with page_col:
+            st.markdown(f"<div style='text-align: center;'>Page {page + 1} of {page_count}</div>", unsafe_allow_html=True)
+        with next_col:
+            if st.button("Next ▶", key="history_next", use_container_width=True, disabled=page == page_count - 1):
+                st.session_state.history_page = page + 1
+                st.rerun(scope="fragment")
+
+    # Display filtered history entries with enhanced design
+    for i, original_index in enumerate(visible_history, start=page_start):
+        entry = st.session_state.results_history[original_index]
+        # Calculate original session number
+        session_num = len(st.session_state.results_history) - original_index
+
+        # Create enhanced session card with modern styling
+        with st.expander(
+            f"🎬 Session {session_num} • {entry['timestamp']}",
+            expanded=(i == 0 and len(history_order) <= 3)
+        ):
+
+            # Session metrics with improved layout, emitted as one grid
+            frames = entry['results']['processed_frames']
+
+            violations = entry['results']['total_violations']
+            violation_color, violation_light, violation_icon = VIOLATION_STYLE[bool(violations)]
+
+            avg_compliance = entry['results'].get('average_compliance_rate', 0)
+            compliance_color, compliance_light, compliance_icon = next(
+                style for bound, style in COMPLIANCE_BUCKETS if avg_compliance >= bound
+            )
+
+            processing_time = entry['processing_time']
+            time_color, time_light, time_icon = next(
+                style for bound, style in TIME_BUCKETS if processing_time < bound
+            )
+
+            cards = "".join(
+                HISTORY_METRIC_CARD_TMPL.format(color=color, light=light, value=value, icon=icon, label=label)
+                for color, light, value, icon, label in (
+                    ("#667eea", "#764ba2", f"{frames:,}", "📹", "Total Frames"),
+                    (violation_color, violation_light, f"{violations:,}", violation_icon, "Safety Violations"),
+                    (compliance_color, compliance_light, f"{avg_compliance:.0f}%", compliance_icon, "Compliance Rate"),
+                    (time_color, time_light, f"{processing_time:.1f}s", time_icon, "Processing Time"),
+                )
+            )
+            st.markdown(f'<div class="session-metrics">{cards}</div>', unsafe_allow_html=True)
+
+            # Action buttons
+            col_btn1, col_btn2, col_btn3 = st.columns(3)
+
+            with col_btn1:
+                if st.button(f"👁️ View Results",
+                           key=f"view_{i}",
+                           use_container_width=True,
+                           type="primary",
+                           help="View complete analysis results for this session"):
+                    try:
+                        # Set session state to show results in broader tabs below
+                        st.session_state.video_results = entry['results']
+                        st.session_state.processed_video_data = entry['video_data']
+                        st.session_state.processed_video_ready = False
+                        st.session_state.show_results = True
+                        # Only one session's dashboard is rendered at a time
+                        for key in [k for k in st.session_state if k.startswith(('show_history_results_', 'history_entry_'))]:
+                            del st.session_state[key]
+                        st.session_state[f'show_history_results_{i}'] = True
+                        st.session_state[f'history_entry_{i}'] = entry
+
+                        # Enhanced success message with better visual design
+                        st.markdown(render_history_view_banner(current_theme), unsafe_allow_html=True)
+                        st.rerun()
+
+                    except Exception as e:
+                        st.error(f"❌ Failed to load results: {str(e)}")
+
+            with col_btn2:
+                if entry['video_data']:
+                    st.download_button(
+                        "📥 Download Video",
+                        entry['video_data'],
+                        file_name=f"ppe_session_{entry['file_timestamp']}.mp4",
+                        mime="video/mp4",
+                        key=f"download_{i}",
+                        use_container_width=True,
+                        help="Download the processed video with PPE detection overlays"
+                    )
+                else:
+                    st.button("📥 No Video",
+                            key=f"no_video_{i}",
+                            use_container_width=True,
+                            disabled=True,
+                            help="Video data not available for this session")
+
+            with col_btn3:
+                # Enhanced download report with better data
+                st.download_button(
+                    "📄 Download Report",
+                    get_history_report(entry, session_num),
+                    file_name=f"ppe_report_session_{session_num}_{entry['file_timestamp']}.json",
+                    mime="application/json",
+                    key=f"report_{i}",
+                    use_container_width=True,
+                    help="Download comprehensive analysis report in JSON format"
+                )
+
+            # Display broader horizontal detection results tabs below buttons if requested
+            if st.session_state.get(f'show_history_results_{i}', False):
+                # Create broader detection results tabs with perfect styling and enhanced layout
+                render_history_entry_results(i, st.session_state.get(f'history_entry_{i}', entry))
+
+@st.fragment
+def render_export_charts(webcam_detector):
+    """Render the export tab's live analytics charts; the chart toggle reruns only this fragment"""
+    history_len = len(webcam_detector.compliance_history)
+
+    # Enhanced Charts section with better visual organization
+    if history_len > 1:
+        st.markdown("""
+        <div style="
+            background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
+            border-radius: 15px;
+            padding: 1.5rem;
+            margin: 2rem 0 1rem 0;
+            border-left: 5px solid #6f42c1;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.05);
+        ">
+            <h4 style="margin: 0 0 0.5rem 0; color: #2c3e50; font-size: 1.3rem; display: flex; align-items: center; gap: 0.5rem;">
+                📈 Live Analytics Dashboard
+                <span style="font-size: 0.7rem; background: #6f42c1; color: white; padding: 0.2rem 0.5rem; border-radius: 10px; font-weight: 600;">
+                    LIVE
+                </span>
+            </h4>
+            <p style="margin: 0; color: #6c757d; font-size: 0.95rem;">
+                Real-time visualization of detection performance and trends
             </p>
         </div>
         """, unsafe_allow_html=True)
 
-        # Enhanced drag & drop section with modern glassmorphism design
-        st.markdown(f"""
-        <style>
-        /* Modern upload container with glassmorphism */
-        .modern-upload-container {{
-            position: relative;
-            margin: 2rem 0;
-        }}
+        # Charts are imported and built only while the toggle is on; its key keeps it sticky
+        if st.toggle("Show live charts", key="export_charts_expanded", value=False):
+            # Detector histories are a rolling 30-frame window, so traces are plotted as-is;
+            # the people timeline is aligned to the compliance timeline once (zero-padded)
+            compliance_series = np.asarray(webcam_detector.compliance_history, dtype=np.float64)
+            people_series = np.zeros(compliance_series.size, dtype=np.int32)
+            aligned_people = webcam_detector.people_history[:compliance_series.size]
+            people_series[:len(aligned_people)] = aligned_people
+            fig_timelines, fig_combined = get_live_chart_figures()
+            # Both figures are fed from the same two aligned arrays
+            fig_timelines.data[0].y = fig_combined.data[0].y = compliance_series
+            fig_timelines.data[1].y = fig_combined.data[1].y = people_series
+            fig_combined.data[1].visible = bool(webcam_detector.people_history)
+
+            # Compliance and people timelines share one plotly instance
+            st.markdown("""
+            <div class="chart-container" style="
+                background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+                border-radius: 15px;
+                padding: 1.5rem;
+                box-shadow: 0 6px 20px rgba(0,0,0,0.08);
+                border: 2px solid #e9ecef;
+                transition: all 0.3s ease;
+                margin-bottom: 1rem;
+            ">
+            """, unsafe_allow_html=True)
 
-        .modern-upload-section {{
-            border: 2px dashed {theme_config['accent_color']}80;
-            border-radius: 24px;
-            padding: 3rem 2rem;
-            text-align: center;
-            background: linear-gradient(135deg, {theme_config['card_bg']}90 0%, {theme_config['secondary_bg']}70 100%);
-            backdrop-filter: blur(20px);
-            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-            position: relative;
-            overflow: hidden;
-            margin-bottom: 1.5rem;
-            box-shadow: 0 8px 32px {theme_config['shadow']};
-        }}
+            st.plotly_chart(fig_timelines, use_container_width=True)
+            if not webcam_detector.people_history:
+                # Show placeholder for people detection
+                st.info("👥 People detection chart will appear as data becomes available")
 
-        .modern-upload-section::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: linear-gradient(45deg, transparent 30%, {theme_config['accent_color']}20 50%, transparent 70%);
-            transform: translateX(-100%);
-            transition: transform 0.8s ease;
-        }}
+            st.markdown('</div>', unsafe_allow_html=True)
 
-        .modern-upload-section:hover {{
-            border-color: {theme_config['accent_color']};
-            background: linear-gradient(135deg, {theme_config['card_bg']}95 0%, {theme_config['secondary_bg']}80 100%);
-            transform: translateY(-4px);
-            box-shadow: 0 16px 48px {theme_config['shadow_hover']};
-        }}
+            # Enhanced Combined analytics chart
+            if history_len > 5:
+                st.markdown("""
+                <div style="
+                    background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+                    border-radius: 15px;
+                    padding: 1.5rem;
+                    margin: 1.5rem 0;
+                    box-shadow: 0 8px 25px rgba(0,0,0,0.1);
+                    border: 2px solid #e9ecef;
+                    border-left: 5px solid #17a2b8;
+                ">
+                    <h5 style="margin: 0 0 1rem 0; color: #2c3e50; display: flex; align-items: center; gap: 0.5rem;">
+                        📊 Combined Analytics Overview
+                        <span style="font-size: 0.7rem; background: #17a2b8; color: white; padding: 0.2rem 0.5rem; border-radius: 10px; font-weight: 600;">
+                            ADVANCED
+                        </span>
+                    </h5>
+                </div>
+                <div class="chart-container" style="
+                    background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+                    border-radius: 15px;
+                    padding: 1.5rem;
+                    box-shadow: 0 6px 20px rgba(0,0,0,0.08);
+                    border: 2px solid #e9ecef;
+                    margin-top: 1rem;
+                ">
+                """, unsafe_allow_html=True)
 
-        .modern-upload-section:hover::before {{
-            transform: translateX(100%);
-        }}
+                st.plotly_chart(fig_combined, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
 
-        .upload-icon-modern {{
-            font-size: 4rem;
-            margin-bottom: 1.5rem;
-            opacity: 0.8;
-            transition: all 0.4s ease;
-            background: linear-gradient(135deg, {theme_config['accent_color']}, {theme_config['info_color']});
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }}
+    else:
+        st.markdown(EXPORT_CHARTS_PLACEHOLDER_HTML, unsafe_allow_html=True)
 
-        .modern-upload-section:hover .upload-icon-modern {{
-            opacity: 1;
-            transform: scale(1.1) rotate(5deg);
-        }}
+def render_attendance_live_panel(attendance_manager):
+    """Render attendance notifications, camera status and today's counters; runs as a fragment"""
+    attendance_stats = load_attendance_stats(attendance_manager.db_path, attendance_manager.data_version(), date.today(), attendance_manager)
 
-        .upload-text-modern {{
-            font-size: 1.6rem;
-            font-weight: 700;
-            color: {theme_config['text_primary']};
-            margin-bottom: 1rem;
-            text-shadow: 0 2px 4px {theme_config['shadow']};
-        }}
+    # Check for real-time attendance updates
+    attendance_updated = False
+    if hasattr(st.session_state, 'webcam_detector') and st.session_state.webcam_detector:
+        attendance_summary = st.session_state.webcam_detector.get_attendance_summary()
+        attendance_updated = attendance_summary.get('attendance_updated', False)
 
-        .upload-subtitle-modern {{
-            font-size: 1.1rem;
-            color: {theme_config['text_secondary']};
-            margin-bottom: 1.5rem;
-            font-weight: 500;
-            line-height: 1.6;
-        }}
+        if attendance_updated:
+            # Get the latest detection
+            recent_detections = attendance_summary.get('recent_detections', [])
+            if recent_detections:
+                latest_detection = recent_detections[-1]
+                st.success(f"🎉 **New Attendance Recorded!** {latest_detection['name']} ({latest_detection['confidence']:.0f}% confidence) at {datetime.fromtimestamp(latest_detection['timestamp']).strftime('%H:%M:%S')}")
+
+            # Reset the flag; the rerun reloads data under the new database version
+            st.session_state.webcam_detector.attendance_updated = False
+            time.sleep(1)  # Brief pause to show the notification
+            st.rerun()
+
+    # Live detection status indicator
+    if hasattr(st.session_state, 'webcam_detector') and st.session_state.webcam_detector:
+        latest_stats = st.session_state.webcam_detector.get_latest_stats()
+        if latest_stats and latest_stats.get('frame_count', 0) > 0:
+            st.info(f"📹 **Live Camera Active** - Processing frames in real-time | Last update: {time.strftime('%H:%M:%S')}")
+        else:
+            st.warning("📹 **Camera Inactive** - Start the camera in the Live Detection tab to enable real-time attendance tracking")
+    else:
+        st.info("📹 **Camera Status** - Go to Live Detection tab to start real-time face recognition")
 
-        .supported-formats-modern {{
-            font-size: 0.9rem;
-            color: {theme_config['text_muted']};
-            margin-top: 1rem;
-            padding: 0.8rem 1.5rem;
-            background: {theme_config['tertiary_bg']}80;
-            backdrop-filter: blur(10px);
-            border-radius: 25px;
-            display: inline-block;
-            font-weight: 500;
-            border: 1px solid {theme_config['border_color']};
-        }}
+    # Today's counters as one card grid; each card is cached on its value and theme
+    current_theme = theme_manager.get_current_theme()
+    cards = "".join((
+        render_attendance_stat_card(str(attendance_stats['present_count']), "Present Today", 'success_color', current_theme),
+        render_attendance_stat_card(str(attendance_stats['absent_count']), "Absent Today", 'warning_color', current_theme),
+        render_attendance_stat_card(f"{attendance_stats['attendance_rate']:.1f}%", "Attendance Rate", 'info_color', current_theme),
+        render_attendance_stat_card(str(attendance_stats['total_employees']), "Total Employees", 'accent_color', current_theme),
+    ))
+    st.markdown(METRIC_GRID_TMPL.format(cards=cards), unsafe_allow_html=True)
 
-        /* Enhanced file uploader styling */
-        .stFileUploader {{
-            margin-top: -1rem;
-        }}
+def main():
+    """Main application"""
 
-        .stFileUploader > div {{
-            border: none !important;
-            background: transparent !important;
-        }}
+    # Initialize and apply theme
+    theme_manager.apply_theme_css()
 
-        .stFileUploader > div > div {{
-            border: 2px dashed {theme_config['accent_color']}80 !important;
-            border-radius: 24px !important;
-            background: linear-gradient(135deg, {theme_config['card_bg']}90 0%, {theme_config['secondary_bg']}70 100%) !important;
-            backdrop-filter: blur(20px) !important;
-            padding: 3rem 2rem !important;
-            text-align: center !important;
-            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-            position: relative !important;
-            overflow: hidden !important;
-            box-shadow: 0 8px 32px {theme_config['shadow']} !important;
-            min-height: 180px !important;
-            display: flex !important;
-            flex-direction: column !important;
-            justify-content: center !important;
-            align-items: center !important;
-        }}
+    # Add theme toggle to sidebar with enhanced styling
+    with st.sidebar:
+        st.markdown("---")
 
-        .stFileUploader > div > div:hover {{
-            border-color: {theme_config['accent_color']} !important;
-            background: linear-gradient(135deg, {theme_config['card_bg']}95 0%, {theme_config['secondary_bg']}80 100%) !important;
-            transform: translateY(-4px) !important;
-            box-shadow: 0 16px 48px {theme_config['shadow_hover']} !important;
-        }}
+        # Theme settings header with proper styling
+        current_theme = theme_manager.get_current_theme()
+        theme_config = theme_manager.get_theme_config(current_theme)
 
-        /* Drag states with enhanced visual feedback */
-        .stFileUploader > div > div[data-testid="stFileUploaderDropzone"] {{
-            border: 2px dashed {theme_config['accent_color']}80 !important;
-            border-radius: 24px !important;
-            background: linear-gradient(135deg, {theme_config['card_bg']}90 0%, {theme_config['secondary_bg']}70 100%) !important;
-            backdrop-filter: blur(20px) !important;
-            padding: 3rem 2rem !important;
-            text-align: center !important;
-            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-            min-height: 180px !important;
-            display: flex !important;
-            align-items: center !important;
-            justify-content: center !important;
-            flex-direction: column !important;
-            box-shadow: 0 8px 32px {theme_config['shadow']} !important;
-        }}
+        st.markdown(f"""
+        <h3 style="color: {theme_config['text_primary']} !important; font-weight: 600; margin-bottom: 1rem;">
+            🎨 Theme Settings
+        </h3>
+        """, unsafe_allow_html=True)
 
-        .stFileUploader > div > div[data-testid="stFileUploaderDropzone"]:hover {{
-            border-color: {theme_config['accent_color']} !important;
-            background: linear-gradient(135deg, {theme_config['card_bg']}95 0%, {theme_config['secondary_bg']}80 100%) !important;
-            transform: translateY(-4px) !important;
-            box-shadow: 0 16px 48px {theme_config['shadow_hover']} !important;
-        }}
+        theme_manager.create_theme_toggle()
 
-        /* Active drag state */
-        .stFileUploader > div > div[data-testid="stFileUploaderDropzone"].st-emotion-cache-1kyxreq {{
-            border-color: {theme_config['success_color']} !important;
-            background: linear-gradient(135deg, {theme_config['success_color']}15 0%, {theme_config['card_bg']}90 100%) !important;
-            box-shadow: 0 16px 48px {theme_config['success_color']}30 !important;
-            transform: scale(1.02) !important;
-        }}
+        # Show current theme indicator with proper theming
+        st.markdown(f"""
+        <div style="
+            background: {theme_config['accent_color']};
+            color: white;
+            padding: 0.5rem;
+            border-radius: 8px;
+            text-align: center;
+            margin: 0.5rem 0;
+            font-weight: 600;
+            border: 1px solid {theme_config['border_color']};
+        ">
+            {theme_config['icon']} {theme_config['name']} Active
+        </div>
+        """, unsafe_allow_html=True)
 
-        /* File uploader text styling */
-        .stFileUploader label, .stFileUploader div, .stFileUploader span {{
-            color: {theme_config['text_primary']} !important;
-            font-weight: 500 !important;
-        }}
-        </style>
 
-        <script>
-        // Enhanced drag and drop with smooth animations
-        document.addEventListener('DOMContentLoaded', function() {{
-            const fileUploaders = document.querySelectorAll('[data-testid="stFileUploaderDropzone"]');
-
-            fileUploaders.forEach(uploader => {{
-                uploader.addEventListener('dragenter', function(e) {{
-                    e.preventDefault();
-                    this.style.borderColor = '{theme_config['success_color']}';
-                    this.style.background = 'linear-gradient(135deg, {theme_config['success_color']}15 0%, {theme_config['card_bg']}90 100%)';
-                    this.style.transform = 'scale(1.02)';
-                    this.style.boxShadow = '0 16px 48px {theme_config['success_color']}30';
-                }});
-
-                uploader.addEventListener('dragleave', function(e) {{
-                    e.preventDefault();
-                    this.style.borderColor = '{theme_config['accent_color']}80';
-                    this.style.background = 'linear-gradient(135deg, {theme_config['card_bg']}90 0%, {theme_config['secondary_bg']}70 100%)';
-                    this.style.transform = 'scale(1)';
-                    this.style.boxShadow = '0 8px 32px {theme_config['shadow']}';
-                }});
-
-                uploader.addEventListener('drop', function(e) {{
-                    this.style.borderColor = '{theme_config['accent_color']}80';
-                    this.style.background = 'linear-gradient(135deg, {theme_config['card_bg']}90 0%, {theme_config['secondary_bg']}70 100%)';
-                    this.style.transform = 'scale(1)';
-                    this.style.boxShadow = '0 8px 32px {theme_config['shadow']}';
-                }});
-            }});
-        }});
-        </script>
-        """, unsafe_allow_html=True)
 
-        # Modern file uploader with enhanced styling
-        uploaded_video = st.file_uploader(
-            "🎬 **Drag and drop your video here** or click to browse",
-            type=['mp4', 'avi', 'mov', 'mkv'],
-            help="Upload your video file for ultra-fast PPE compliance analysis • Supported: MP4, AVI, MOV, MKV • Max 200MB",
-            label_visibility="collapsed"
-        )
+    # Enhanced ultra-modern header with status
+    webcam_status = "🟢 Available" if WEBCAM_AVAILABLE else "🔴 Unavailable"
+    model_status = "🟢 Ready" if st.session_state.model_loaded else "🔴 Error"
 
-        # Show modern upload tips when no file is selected
-        if not uploaded_video:
-            st.markdown(f"""
-            <div style="
-                margin-top: 1.5rem;
-                padding: 2rem;
-                background: linear-gradient(135deg, {theme_config['accent_color']}08 0%, {theme_config['info_color']}05 100%);
-                backdrop-filter: blur(10px);
-                border-radius: 20px;
-                border: 1px solid {theme_config['border_color']};
-                box-shadow: 0 4px 20px {theme_config['shadow']};
-            ">
-                <div style="display: flex; align-items: center; margin-bottom: 1rem;">
-                    <div style="
-                        background: linear-gradient(135deg, {theme_config['accent_color']}, {theme_config['info_color']});
-                        -webkit-background-clip: text;
-                        -webkit-text-fill-color: transparent;
-                        background-clip: text;
-                        font-size: 1.5rem;
-                        margin-right: 0.8rem;
-                    ">💡</div>
-                    <h4 style="
-                        color: {theme_config['text_primary']};
-                        margin: 0;
-                        font-weight: 700;
-                        font-size: 1.3rem;
-                    ">Upload Guidelines for Best Results</h4>
-                </div>
-                <div style="
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-                    gap: 1rem;
-                    margin-top: 1rem;
-                ">
-                    <div style="
-                        background: {theme_config['card_bg']}80;
-                        backdrop-filter: blur(10px);
-                        padding: 1.2rem;
-                        border-radius: 12px;
-                        border: 1px solid {theme_config['border_color']};
-                    ">
-                        <div style="color: {theme_config['success_color']}; font-size: 1.2rem; margin-bottom: 0.5rem;">🎯</div>
-                        <strong style="color: {theme_config['text_primary']};">Best Quality:</strong>
-                        <p style="color: {theme_config['text_secondary']}; margin: 0.3rem 0 0 0; font-size: 0.9rem;">
-                            Use 1080p or higher resolution videos for optimal detection accuracy
-                        </p>
-                    </div>
-                    <div style="
-                        background: {theme_config['card_bg']}80;
-                        backdrop-filter: blur(10px);
-                        padding: 1.2rem;
-                        border-radius: 12px;
-                        border: 1px solid {theme_config['border_color']};
-                    ">
-                        <div style="color: {theme_config['warning_color']}; font-size: 1.2rem; margin-bottom: 0.5rem;">💡</div>
-                        <strong style="color: {theme_config['text_primary']};">Good Lighting:</strong>
-                        <p style="color: {theme_config['text_secondary']}; margin: 0.3rem 0 0 0; font-size: 0.9rem;">
-                            Ensure people and PPE equipment are clearly visible
-                        </p>
-                    </div>
-                    <div style="
-                        background: {theme_config['card_bg']}80;
-                        backdrop-filter: blur(10px);
-                        padding: 1.2rem;
-                        border-radius: 12px;
-                        border: 1px solid {theme_config['border_color']};
-                    ">
-                        <div style="color: {theme_config['info_color']}; font-size: 1.2rem; margin-bottom: 0.5rem;">📹</div>
-                        <strong style="color: {theme_config['text_primary']};">Stable Footage:</strong>
-                        <p style="color: {theme_config['text_secondary']}; margin: 0.3rem 0 0 0; font-size: 0.9rem;">
-                            Avoid shaky or blurry videos for better analysis
-                        </p>
-                    </div>
-                    <div style="
-                        background: {theme_config['card_bg']}80;
-                        backdrop-filter: blur(10px);
-                        padding: 1.2rem;
-                        border-radius: 12px;
-                        border: 1px solid {theme_config['border_color']};
-                    ">
-                        <div style="color: {theme_config['accent_color']}; font-size: 1.2rem; margin-bottom: 0.5rem;">🔄</div>
-                        <strong style="color: {theme_config['text_primary']};">Multiple Angles:</strong>
-                        <p style="color: {theme_config['text_secondary']}; margin: 0.3rem 0 0 0; font-size: 0.9rem;">
-                            Include different viewpoints for comprehensive analysis
-                        </p>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        if uploaded_video:
-            # Validate file
-            is_valid, error = validate_video(uploaded_video)
-            if not is_valid:
-                st.error(f"❌ {error}")
-                st.stop()
+    st.markdown(f"""
+    <div class="ultra-header">
+        <h1>🦺 PPE Monitor Pro</h1>
+        <p>Ultra-fast AI workplace safety monitoring with real-time analytics</p>
+        <div style="margin-top: 1rem; font-size: 0.9rem; opacity: 0.9;">
+            <span style="margin-right: 2rem;">🤖 AI Model: {model_status}</span>
+            <span style="margin-right: 2rem;">📹 Live Detection: {webcam_status}</span>
+            <span>⚡ Processing: Ultra-Fast Mode</span>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
 
-            # File info with modern success message
-            file_size = uploaded_video.size / (1024 * 1024)
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, {theme_config['success_color']}15 0%, {theme_config['success_color']}05 100%);
-                border: 1px solid {theme_config['success_color']}40;
-                border-radius: 16px;
-                padding: 1.2rem;
-                margin: 1.5rem 0;
-                display: flex;
-                align-items: center;
-                gap: 1rem;
-                backdrop-filter: blur(10px);
-                box-shadow: 0 4px 20px {theme_config['shadow']};
-            ">
-                <div style="
-                    background: {theme_config['success_color']};
-                    color: white;
-                    border-radius: 50%;
-                    width: 40px;
-                    height: 40px;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    font-size: 1.2rem;
-                    font-weight: bold;
-                ">✓</div>
-                <div>
-                    <h4 style="color: {theme_config['text_primary']}; margin: 0; font-weight: 600;">
-                        Video uploaded successfully!
-                    </h4>
-                    <p style="color: {theme_config['text_secondary']}; margin: 0.3rem 0 0 0; font-size: 0.9rem;">
-                        📁 {uploaded_video.name} • 📊 {file_size:.1f} MB • 🚀 Ready for processing
-                    </p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
 
-            # Add a small delay to show the success message
-            time.sleep(0.1)
+    
+    # Load detection engine
+    if st.session_state.detection_engine is None:
+        with st.spinner("🔄 Loading AI model..."):
+            engine, loaded = load_detection_engine()
+            st.session_state.detection_engine = engine
+            st.session_state.model_loaded = loaded
+    
+    if not st.session_state.model_loaded:
+        st.error("❌ AI model not available. Please check your model file.")
+        st.stop()
+    
+    # Speed sidebar
+    settings = create_speed_sidebar()
+
+    # Initialize help modal state
+    if 'show_help_modal' not in st.session_state:
+        st.session_state.show_help_modal = False
 
-            # Modern two-column layout
-            col1, col2 = st.columns([2.2, 1], gap="large")
+    # Help modal using Streamlit dialog
+    if st.session_state.show_help_modal:
+        # Create modal using Streamlit's dialog
+        @st.dialog("ℹ️ Help & Status Guide")
+        def show_help_dialog():
+            # Getting Started section
+            st.markdown("### 🚀 Getting Started")
+            st.markdown("""
+            - **Live Detection:** Click START to begin camera detection
+            - **Video Processing:** Upload MP4/AVI files for analysis
+            - **Image Analysis:** Upload JPG/PNG for instant detection
+            - **Results History:** View and download previous analyses
+            """)
 
-            with col1:
-                # Video preview with modern styling
-                st.markdown(f"""
-                <div style="
-                    background: {theme_config['card_bg']};
-                    border-radius: 20px;
-                    padding: 1rem;
-                    border: 1px solid {theme_config['border_color']};
-                    box-shadow: 0 8px 32px {theme_config['shadow']};
-                    backdrop-filter: blur(10px);
-                ">
-                    <h4 style="
-                        color: {theme_config['text_primary']};
-                        margin: 0 0 1rem 0;
-                        font-weight: 600;
-                        display: flex;
-                        align-items: center;
-                        gap: 0.5rem;
-                    ">
-                        📹 Video Preview
-                    </h4>
-                </div>
-                """, unsafe_allow_html=True)
-                st.video(uploaded_video)
+            st.markdown("---")
 
-            with col2:
+            # Analytics Timeline section
+            st.markdown("### 📊 Analytics Timeline")
+            st.markdown("""
+            - **0-3 frames:** 🔄 Initializing detection engine
+            - **3-10 frames:** 📊 Building analytics report
+            - **10+ frames:** ✅ Full analytics available
+            - **30+ frames:** 🎯 High quality analytics & insights
+            """)
 
-                # Speed info display with modern design
-                speed_boost = settings['skip']
-                estimated_speed = f"{speed_boost}x faster"
+            st.markdown("---")
 
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, {theme_config['accent_color']}15 0%, {theme_config['info_color']}10 100%);
-                    border: 1px solid {theme_config['accent_color']}40;
-                    border-radius: 16px;
-                    padding: 1.5rem;
-                    text-align: center;
-                    margin-bottom: 1.5rem;
-                    backdrop-filter: blur(10px);
-                    box-shadow: 0 4px 20px {theme_config['shadow']};
-                ">
-                    <div style="
-                        font-size: 2.5rem;
-                        font-weight: 800;
-                        background: linear-gradient(135deg, {theme_config['accent_color']}, {theme_config['info_color']});
-                        -webkit-background-clip: text;
-                        -webkit-text-fill-color: transparent;
-                        background-clip: text;
-                        margin-bottom: 0.5rem;
-                    ">{estimated_speed}</div>
-                    <div style="
-                        color: {theme_config['text_secondary']};
-                        font-weight: 600;
-                        font-size: 1rem;
-                        text-transform: uppercase;
-                        letter-spacing: 1px;
-                    ">Processing Speed</div>
-                    <div style="
-                        color: {theme_config['text_muted']};
-                        font-size: 0.85rem;
-                        margin-top: 0.5rem;
-                    ">Optimized for ultra-fast analysis</div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Detection Colors section
+            st.markdown("### 🎨 Detection Colors")
+            st.markdown("""
+            - 🟢 **Green:** PPE present (compliant)
+            - 🔴 **Red:** PPE missing (violation)
+            - 🟡 **Yellow:** Person detected
+            - 🟠 **Orange:** Safety equipment
+            - 🟣 **Purple:** Machinery/vehicles
+            """)
 
-                # Modern process button
-                if not st.session_state.processing:
-                    # Custom styled button
-                    st.markdown(f"""
-                    <style>
-                    .process-button {{
-                        background: linear-gradient(135deg, {theme_config['accent_color']} 0%, {theme_config['info_color']} 100%);
-                        color: white;
-                        border: none;
-                        border-radius: 16px;
-                        padding: 1rem 2rem;
-                        font-size: 1.1rem;
-                        font-weight: 700;
-                        text-transform: uppercase;
-                        letter-spacing: 1px;
-                        cursor: pointer;
-                        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-                        box-shadow: 0 8px 32px {theme_config['accent_color']}40;
-                        width: 100%;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        gap: 0.8rem;
-                        position: relative;
-                        overflow: hidden;
-                    }}
+            st.markdown("---")
 
-                    .process-button:hover {{
-                        transform: translateY(-2px);
-                        box-shadow: 0 12px 40px {theme_config['accent_color']}60;
-                    }}
+            # Control Functions section
+            st.markdown("### 🎛️ Control Functions")
+            st.markdown("""
+            - **🔄 Reset:** Complete system reset
+            - **📊 Refresh:** Force immediate display update
+            - **⏸️ Pause/▶️ Resume:** Pause/resume analytics
+            - **💾 Export:** Download session statistics
+            - **🚀 Process:** Start video/image analysis
+            """)
 
-                    .process-button::before {{
-                        content: '';
-                        position: absolute;
-                        top: 0;
-                        left: -100%;
-                        width: 100%;
-                        height: 100%;
-                        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-                        transition: left 0.5s;
-                    }}
+            st.markdown("---")
 
-                    .process-button:hover::before {{
-                        left: 100%;
-                    }}
-                    </style>
-                    """, unsafe_allow_html=True)
+            # Performance Info section
+            st.markdown("### ⏱️ Performance Info")
+            st.markdown("""
+            - **Basic stats:** Available immediately
+            - **Analytics report:** Ready in ~3-5 seconds
+            - **High quality data:** Achieved after ~30 seconds
+            - **Ultra-fast mode:** Up to 8x processing speed
+            """)
 
-                    if st.button("🚀 PROCESS VIDEO", type="primary", use_container_width=True, key="process_video_btn"):
-                        st.session_state.processing = True
+            st.markdown("---")
 
-                        # Save uploaded file
-                        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp:
-                            tmp.write(uploaded_video.read())
-                            video_path = tmp.name
+            # System Status section
+            st.markdown("### 🔧 System Status")
+            st.markdown(f"""
+            - **AI Model:** {model_status}
+            - **Live Detection:** {webcam_status}
+            - **Processing Mode:** Ultra-Fast
+            - **Version:** PPE Monitor Pro v2.1
+            """)
 
-                        output_path = video_path.replace('.mp4', '_processed.mp4')
+            st.markdown("---")
 
-                        # Process with cancellation
-                        results = process_video_with_cancellation(video_path, output_path, settings)
+            # Close button
+            _, col2, _ = st.columns([1, 1, 1])
+            with col2:
+                if st.button("✕ Close", type="primary", use_container_width=True):
+                    st.session_state.show_help_modal = False
+                    st.rerun()
 
-                        # Results are now displayed by the processing function
-                        # and stored in session state for persistence
+        show_help_dialog()
+
+    # Main interface
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(["📹 Live Detection", "🎥 Ultra-Fast Video", "📷 Instant Analysis", "📋 Results History", "📊 Export Session Data", "👤 Face Recognition", "📊 Live Attendance"])
+    
+    with tab1:
+        if WEBCAM_AVAILABLE:
+            # Create the main webcam interface
+            webrtc_ctx = create_webcam_interface(st.session_state.detection_engine, settings)
 
-                        # Cleanup
-                        for path in [video_path, output_path]:
-                            if os.path.exists(path):
-                                try:
-                                    os.unlink(path)
-                                except:
-                                    pass
+            # Add analytics section below the webcam interface
+            st.markdown("---")
 
-                        st.session_state.processing = False
-                        st.rerun()
+            # Enhanced analytics with better error handling and status display
+            if webrtc_ctx and hasattr(st.session_state, 'webcam_detector'):
+                try:
+                    # Check if camera is active
+                    camera_active = webrtc_ctx.state.playing
 
-                else:
-                    # Processing indicator with modern design
-                    st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(135deg, {theme_config['warning_color']}15 0%, {theme_config['warning_color']}05 100%);
-                        border: 1px solid {theme_config['warning_color']}40;
-                        border-radius: 16px;
-                        padding: 1.5rem;
-                        text-align: center;
-                        backdrop-filter: blur(10px);
-                        box-shadow: 0 4px 20px {theme_config['shadow']};
-                    ">
-                        <div style="
-                            font-size: 2rem;
-                            margin-bottom: 0.8rem;
-                            animation: spin 2s linear infinite;
-                        ">🔄</div>
-                        <div style="
-                            color: {theme_config['text_primary']};
-                            font-weight: 600;
-                            font-size: 1.1rem;
-                            margin-bottom: 0.5rem;
-                        ">Processing in Progress</div>
-                        <div style="
-                            color: {theme_config['text_secondary']};
-                            font-size: 0.9rem;
-                        ">Please wait while we analyze your video...</div>
-                    </div>
+                    # Track camera state changes and manage session accordingly
+                    if 'previous_camera_state_main' not in st.session_state:
+                        st.session_state.previous_camera_state_main = False
 
-                    <style>
-                    @keyframes spin {{
-                        from {{ transform: rotate(0deg); }}
-                        to {{ transform: rotate(360deg); }}
-                    }}
-                    </style>
-                    """, unsafe_allow_html=True)
+                    # Detect camera state changes
+                    if camera_active != st.session_state.previous_camera_state_main:
+                        if camera_active:
+                            # Camera just started
+                            st.session_state.webcam_detector.start_session()
+                        else:
+                            # Camera just stopped
+                            st.session_state.webcam_detector.stop_session()
+                        st.session_state.previous_camera_state_main = camera_active
+
+                    if camera_active:
+                        # Get latest stats with error handling
+                        try:
+                            latest_stats = st.session_state.webcam_detector.get_latest_stats()
+                        except Exception as e:
+                            st.error(f"Error retrieving analytics: {str(e)}")
+                            latest_stats = None
 
-        # Show previous results if available with modern layout
-        if st.session_state.show_results and st.session_state.video_results:
+                        if latest_stats and latest_stats['frame_count'] > 0:
+                            # Enhanced analytics readiness status
+                            frame_count = latest_stats['frame_count']
+                            if frame_count < 3:
+                                st.info(f"🔄 **Initializing Analytics...** ({frame_count}/3 frames)")
+                                progress = frame_count / 3
+                                st.progress(progress, text=f"Processing frame {frame_count}")
+                            elif frame_count < 10:
+                                st.warning(f"📊 **Building Report...** ({frame_count}/10 frames for full analytics)")
+                                progress = frame_count / 10
+                                st.progress(progress, text=f"Analytics quality: {progress*100:.0f}%")
+                            else:
+                                st.success("✅ **Full Analytics Available**")
 
+                        # Show the comprehensive analytics
+                        create_webcam_analytics(st.session_state.webcam_detector)
 
-            # Modern action buttons with enhanced styling
-            st.markdown(f"""
-            <style>
-            .modern-action-grid {{
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-                gap: 1.5rem;
-                margin: 2rem 0;
-            }}
+                    else:
+                        st.info("📹 **Start the camera to see live analytics**")
 
-            .modern-action-card {{
-                background: {theme_config['card_bg']};
-                border: 1px solid {theme_config['border_color']};
-                border-radius: 20px;
-                padding: 1.5rem;
-                text-align: center;
-                transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-                box-shadow: 0 4px 20px {theme_config['shadow']};
-                backdrop-filter: blur(10px);
-                position: relative;
-                overflow: hidden;
-            }}
+                        # Enhanced last session data display
+                        try:
+                            latest_stats = st.session_state.webcam_detector.get_latest_stats()
+                            if latest_stats and latest_stats['frame_count'] > 0:
+                                st.markdown("---")
+                                st.markdown("### 📊 **Last Session Summary**")
 
-            .modern-action-card:hover {{
-                transform: translateY(-4px);
-                box-shadow: 0 12px 40px {theme_config['shadow_hover']};
-            }}
+                                # Enhanced metrics display
+                                col1, col2, col3, col4 = st.columns(4)
+                                with col1:
+                                    st.metric("Frames Processed", f"{latest_stats['frame_count']:,}")
+                                with col2:
+                                    duration = latest_stats.get('session_duration', 0)
+                                    minutes = int(duration // 60)
+                                    seconds = int(duration % 60)
+                                    st.metric("Duration", f"{minutes:02d}:{seconds:02d}")
+                                with col3:
+                                    st.metric("Final Compliance", f"{latest_stats['compliance_rate']:.0f}%")
+                                with col4:
+                                    total_people = latest_stats.get('total_people_session', 0)
+                                    st.metric("Total People", f"{total_people:,}")
 
-            .action-icon {{
-                font-size: 2.5rem;
-                margin-bottom: 1rem;
-                display: block;
-            }}
+                                # Additional session info
+                                if latest_stats.get('avg_compliance_rate', 0) > 0:
+                                    avg_compliance = latest_stats['avg_compliance_rate']
+                                    if avg_compliance >= 90:
+                                        st.success(f"🟢 **Excellent Session** - {avg_compliance:.1f}% average compliance")
+                                    elif avg_compliance >= 75:
+                                        st.info(f"✅ **Good Session** - {avg_compliance:.1f}% average compliance")
+                                    elif avg_compliance >= 50:
+                                        st.warning(f"⚠️ **Fair Session** - {avg_compliance:.1f}% average compliance")
+                                    else:
+                                        st.error(f"❌ **Poor Session** - {avg_compliance:.1f}% average compliance")
+                        except Exception as e:
+                            st.warning(f"Could not retrieve last session data: {str(e)}")
 
-            .action-title {{
-                color: {theme_config['text_primary']};
-                font-weight: 700;
-                font-size: 1.1rem;
-                margin-bottom: 0.8rem;
-            }}
+                except Exception as e:
+                    st.error(f"Analytics system error: {str(e)}")
 
-            .action-description {{
-                color: {theme_config['text_secondary']};
-                font-size: 0.9rem;
-                margin-bottom: 1.5rem;
-                line-height: 1.5;
-            }}
+            else:
+                st.info("📊 **Analytics will appear here once you start the camera**")
 
-            @media (max-width: 768px) {{
-                .modern-action-grid {{
-                    grid-template-columns: 1fr;
-                    gap: 1rem;
-                }}
-                .modern-action-card {{
-                    padding: 1.2rem;
-                }}
-            }}
-            </style>
-            """, unsafe_allow_html=True)
+                # Enhanced preview of analytics features
+                with st.expander("📈 **Preview: Available Analytics Features**", expanded=False):
+                    col_preview1, col_preview2 = st.columns(2)
 
-            col_btn1, col_btn2, col_btn3 = st.columns(3, gap="large")
+                    with col_preview1:
+                        st.markdown("""
+                        **🔴 Real-time Monitoring:**
+                        - 👥 People detection count and trends
+                        - ⚠️ PPE violation tracking and alerts
+                        - 📊 Live compliance rate calculation
+                        - 🎥 Processing performance metrics
 
-            with col_btn1:
-                st.markdown(f"""
-                <div class="modern-action-card">
-                    <div class="action-icon" style="color: {theme_config['accent_color']};">🔄</div>
-                    <div class="action-title">Process New Video</div>
-                    <div class="action-description">Clear current results and start fresh analysis</div>
-                </div>
-                """, unsafe_allow_html=True)
+                        **📈 Session Statistics:**
+                        - ⏱️ Session duration and frame count
+                        - 📊 Average compliance over time
+                        - 🎯 Detection consistency analysis
+                        - ⚡ Real-time processing performance
+                        """)
 
-                if st.button("🔄 Process New Video",
-                           use_container_width=True,
-                           type="primary",
-                           help="Clear current results and process a new video",
-                           key="new_video_btn"):
-                    # Clear previous results
-                    st.session_state.show_results = False
-                    st.session_state.show_results_in_tabs = False
-                    st.session_state.video_results = None
-                    st.session_state.processed_video_path = None
-                    st.session_state.current_video_path = None
-
-                    # Show success message with modern styling
-                    st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(135deg, {theme_config['success_color']}15 0%, {theme_config['success_color']}05 100%);
-                        border: 1px solid {theme_config['success_color']}40;
-                        border-radius: 12px;
-                        padding: 1rem;
-                        margin: 1rem 0;
-                        text-align: center;
-                        color: {theme_config['text_primary']};
-                        font-weight: 600;
-                    ">
-                        ✅ Ready for new video processing!
-                    </div>
-                    """, unsafe_allow_html=True)
-                    time.sleep(0.5)
-                    st.rerun()
+                    with col_preview2:
+                        st.markdown("""
+                        **🎯 Performance Indicators:**
+                        - ✅ Detection accuracy rates
+                        - 🔄 Frame processing speed (FPS)
+                        - 📊 Compliance trend analysis
+                        - 🎯 System performance metrics
 
-            with col_btn2:
-                st.markdown(f"""
-                <div class="modern-action-card">
-                    <div class="action-icon" style="color: {theme_config['info_color']};">👁️</div>
-                    <div class="action-title">View Results Again</div>
-                    <div class="action-description">Redisplay the comprehensive analysis results</div>
-                </div>
-                """, unsafe_allow_html=True)
+                        **💾 Export Capabilities:**
+                        - 📄 JSON reports with complete data
+                        - 📊 CSV files for spreadsheet analysis
+                        - 📋 Executive summary reports
+                        - 📈 Timeline data and trends
+                        """)
+        else:
+            st.warning("⚠️ **Webcam features not available**")
+            st.info("Install streamlit-webrtc to enable live detection:")
+            st.code("pip install streamlit-webrtc", language="bash")
 
-                if st.button("👁️ View Results Again",
-                           use_container_width=True,
-                           type="secondary",
-                           help="Redisplay the current analysis results",
-                           key="view_results_btn"):
-                    # Show results again using comprehensive viewer with improved file handling
-                    if st.session_state.video_results:
-                        video_path = st.session_state.processed_video_path
-
-                        # Check if video file still exists, if not recreate it
-                        if not video_path or not os.path.exists(video_path):
-                            # Try to recreate temporary file from session data
-                            if hasattr(st.session_state, 'processed_video_data') and st.session_state.processed_video_data:
-                                try:
-                                    with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-                                        tmp_file.write(st.session_state.processed_video_data)
-                                        video_path = tmp_file.name
-                                    st.session_state.processed_video_path = video_path
-                                    st.info("🔄 Video file recreated from session data")
-                                except Exception as e:
-                                    st.error(f"❌ Could not recreate video file: {str(e)}")
-                                    video_path = None
-                            else:
-                                st.warning("⚠️ Video data no longer available in session. Showing results without video.")
-                                video_path = None
+            # Show what features would be available
+            st.markdown("### 🔮 Available Features (After Installation)")
 
-                        # Set flag to show results in broader tabs below
-                        st.session_state.show_results_in_tabs = True
-                        st.session_state.current_video_path = video_path
-                    else:
-                        st.error("❌ Previous results no longer available")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("""
+                **🎥 Live Detection:**
+                - Real-time PPE compliance monitoring
+                - Webcam integration with detection overlay
+                - Live violation alerts and notifications
+                - Adjustable detection sensitivity
+                """)
 
-            with col_btn3:
-                st.markdown(f"""
-                <div class="modern-action-card">
-                    <div class="action-icon" style="color: {theme_config['danger_color']};">🗑️</div>
-                    <div class="action-title">Clear Results</div>
-                    <div class="action-description">Remove current results from memory</div>
-                </div>
-                """, unsafe_allow_html=True)
+            with col2:
+                st.markdown("""
+                **📊 Live Analytics:**
+                - Real-time compliance statistics
+                - People counting and tracking
+                - Session performance metrics
+                - Exportable detection reports
+                """)
+    
+    with tab2:
+        # Get current theme for consistent styling
+        current_theme, theme_config = get_active_theme()
 
-                if st.button("🗑️ Clear Results",
-                           use_container_width=True,
-                           help="Remove current results from memory",
-                           key="clear_results_btn"):
-                    # Clear results
-                    st.session_state.show_results = False
-                    st.session_state.show_results_in_tabs = False
-                    st.session_state.video_results = None
-                    st.session_state.processed_video_path = None
-                    st.session_state.current_video_path = None
-
-                    # Show success message with modern styling
-                    st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(135deg, {theme_config['success_color']}15 0%, {theme_config['success_color']}05 100%);
-                        border: 1px solid {theme_config['success_color']}40;
-                        border-radius: 12px;
-                        padding: 1rem;
-                        margin: 1rem 0;
-                        text-align: center;
-                        color: {theme_config['text_primary']};
-                        font-weight: 600;
-                    ">
-                        ✅ Results cleared successfully!
-                    </div>
-                    """, unsafe_allow_html=True)
-                    time.sleep(0.5)
-                    st.rerun()
+        # Modern header with glassmorphism effect
+        st.markdown(VIDEO_TAB_HEADER_TMPL.substitute(theme_config), unsafe_allow_html=True)
 
-            # Display results in beautiful broader tabs below action buttons
-            if hasattr(st.session_state, 'show_results_in_tabs') and st.session_state.show_results_in_tabs and st.session_state.video_results:
-                st.markdown("---")
+        # Enhanced drag & drop section with modern glassmorphism design, rendered once per theme
+        st.markdown(render_video_upload_css(current_theme), unsafe_allow_html=True)
 
-                # Enhanced broader tab styling
-                st.markdown(f"""
-                <style>
-                /* Enhanced broader tab styling for detection results */
-                .detection-results-tabs .stTabs [data-baseweb="tab-list"] {{
-                    gap: 12px;
-                    background: linear-gradient(135deg, {theme_config['card_bg']}95 0%, {theme_config['secondary_bg']}80 100%);
-                    border-radius: 20px;
-                    padding: 16px;
-                    margin: 2rem 0;
-                    box-shadow: 0 8px 32px {theme_config['shadow']};
-                    backdrop-filter: blur(20px);
-                    border: 1px solid {theme_config['border_color']};
-                }}
-
-                .detection-results-tabs .stTabs [data-baseweb="tab"] {{
-                    height: 60px;
-                    min-width: 200px;
-                    padding: 0 2rem;
-                    background: linear-gradient(135deg, {theme_config['accent_color']}10 0%, {theme_config['accent_color']}05 100%);
-                    border: 1px solid {theme_config['accent_color']}30;
-                    border-radius: 16px;
-                    color: {theme_config['text_primary']};
-                    font-weight: 600;
-                    font-size: 1rem;
-                    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    text-align: center;
-                    white-space: nowrap;
-                    overflow: hidden;
-                    text-overflow: ellipsis;
-                }}
-
-                .detection-results-tabs .stTabs [data-baseweb="tab"]:hover {{
-                    background: linear-gradient(135deg, {theme_config['accent_color']}20 0%, {theme_config['accent_color']}10 100%);
-                    border-color: {theme_config['accent_color']}50;
-                    transform: translateY(-2px);
-                    box-shadow: 0 6px 20px {theme_config['shadow']};
-                }}
-
-                .detection-results-tabs .stTabs [data-baseweb="tab"][aria-selected="true"] {{
-                    background: linear-gradient(135deg, {theme_config['accent_color']} 0%, {theme_config['accent_color']}80 100%);
-                    border-color: {theme_config['accent_color']};
-                    color: white;
-                    box-shadow: 0 8px 25px {theme_config['accent_color']}40;
-                    transform: translateY(-3px);
-                }}
+        # Modern file uploader with enhanced styling
+        uploaded_video = st.file_uploader(
+            "🎬 **Drag and drop your video here** or click to browse",
+            type=['mp4', 'avi', 'mov', 'mkv'],
+            help="Upload your video file for ultra-fast PPE compliance analysis • Supported: MP4, AVI, MOV, MKV • Max 200MB",
+            label_visibility="collapsed"
+        )
 
-                .detection-results-tabs .stTabs [data-baseweb="tab-panel"] {{
-                    padding: 2rem;
-                    background: {theme_config['card_bg']};
-                    border-radius: 20px;
-                    border: 1px solid {theme_config['border_color']};
-                    box-shadow: 0 4px 20px {theme_config['shadow']};
-                    margin-top: 1rem;
-                }}
+        # Show modern upload tips when no file is selected
+        if not uploaded_video:
+            release_upload_preview()
+            st.markdown(UPLOAD_GUIDELINES_TMPL.substitute(theme_config), unsafe_allow_html=True)
+        
+        if uploaded_video:
+            # Validate file
+            is_valid, error = validate_video(uploaded_video)
+            if not is_valid:
+                st.error(f"❌ {error}")
+                st.stop()
 
-                /* Perfect text fitting in metric cards */
-                .detection-results-tabs .metric-card {{
-                    background: linear-gradient(135deg, var(--card-color, {theme_config['accent_color']})15 0%, var(--card-color, {theme_config['accent_color']})05 100%);
-                    border: 1px solid var(--card-color, {theme_config['accent_color']})30;
-                    border-radius: 16px;
-                    padding: 1.5rem;
-                    text-align: center;
-                    transition: all 0.3s ease;
-                    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                    height: 120px;
+            # File info with modern success message
+            file_size = uploaded_video.size * INV_MB
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(135deg, {theme_config['success_color']}15 0%, {theme_config['success_color']}05 100%);
+                border: 1px solid {theme_config['success_color']}40;
+                border-radius: 16px;
+                padding: 1.2rem;
+                margin: 1.5rem 0;
+                display: flex;
+                align-items: center;
+                gap: 1rem;
+                backdrop-filter: blur(10px);
+                box-shadow: 0 4px 20px {theme_config['shadow']};
+            ">
+                <div style="
+                    background: {theme_config['success_color']};
+                    color: white;
+                    border-radius: 50%;
+                    width: 40px;
+                    height: 40px;
                     display: flex;
-                    flex-direction: column;
-                    justify-content: center;
                     align-items: center;
-                }}
-
-                .detection-results-tabs .metric-card:hover {{
-                    transform: translateY(-4px);
-                    box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-                    border-color: var(--card-color, {theme_config['accent_color']})50;
-                }}
-
-                .detection-results-tabs .metric-value {{
-                    font-size: 2.2rem;
-                    font-weight: 800;
-                    color: var(--card-color, {theme_config['accent_color']});
-                    margin-bottom: 0.5rem;
-                    line-height: 1;
-                }}
-
-                .detection-results-tabs .metric-label {{
-                    font-size: 0.9rem;
-                    color: {theme_config['text_secondary']};
-                    font-weight: 600;
-                    text-transform: uppercase;
-                    letter-spacing: 0.5px;
-                    line-height: 1.2;
-                }}
-
-                /* Responsive design for broader tabs */
-                @media (max-width: 1200px) {{
-                    .detection-results-tabs .stTabs [data-baseweb="tab"] {{
-                        min-width: 160px;
-                        padding: 0 1.5rem;
-                        font-size: 0.9rem;
-                    }}
-                }}
-
-                @media (max-width: 768px) {{
-                    .detection-results-tabs .stTabs [data-baseweb="tab-list"] {{
-                        gap: 8px;
-                        padding: 12px;
-                        flex-wrap: wrap;
-                    }}
-
-                    .detection-results-tabs .stTabs [data-baseweb="tab"] {{
-                        min-width: 140px;
-                        height: 50px;
-                        padding: 0 1rem;
-                        font-size: 0.85rem;
-                    }}
-
-                    .detection-results-tabs .stTabs [data-baseweb="tab-panel"] {{
-                        padding: 1.5rem;
-                    }}
-                }}
-
-                @media (max-width: 480px) {{
-                    .detection-results-tabs .stTabs [data-baseweb="tab"] {{
-                        min-width: 120px;
-                        height: 45px;
-                        padding: 0 0.8rem;
-                        font-size: 0.8rem;
-                    }}
-                }}
-                </style>
-                """, unsafe_allow_html=True)
-
-                # Create broader detection results tabs with perfect styling
-                with st.container():
-                    st.markdown('<div class="detection-results-tabs">', unsafe_allow_html=True)
-
-                    # Display results using the enhanced dashboard
-                    create_results_dashboard(
-                        st.session_state.video_results,
-                        st.session_state.current_video_path if hasattr(st.session_state, 'current_video_path') else None,
-                        0,  # Processing time not available
-                        {'skip': 1}  # Default settings
-                    )
-
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    justify-content: center;
+                    font-size: 1.2rem;
+                    font-weight: bold;
+                ">✓</div>
+                <div>
+                    <h4 style="color: {theme_config['text_primary']}; margin: 0; font-weight: 600;">
+                        Video uploaded successfully!
+                    </h4>
+                    <p style="color: {theme_config['text_secondary']}; margin: 0.3rem 0 0 0; font-size: 0.9rem;">
+                        📁 {uploaded_video.name} • 📊 {file_size:.1f} MB • 🚀 Ready for processing
+                    </p>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
 
-            # Show modern summary of previous results
-            if st.session_state.video_results:
-                results = st.session_state.video_results
+            # Modern two-column layout
+            col1, col2 = st.columns([2.2, 1], gap="large")
 
-                # Modern summary header
+            with col1:
+                # Video preview with modern styling
                 st.markdown(f"""
                 <div style="
-                    background: linear-gradient(135deg, {theme_config['card_bg']}95 0%, {theme_config['secondary_bg']}80 100%);
-                    backdrop-filter: blur(20px);
-                    border: 1px solid {theme_config['border_color']};
+                    background: {theme_config['card_bg']};
                     border-radius: 20px;
-                    padding: 2rem;
-                    margin: 2rem 0;
+                    padding: 1rem;
+                    border: 1px solid {theme_config['border_color']};
                     box-shadow: 0 8px 32px {theme_config['shadow']};
+                    backdrop-filter: blur(10px);
                 ">
                     <h4 style="
                         color: {theme_config['text_primary']};
-                        margin: 0 0 1.5rem 0;
-                        font-weight: 700;
-                        font-size: 1.4rem;
+                        margin: 0 0 1rem 0;
+                        font-weight: 600;
                         display: flex;
                         align-items: center;
-                        gap: 0.8rem;
+                        gap: 0.5rem;
                     ">
-                        📊 Last Processing Summary
+                        📹 Video Preview
                     </h4>
                 </div>
                 """, unsafe_allow_html=True)
+                # Serve the preview from a stable file so reruns don't re-embed the upload
+                preview_path = get_upload_preview_path(uploaded_video)
 
-                # Modern metrics grid
-                col_s1, col_s2, col_s3, col_s4 = st.columns(4, gap="medium")
+                # Show a background-decoded thumbnail; the player loads only on request
+                thumbnail = get_preview_thumbnail(preview_path)
+                polling = not thumbnail.done()
+                st.fragment(render_preview_thumbnail, run_every=0.5 if polling else None)(thumbnail, polling)
 
-                with col_s1:
-                    st.markdown(f"""
+                if st.toggle("▶️ Play video preview", key="show_video_preview"):
+                    st.video(preview_path, start_time=0, autoplay=False)
+
+            with col2:
+
+                # Speed info display with modern design
+                speed_boost = settings['skip']
+                estimated_speed = f"{speed_boost}x faster"
+
+                st.markdown(f"""
+                <div style="
+                    background: linear-gradient(135deg, {theme_config['accent_color']}15 0%, {theme_config['info_color']}10 100%);
+                    border: 1px solid {theme_config['accent_color']}40;
+                    border-radius: 16px;
+                    padding: 1.5rem;
+                    text-align: center;
+                    margin-bottom: 1.5rem;
+                    backdrop-filter: blur(10px);
+                    box-shadow: 0 4px 20px {theme_config['shadow']};
+                ">
                     <div style="
-                        background: linear-gradient(135deg, {theme_config['info_color']}15 0%, {theme_config['info_color']}05 100%);
-                        border: 1px solid {theme_config['info_color']}40;
-                        border-radius: 16px;
-                        padding: 1.5rem;
-                        text-align: center;
-                        backdrop-filter: blur(10px);
-                        box-shadow: 0 4px 20px {theme_config['shadow']};
-                    ">
-                        <div style="
-                            font-size: 2rem;
-                            font-weight: 800;
-                            color: {theme_config['info_color']};
-                            margin-bottom: 0.5rem;
-                        ">{results['processed_frames']:,}</div>
-                        <div style="
-                            color: {theme_config['text_secondary']};
-                            font-weight: 600;
-                            font-size: 0.9rem;
-                            text-transform: uppercase;
-                            letter-spacing: 0.5px;
-                        ">Frames Processed</div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                        font-size: 2.5rem;
+                        font-weight: 800;
+                        background: linear-gradient(135deg, {theme_config['accent_color']}, {theme_config['info_color']});
+                        -webkit-background-clip: text;
+                        -webkit-text-fill-color: transparent;
+                        background-clip: text;
+                        margin-bottom: 0.5rem;
+                    ">{estimated_speed}</div>
+                    <div style="
+                        color: {theme_config['text_secondary']};
+                        font-weight: 600;
+                        font-size: 1rem;
+                        text-transform: uppercase;
+                        letter-spacing: 1px;
+                    ">Processing Speed</div>
+                    <div style="
+                        color: {theme_config['text_muted']};
+                        font-size: 0.85rem;
+                        margin-top: 0.5rem;
+                    ">Optimized for ultra-fast analysis</div>
+                </div>
+                """, unsafe_allow_html=True)
 
-                with col_s2:
+                # Modern process button
+                if not st.session_state.processing:
+                    # Custom styled button
                     st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(135deg, {theme_config['danger_color']}15 0%, {theme_config['danger_color']}05 100%);
-                        border: 1px solid {theme_config['danger_color']}40;
+                    <style>
+                    .process-button {{
+                        background: linear-gradient(135deg, {theme_config['accent_color']} 0%, {theme_config['info_color']} 100%);
+                        color: white;
+                        border: none;
                         border-radius: 16px;
-                        padding: 1.5rem;
-                        text-align: center;
-                        backdrop-filter: blur(10px);
-                        box-shadow: 0 4px 20px {theme_config['shadow']};
-                    ">
-                        <div style="
-                            font-size: 2rem;
-                            font-weight: 800;
-                            color: {theme_config['danger_color']};
-                            margin-bottom: 0.5rem;
-                        ">{results['total_violations']:,}</div>
-                        <div style="
-                            color: {theme_config['text_secondary']};
-                            font-weight: 600;
-                            font-size: 0.9rem;
-                            text-transform: uppercase;
-                            letter-spacing: 0.5px;
-                        ">Violations Found</div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                        padding: 1rem 2rem;
+                        font-size: 1.1rem;
+                        font-weight: 700;
+                        text-transform: uppercase;
+                        letter-spacing: 1px;
+                        cursor: pointer;
+                        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+                        box-shadow: 0 8px 32px {theme_config['accent_color']}40;
+                        width: 100%;
+                        display: flex;
+                        align-items: center;
+                        justify-content: center;
+                        gap: 0.8rem;
+                        position: relative;
+                        overflow: hidden;
+                    }}
 
-                with col_s3:
-                    avg_compliance = results.get('average_compliance_rate', 0)
-                    compliance_color = theme_config['success_color'] if avg_compliance >= 80 else theme_config['warning_color'] if avg_compliance >= 60 else theme_config['danger_color']
+                    .process-button:hover {{
+                        transform: translateY(-2px);
+                        box-shadow: 0 12px 40px {theme_config['accent_color']}60;
+                    }}
 
-                    st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(135deg, {compliance_color}15 0%, {compliance_color}05 100%);
-                        border: 1px solid {compliance_color}40;
-                        border-radius: 16px;
-                        padding: 1.5rem;
-                        text-align: center;
-                        backdrop-filter: blur(10px);
-                        box-shadow: 0 4px 20px {theme_config['shadow']};
-                    ">
-                        <div style="
-                            font-size: 2rem;
-                            font-weight: 800;
-                            color: {compliance_color};
-                            margin-bottom: 0.5rem;
-                        ">{avg_compliance:.0f}%</div>
-                        <div style="
-                            color: {theme_config['text_secondary']};
-                            font-weight: 600;
-                            font-size: 0.9rem;
-                            text-transform: uppercase;
-                            letter-spacing: 0.5px;
-                        ">Avg Compliance</div>
-                    </div>
+                    .process-button::before {{
+                        content: '';
+                        position: absolute;
+                        top: 0;
+                        left: -100%;
+                        width: 100%;
+                        height: 100%;
+                        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
+                        transition: left 0.5s;
+                    }}
+
+                    .process-button:hover::before {{
+                        left: 100%;
+                    }}
+                    </style>
                     """, unsafe_allow_html=True)
 
-                with col_s4:
-                    if st.session_state.processed_video_path and os.path.exists(st.session_state.processed_video_path):
-                        file_size = os.path.getsize(st.session_state.processed_video_path) / (1024 * 1024)
-                        status_text = f"{file_size:.1f} MB"
-                        status_color = theme_config['success_color']
-                        label_text = "Video Size"
-                    else:
-                        status_text = "Missing"
-                        status_color = theme_config['warning_color']
-                        label_text = "File Status"
+                    if st.button("🚀 PROCESS VIDEO", type="primary", use_container_width=True, key="process_video_btn"):
+                        st.session_state.processing = True
+
+                        # Process straight from the upload's preview file instead of writing a second copy
+                        video_path = get_upload_preview_path(uploaded_video)
+                        output_path = os.path.splitext(video_path)[0] + '_processed.mp4'
+
+                        # Process with cancellation
+                        results = process_video_with_cancellation(video_path, output_path, settings)
+
+                        # Results are now displayed by the processing function
+                        # and stored in session state for persistence
+
+                        # Cleanup; the preview file is rewritten on demand if the upload is shown again
+                        release_upload_preview()
+                        try:
+                            Path(output_path).unlink(missing_ok=True)
+                        except OSError:
+                            pass
+
+                        st.session_state.processing = False
+                        st.rerun()
 
+                else:
+                    # Processing indicator with modern design
                     st.markdown(f"""
                     <div style="
-                        background: linear-gradient(135deg, {status_color}15 0%, {status_color}05 100%);
-                        border: 1px solid {status_color}40;
+                        background: linear-gradient(135deg, {theme_config['warning_color']}15 0%, {theme_config['warning_color']}05 100%);
+                        border: 1px solid {theme_config['warning_color']}40;
                         border-radius: 16px;
                         padding: 1.5rem;
                         text-align: center;
@@ -2451,198 +4676,39 @@ def main():
                     ">
                         <div style="
                             font-size: 2rem;
-                            font-weight: 800;
-                            color: {status_color};
-                            margin-bottom: 0.5rem;
-                        ">{status_text}</div>
+                            margin-bottom: 0.8rem;
+                            animation: spin 2s linear infinite;
+                        ">🔄</div>
                         <div style="
-                            color: {theme_config['text_secondary']};
+                            color: {theme_config['text_primary']};
                             font-weight: 600;
-                            font-size: 0.9rem;
-                            text-transform: uppercase;
-                            letter-spacing: 0.5px;
-                        ">{label_text}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-    
-    with tab3:
-        # Get current theme for dynamic styling
-        current_theme = theme_manager.get_current_theme()
-        theme_config = theme_manager.get_theme_config(current_theme)
-
-        # Modern header with gradient background
-        st.markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, {theme_config['accent_color']}15 0%, {theme_config['info_color']}15 100%);
-            padding: 2rem;
-            border-radius: 16px;
-            margin-bottom: 2rem;
-            border: 1px solid {theme_config['border_color']};
-            box-shadow: 0 4px 20px {theme_config['shadow']};
-        ">
-            <h2 style="
-                color: {theme_config['text_primary']};
-                margin: 0;
-                font-size: 2rem;
-                font-weight: 700;
-                text-align: center;
-                background: linear-gradient(135deg, {theme_config['accent_color']}, {theme_config['info_color']});
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-            ">📷 Instant Image Analysis</h2>
-            <p style="
-                color: {theme_config['text_secondary']};
-                text-align: center;
-                margin: 0.5rem 0 0 0;
-                font-size: 1.1rem;
-            ">Upload an image for real-time PPE compliance detection</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Enhanced CSS styling with theme support and animations
-        st.markdown(f"""
-        <style>
-        /* Modern file uploader with clean design */
-        .stFileUploader > div > div {{
-            border: 2px dashed {theme_config['accent_color']}40 !important;
-            border-radius: 20px !important;
-            background: linear-gradient(135deg, {theme_config['card_bg']} 0%, {theme_config['secondary_bg']} 100%) !important;
-            padding: 4rem 2rem !important;
-            text-align: center !important;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-            position: relative !important;
-            overflow: hidden !important;
-            min-height: 220px !important;
-            box-shadow: 0 8px 32px {theme_config['shadow']} !important;
-            display: flex !important;
-            flex-direction: column !important;
-            justify-content: center !important;
-            align-items: center !important;
-        }}
-
-        .stFileUploader > div > div:hover {{
-            border-color: {theme_config['accent_color']}80 !important;
-            background: linear-gradient(135deg, {theme_config['accent_color']}10 0%, {theme_config['info_color']}10 100%) !important;
-            transform: translateY(-2px) scale(1.01) !important;
-            box-shadow: 0 12px 40px {theme_config['shadow_hover']} !important;
-        }}
-
-        .stFileUploader > div > div::before {{
-            content: '📤';
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -80%);
-            font-size: 4rem;
-            opacity: 0.4;
-            animation: bounce 2s ease-in-out infinite;
-        }}
-
-        .stFileUploader > div > div::after {{
-            content: 'Drag & Drop your image here or click to browse\\ASupported: JPG, PNG, BMP • Max 10MB';
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, 20%);
-            color: {theme_config['text_primary']};
-            font-size: 1.1rem;
-            font-weight: 600;
-            text-align: center;
-            line-height: 1.5;
-            white-space: pre-line;
-        }}
-
-        @keyframes bounce {{
-            0%, 20%, 50%, 80%, 100% {{ transform: translate(-50%, -80%) translateY(0); }}
-            40% {{ transform: translate(-50%, -80%) translateY(-10px); }}
-            60% {{ transform: translate(-50%, -80%) translateY(-5px); }}
-        }}
-
-        /* Hide default upload text */
-        .stFileUploader label {{
-            display: none !important;
-        }}
-
-        .stFileUploader > div > div > div {{
-            display: none !important;
-        }}
-
-        /* Style the browse button when it appears */
-        .stFileUploader button {{
-            background: {theme_config['accent_color']} !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 8px !important;
-            padding: 0.5rem 1rem !important;
-            font-weight: 600 !important;
-            margin-top: 1rem !important;
-        }}
-
-        /* Enhanced button styling for instant analysis */
-        .stButton > button {{
-            background: linear-gradient(135deg, {theme_config['accent_color']} 0%, {theme_config['info_color']} 100%) !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 12px !important;
-            font-weight: 700 !important;
-            font-size: 1.1rem !important;
-            padding: 0.75rem 2rem !important;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-            box-shadow: 0 4px 20px {theme_config['accent_color']}30 !important;
-            text-transform: uppercase !important;
-            letter-spacing: 0.5px !important;
-        }}
-
-        .stButton > button:hover {{
-            transform: translateY(-2px) scale(1.05) !important;
-            box-shadow: 0 8px 30px {theme_config['accent_color']}40 !important;
-            background: linear-gradient(135deg, {theme_config['info_color']} 0%, {theme_config['accent_color']} 100%) !important;
-        }}
-
-        .stButton > button:active {{
-            transform: translateY(0px) scale(1.02) !important;
-        }}
-
-        /* Enhanced download button styling */
-        .stDownloadButton > button {{
-            background: linear-gradient(135deg, {theme_config['success_color']} 0%, {theme_config['info_color']} 100%) !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 12px !important;
-            font-weight: 600 !important;
-            padding: 0.75rem 2rem !important;
-            transition: all 0.3s ease !important;
-            box-shadow: 0 4px 20px {theme_config['success_color']}30 !important;
-        }}
-
-        .stDownloadButton > button:hover {{
-            transform: translateY(-2px) !important;
-            box-shadow: 0 8px 30px {theme_config['success_color']}40 !important;
-        }}
-
-        /* Image container styling */
-        .stImage > img {{
-            border-radius: 12px !important;
-            box-shadow: 0 8px 32px {theme_config['shadow']} !important;
-            transition: transform 0.3s ease !important;
-        }}
+                            font-size: 1.1rem;
+                            margin-bottom: 0.5rem;
+                        ">Processing in Progress</div>
+                        <div style="
+                            color: {theme_config['text_secondary']};
+                            font-size: 0.9rem;
+                        ">Please wait while we analyze your video...</div>
+                    </div>
 
-        .stImage > img:hover {{
-            transform: scale(1.02) !important;
-        }}
+                    <style>
+                    @keyframes spin {{
+                        from {{ transform: rotate(0deg); }}
+                        to {{ transform: rotate(360deg); }}
+                    }}
+                    </style>
+                    """, unsafe_allow_html=True)
 
-        /* Metric cards hover effects */
-        .metric-card {{
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        }}
+        # Show previous results if available with modern layout
+        render_video_results_section()
+    
+    with tab3:
+        # Get current theme for dynamic styling
+        current_theme, theme_config = get_active_theme()
+        tints = get_theme_tints(current_theme)
 
-        .metric-card:hover {{
-            transform: translateY(-8px) scale(1.02) !important;
-            box-shadow: 0 16px 48px {theme_config['shadow_hover']} !important;
-        }}
-        </style>
-        """, unsafe_allow_html=True)
+        # Tab stylesheet and modern header, sent together as one element
+        inject_image_tab_chrome(current_theme)
 
         # Clean and modern file uploader
         uploaded_image = st.file_uploader(
@@ -2654,32 +4720,7 @@ def main():
 
         # Simple upload instruction when no file is selected
         if not uploaded_image:
-            st.markdown(f"""
-            <div style="
-                text-align: center;
-                padding: 1.5rem;
-                margin: 1rem 0;
-                background: linear-gradient(135deg, {theme_config['accent_color']}08 0%, {theme_config['info_color']}08 100%);
-                border-radius: 12px;
-                border: 1px solid {theme_config['accent_color']}20;
-                animation: fadeIn 0.5s ease-out;
-            ">
-                <div style="font-size: 2.5rem; margin-bottom: 0.5rem; opacity: 0.7;">📸</div>
-                <h4 style="color: {theme_config['text_primary']}; margin: 0 0 0.5rem 0; font-weight: 600;">
-                    Ready for Analysis
-                </h4>
-                <p style="color: {theme_config['text_secondary']}; margin: 0; font-size: 0.9rem;">
-                    Upload a clear image with people wearing PPE for instant compliance detection
-                </p>
-            </div>
-
-            <style>
-            @keyframes fadeIn {{
-                from {{ opacity: 0; transform: translateY(10px); }}
-                to {{ opacity: 1; transform: translateY(0); }}
-            }}
-            </style>
-            """, unsafe_allow_html=True)
+            st.markdown(render_image_upload_splash(current_theme), unsafe_allow_html=True)
         
         if uploaded_image:
             is_valid, error = validate_image(uploaded_image)
@@ -2688,21 +4729,15 @@ def main():
                 st.stop()
 
             # Simple success message
-            file_size = uploaded_image.size / (1024 * 1024)
+            file_size = uploaded_image.size * INV_MB
             st.success(f"✅ **{uploaded_image.name}** uploaded successfully ({file_size:.1f} MB)")
 
-            image = Image.open(uploaded_image)
-
-            # Convert to RGB if necessary (handles RGBA, grayscale, etc.)
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-
-            # Ensure numpy is available (defensive import)
-            try:
-                image_np = np.array(image)
-            except NameError:
-                import numpy as np
-                image_np = np.array(image)
+            # Decode straight to a 3-channel array (handles RGBA, grayscale, etc.)
+            image_bgr = cv2.imdecode(np.frombuffer(uploaded_image.getvalue(), np.uint8), cv2.IMREAD_COLOR)
+            if image_bgr is None:
+                st.error("❌ Could not decode image")
+                st.stop()
+            image_np = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
 
             # Two-column layout like video processing tab
             col1, col2 = st.columns([2.2, 1], gap="large")
@@ -2730,14 +4765,16 @@ def main():
                     </h4>
                 </div>
                 """, unsafe_allow_html=True)
-                st.image(image, use_container_width=True)
+                # One slot for the preview; swapped in place for the annotated result after analysis
+                image_slot = st.empty()
+                image_slot.image(image_np, use_container_width=True)
 
             with col2:
                 # Analysis info display with modern design (similar to speed info)
                 st.markdown(f"""
                 <div style="
-                    background: linear-gradient(135deg, {theme_config['accent_color']}15 0%, {theme_config['info_color']}10 100%);
-                    border: 1px solid {theme_config['accent_color']}40;
+                    background: linear-gradient(135deg, {tints['accent15']} 0%, {tints['info10']} 100%);
+                    border: 1px solid {tints['accent40']};
                     border-radius: 16px;
                     padding: 1.5rem;
                     text-align: center;
@@ -2773,84 +4810,40 @@ def main():
                 analyze_button = st.button("⚡ START ANALYSIS", type="primary", use_container_width=True, key="analysis_btn")
 
             # Move analysis processing outside of columns for full-width display
+            face_version = get_face_data_version()
+            analysis_key = (uploaded_image.file_id, settings['conf'], settings['iou'], face_version)
             if analyze_button:
-                start_time = time.time()
-
-                # Enhanced loading animation
-                progress_placeholder = st.empty()
-                with progress_placeholder.container():
-                    st.markdown(f"""
-                    <div style="
-                        background: {theme_config['card_bg']};
-                        border-radius: 16px;
-                        padding: 2rem;
-                        border: 1px solid {theme_config['accent_color']}30;
-                        box-shadow: 0 8px 32px {theme_config['shadow']};
-                        text-align: center;
-                        animation: analysisGlow 2s ease-in-out infinite;
-                    ">
-                        <div style="font-size: 3rem; margin-bottom: 1rem; animation: spin 2s linear infinite;">🔍</div>
-                        <h3 style="color: {theme_config['text_primary']}; margin: 0 0 0.5rem 0;">AI Analysis in Progress</h3>
-                        <p style="color: {theme_config['text_secondary']}; margin: 0;">Detecting PPE compliance...</p>
-                        <div style="
-                            width: 100%;
-                            height: 4px;
-                            background: {theme_config['border_color']};
-                            border-radius: 2px;
-                            margin-top: 1rem;
-                            overflow: hidden;
-                        ">
-                            <div style="
-                                width: 100%;
-                                height: 100%;
-                                background: linear-gradient(90deg, {theme_config['accent_color']}, {theme_config['info_color']});
-                                animation: progressBar 2s ease-in-out infinite;
-                            "></div>
-                        </div>
-                    </div>
-
-                    <style>
-                    @keyframes spin {{
-                        from {{ transform: rotate(0deg); }}
-                        to {{ transform: rotate(360deg); }}
-                    }}
-                    @keyframes analysisGlow {{
-                        0%, 100% {{ box-shadow: 0 8px 32px {theme_config['shadow']}; }}
-                        50% {{ box-shadow: 0 8px 32px {theme_config['accent_color']}30; }}
-                    }}
-                    @keyframes progressBar {{
-                        0% {{ transform: translateX(-100%); }}
-                        100% {{ transform: translateX(100%); }}
-                    }}
-                    </style>
-                    """, unsafe_allow_html=True)
+                # Perform analysis (memoized on image content, thresholds and face database)
+                with st.spinner("🔍 AI Analysis in Progress... Detecting PPE compliance"):
+                    results, analysis_time, cached = run_image_detection(
+                        uploaded_image.getvalue(), image_np, settings['conf'], settings['iou'], face_version
+                    )
 
-                # Perform analysis
-                results = st.session_state.detection_engine.detect_objects(
-                    image_np, settings['conf'], settings['iou']
-                )
+                # Stamp the analysis once; the download filename reuses it across reruns
+                analysis_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                st.session_state.image_analysis = (analysis_key, results, analysis_time, cached, analysis_timestamp)
 
-                analysis_time = time.time() - start_time
-                progress_placeholder.empty()
+            # Keep showing the last analysis across reruns (e.g. the download click) while its inputs match
+            image_analysis = st.session_state.get('image_analysis')
+            if image_analysis and image_analysis[0] == analysis_key:
+                _, results, analysis_time, cached, analysis_timestamp = image_analysis
 
                 if 'error' not in results:
                     # Simple success message like video processing
                     st.success(f"""
                     ✅ **Image Analysis Complete!**
-                    - Analysis Time: {analysis_time:.2f} seconds
+                    - Analysis Time: {analysis_time:.2f} seconds{" (cached result)" if cached else ""}
                     - AI Model: PPE Detection Engine
                     - Status: Ready for review
                     """)
 
-                    # Draw detections including face recognition
-                    face_results = results.get('face_results', [])
-                    processed_image = st.session_state.detection_engine.draw_detections(
-                        image_np, results['detections'], True, face_results
+                    # Draw detections including face recognition (cached alongside the detection)
+                    processed_image = draw_image_detections(
+                        uploaded_image.getvalue(), image_np, results, settings['conf'], settings['iou'], face_version
                     )
 
-                    # Simple results display like video processing
-                    st.markdown("### 📊 Processed Image with Detections")
-                    st.image(processed_image, use_container_width=True)
+                    # Replace the preview with the annotated image
+                    image_slot.image(processed_image, caption="📊 Processed Image with Detections", use_container_width=True)
 
                     # Simple metrics display like video processing
                     st.markdown("### 📊 Key Metrics")
@@ -2859,79 +4852,24 @@ def main():
                     compliance_stats = results['compliance_stats']
                     compliance_rate = compliance_stats['compliance_rate']
                     total_people = compliance_stats['total_people']
-                    violations = compliance_stats['violations']
-                    violations_count = len(violations)
-
-                    # Simple 4-column layout like video processing
-                    col1, col2, col3, col4 = st.columns(4)
-
-                    # Add simple metric card styling like video processing
-                    st.markdown("""
-                    <style>
-                    .metric-card {
-                        background: linear-gradient(135deg, var(--card-color) 0%, var(--card-color-dark) 100%);
-                        color: white;
-                        padding: 1.5rem;
-                        border-radius: 12px;
-                        text-align: center;
-                        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                        transition: transform 0.3s ease, box-shadow 0.3s ease;
-                        margin-bottom: 1rem;
-                    }
-                    .metric-card:hover {
-                        transform: translateY(-5px);
-                        box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-                    }
-                    .metric-value {
-                        font-size: 2rem;
-                        font-weight: 800;
-                        margin-bottom: 0.5rem;
-                    }
-                    .metric-label {
-                        font-size: 0.9rem;
-                        opacity: 0.9;
-                        font-weight: 600;
-                    }
-                    </style>
-                    """, unsafe_allow_html=True)
-
-                    with col1:
-                        st.markdown(f"""
-                        <div class="metric-card" style="--card-color: #4CAF50; --card-color-dark: #45a049;">
-                            <div class="metric-value">{total_people}</div>
-                            <div class="metric-label">People Detected</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                    with col2:
-                        violations_color = "#f44336" if violations_count > 0 else "#4CAF50"
-                        violations_color_dark = "#d32f2f" if violations_count > 0 else "#45a049"
-                        st.markdown(f"""
-                        <div class="metric-card" style="--card-color: {violations_color}; --card-color-dark: {violations_color_dark};">
-                            <div class="metric-value">{violations_count}</div>
-                            <div class="metric-label">Violations Found</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                    with col3:
-                        compliance_color = "#4CAF50" if compliance_rate >= 80 else "#ff9800" if compliance_rate >= 60 else "#f44336"
-                        compliance_color_dark = "#45a049" if compliance_rate >= 80 else "#f57c00" if compliance_rate >= 60 else "#d32f2f"
-                        st.markdown(f"""
-                        <div class="metric-card" style="--card-color: {compliance_color}; --card-color-dark: {compliance_color_dark};">
-                            <div class="metric-value">{compliance_rate:.0f}%</div>
-                            <div class="metric-label">Compliance Rate</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                    with col4:
-                        # Detection summary - total detections
-                        total_detections = len(results['detections'])
-                        st.markdown(f"""
-                        <div class="metric-card" style="--card-color: #2196F3; --card-color-dark: #1976D2;">
-                            <div class="metric-value">{total_detections}</div>
-                            <div class="metric-label">Total Detections</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                    violations_count = compliance_stats.get('violations_count') or len(compliance_stats['violations'])
+
+                    violations_color = "#f44336" if violations_count > 0 else "#4CAF50"
+                    violations_color_dark = "#d32f2f" if violations_count > 0 else "#45a049"
+                    compliance_color, compliance_color_dark = IMAGE_COMPLIANCE_COLORS[compliance_band(compliance_rate)]
+                    total_detections = len(results['detections'])
+
+                    # Simple 4-card grid like video processing, emitted with its styling as one block
+                    cards = "".join(
+                        render_image_metric_card(str(value), label, color, color_dark)
+                        for value, label, color, color_dark in (
+                            (total_people, 'People Detected', '#4CAF50', '#45a049'),
+                            (violations_count, 'Violations Found', violations_color, violations_color_dark),
+                            (f"{compliance_rate:.0f}%", 'Compliance Rate', compliance_color, compliance_color_dark),
+                            (total_detections, 'Total Detections', '#2196F3', '#1976D2'),
+                        )
+                    )
+                    st.markdown(IMAGE_METRIC_CARD_CSS + METRIC_GRID_TMPL.format(cards=cards), unsafe_allow_html=True)
 
                     # Add detection summary like video processing
                     st.markdown("### 📋 Detection Summary")
@@ -2946,910 +4884,32 @@ def main():
                         detection_summary.append("✅ **No safety violations** detected")
                     detection_summary.append(f"📊 **{compliance_rate:.1f}%** compliance rate")
 
-                    # Display summary
-                    for item in detection_summary:
-                        st.markdown(f"- {item}")
+                    # Display summary as a single markdown list
+                    st.markdown("\n".join(["- " + item for item in detection_summary]))
 
                     # Simple download section like video processing
                     st.markdown("---")
                     st.markdown("### 📥 Download Results")
 
-                    processed_pil = Image.fromarray(processed_image)
-                    buf = io.BytesIO()
-                    processed_pil.save(buf, format='PNG')
-
-                    # Ensure datetime is available (defensive import)
-                    try:
-                        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    except NameError:
-                        from datetime import datetime
-                        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-                    st.download_button(
-                        "📥 Download Analyzed Image",
-                        buf.getvalue(),
-                        file_name=f"ppe_analysis_{timestamp}.png",
-                        mime="image/png",
-                        use_container_width=True,
-                        help="Download the image with PPE detection annotations"
-                    )
-                else:
-                    st.error(f"❌ Analysis failed: {results['error']}")
-
-    with tab4:
-        st.markdown("### 📋 Results History")
-
-        # Get current theme for consistent styling
-        current_theme = theme_manager.get_current_theme()
-        theme_config = theme_manager.get_theme_config(current_theme)
-
-        if st.session_state.results_history:
-            # Modern redesigned history header with enhanced visuals
-            st.markdown("""
-            <style>
-            .history-header {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                padding: 3rem 2rem;
-                border-radius: 25px;
-                margin: 2rem 0;
-                text-align: center;
-                box-shadow:
-                    0 20px 40px rgba(102, 126, 234, 0.3),
-                    0 10px 20px rgba(0, 0, 0, 0.1);
-                position: relative;
-                overflow: hidden;
-                backdrop-filter: blur(10px);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-            .history-header::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: -100%;
-                width: 100%;
-                height: 100%;
-                background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.1), transparent);
-                animation: shimmer 3s infinite;
-            }
-            .history-header::after {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                height: 4px;
-                background: linear-gradient(90deg, #ff6b6b, #4ecdc4, #45b7d1, #96ceb4, #feca57);
-                background-size: 300% 100%;
-                animation: gradientMove 4s ease infinite;
-            }
-            .history-title {
-                font-size: clamp(1.8rem, 5vw, 2.5rem);
-                font-weight: 900;
-                color: white;
-                margin-bottom: 1rem;
-                text-shadow: 0 4px 8px rgba(0,0,0,0.3);
-                letter-spacing: -0.5px;
-            }
-            .history-subtitle {
-                color: rgba(255, 255, 255, 0.9);
-                font-weight: 600;
-                font-size: clamp(1.1rem, 3vw, 1.4rem);
-                background: rgba(255, 255, 255, 0.15);
-                padding: 0.8rem 1.5rem;
-                border-radius: 30px;
-                display: inline-block;
-                border: 2px solid rgba(255, 255, 255, 0.2);
-                backdrop-filter: blur(10px);
-                box-shadow: 0 8px 16px rgba(0, 0, 0, 0.1);
-            }
-            .session-card {
-                background: linear-gradient(145deg, #ffffff 0%, #f8fafc 100%);
-                border-radius: 25px;
-                border: 1px solid rgba(102, 126, 234, 0.1);
-                margin: 2rem 0;
-                box-shadow:
-                    0 10px 30px rgba(0, 0, 0, 0.08),
-                    0 4px 15px rgba(102, 126, 234, 0.1);
-                transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-                overflow: hidden;
-                position: relative;
-            }
-            .session-card::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                height: 3px;
-                background: linear-gradient(90deg, #667eea, #764ba2, #667eea);
-                background-size: 200% 100%;
-                animation: gradientMove 3s ease infinite;
-            }
-            .session-card:hover {
-                box-shadow:
-                    0 20px 50px rgba(0, 0, 0, 0.15),
-                    0 10px 25px rgba(102, 126, 234, 0.2);
-                transform: translateY(-8px) scale(1.02);
-                border-color: rgba(102, 126, 234, 0.3);
-            }
-            .session-header {
-                background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-                padding: 2rem;
-                border-radius: 25px 25px 0 0;
-                border-bottom: 1px solid rgba(102, 126, 234, 0.1);
-                position: relative;
-            }
-            .session-metrics {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-                gap: 2rem;
-                padding: 2.5rem;
-                background: rgba(248, 250, 252, 0.5);
-            }
-            .metric-card {
-                text-align: center;
-                padding: 2rem 1.5rem;
-                background: linear-gradient(145deg, #ffffff 0%, #f8fafc 100%);
-                border-radius: 20px;
-                border: 1px solid rgba(226, 232, 240, 0.8);
-                box-shadow:
-                    0 8px 25px rgba(0, 0, 0, 0.06),
-                    0 3px 10px rgba(0, 0, 0, 0.04);
-                transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-                min-height: 120px;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-                position: relative;
-                overflow: hidden;
-                backdrop-filter: blur(10px);
-            }
-            .metric-card:hover {
-                transform: translateY(-5px) scale(1.05);
-                box-shadow:
-                    0 15px 35px rgba(0, 0, 0, 0.12),
-                    0 8px 20px rgba(0, 0, 0, 0.08);
-                border-color: var(--metric-color, #667eea);
-                background: linear-gradient(145deg, #ffffff 0%, #f1f5f9 100%);
-            }
-            .metric-card::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                height: 5px;
-                background: linear-gradient(90deg, var(--metric-color, #667eea), var(--metric-color-light, #764ba2));
-                border-radius: 20px 20px 0 0;
-            }
-            .metric-card::after {
-                content: '';
-                position: absolute;
-                top: 50%;
-                left: 50%;
-                width: 100px;
-                height: 100px;
-                background: radial-gradient(circle, var(--metric-color, #667eea)10, transparent 70%);
-                transform: translate(-50%, -50%);
-                opacity: 0;
-                transition: opacity 0.3s ease;
-                pointer-events: none;
-            }
-            .metric-card:hover::after {
-                opacity: 0.05;
-            }
-            .metric-value {
-                font-size: clamp(1.6rem, 4vw, 2.2rem);
-                font-weight: 900;
-                color: var(--metric-color, #667eea);
-                margin-bottom: 0.8rem;
-                line-height: 1;
-                text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                letter-spacing: -0.5px;
-                transition: all 0.3s ease;
-            }
-            .metric-label {
-                font-size: clamp(0.85rem, 2vw, 1rem);
-                color: #64748b;
-                text-transform: uppercase;
-                font-weight: 600;
-                letter-spacing: 1px;
-                line-height: 1.3;
-                opacity: 0.8;
-                transition: all 0.3s ease;
-            }
-            .metric-card:hover .metric-value {
-                transform: scale(1.1);
-                color: var(--metric-color, #667eea);
-            }
-            .metric-card:hover .metric-label {
-                opacity: 1;
-                color: #475569;
-            }
-            .action-buttons-container {
-                padding: 2rem 2.5rem;
-                background: linear-gradient(135deg, rgba(248, 250, 252, 0.8) 0%, rgba(241, 245, 249, 0.9) 100%);
-                border-radius: 0 0 25px 25px;
-                border-top: 1px solid rgba(102, 126, 234, 0.1);
-                backdrop-filter: blur(10px);
-            }
-            .action-button-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
-                gap: 1.5rem;
-            }
-
-            /* Enhanced animations */
-            @keyframes shimmer {
-                0% { left: -100%; }
-                100% { left: 100%; }
-            }
-
-            @keyframes gradientMove {
-                0%, 100% { background-position: 0% 50%; }
-                50% { background-position: 100% 50%; }
-            }
-
-            @keyframes fadeInUp {
-                from {
-                    opacity: 0;
-                    transform: translateY(30px);
-                }
-                to {
-                    opacity: 1;
-                    transform: translateY(0);
-                }
-            }
-
-            .session-card {
-                animation: fadeInUp 0.6s ease-out;
-            }
-            /* Enhanced responsive design */
-            @media (max-width: 768px) {
-                .history-header {
-                    padding: 2rem 1.5rem;
-                    margin: 1rem 0;
-                }
-                .session-metrics {
-                    grid-template-columns: repeat(2, 1fr);
-                    gap: 1.5rem;
-                    padding: 2rem 1.5rem;
-                }
-                .metric-card {
-                    padding: 1.5rem 1rem;
-                    min-height: 100px;
-                }
-                .action-buttons-container {
-                    padding: 1.5rem;
-                }
-                .action-button-grid {
-                    grid-template-columns: 1fr;
-                    gap: 1rem;
-                }
-            }
-            @media (max-width: 480px) {
-                .history-header {
-                    padding: 1.5rem 1rem;
-                }
-                .session-metrics {
-                    grid-template-columns: 1fr;
-                    gap: 1rem;
-                    padding: 1.5rem 1rem;
-                }
-                .metric-card {
-                    padding: 1.2rem 0.8rem;
-                    min-height: 90px;
-                }
-                .action-buttons-container {
-                    padding: 1rem;
-                }
-            }
-
-            /* Filter and search styling */
-            .history-controls {
-                background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-                border-radius: 20px;
-                padding: 1.5rem;
-                margin: 1.5rem 0;
-                border: 1px solid rgba(102, 126, 234, 0.1);
-                box-shadow: 0 4px 15px rgba(0, 0, 0, 0.05);
-            }
-            </style>
-            """, unsafe_allow_html=True)
-
-            # Calculate summary statistics
-            total_sessions = len(st.session_state.results_history)
-            total_frames = sum(entry['results']['processed_frames'] for entry in st.session_state.results_history)
-            total_violations = sum(entry['results']['total_violations'] for entry in st.session_state.results_history)
-            avg_compliance = sum(entry['results'].get('average_compliance_rate', 0) for entry in st.session_state.results_history) / total_sessions if total_sessions > 0 else 0
-
-            st.markdown(f"""
-            <div class="history-header">
-                <div class="history-title">🎬 Processing History Dashboard</div>
-                <div class="history-subtitle">
-                    {total_sessions} Sessions • {total_frames:,} Frames • {avg_compliance:.1f}% Avg Compliance
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-            # Quick stats overview
-            if total_sessions > 0:
-                st.markdown("### 📈 Quick Overview")
-                overview_col1, overview_col2, overview_col3, overview_col4 = st.columns(4)
-
-                with overview_col1:
-                    st.metric("Total Sessions", total_sessions, delta=None)
-
-                with overview_col2:
-                    st.metric("Total Frames", f"{total_frames:,}", delta=None)
-
-                with overview_col3:
-                    compliance_delta = "🟢 Excellent" if avg_compliance >= 90 else "🟡 Good" if avg_compliance >= 75 else "🔴 Needs Improvement"
-                    st.metric("Avg Compliance", f"{avg_compliance:.1f}%", delta=compliance_delta)
-
-                with overview_col4:
-                    violation_status = "🎉 Clean" if total_violations == 0 else f"⚠️ {total_violations} Total"
-                    st.metric("Safety Status", violation_status, delta=None)
-
-            # Enhanced history controls with search and filters
-            st.markdown("""
-            <div class="history-controls">
-            </div>
-            """, unsafe_allow_html=True)
-
-            col1, col2, col3 = st.columns([2, 1, 1])
-
-            with col1:
-                st.markdown("**🔍 Search & Filter Sessions:**")
-                search_term = st.text_input(
-                    "Search by date or session number",
-                    placeholder="e.g., 2024-01 or Session 5",
-                    label_visibility="collapsed"
-                )
-
-            with col2:
-                sort_order = st.selectbox(
-                    "Sort by",
-                    ["Newest First", "Oldest First", "Most Violations", "Best Compliance"],
-                    label_visibility="collapsed"
-                )
-
-            with col3:
-                if st.button("🗑️ Clear History",
-                           use_container_width=True,
-                           type="secondary",
-                           help="Remove all processing history"):
-                    st.session_state.results_history = []
-                    st.success("✅ History cleared successfully!")
-                    time.sleep(0.5)
-                    st.rerun()
-
-            # Filter and sort history
-            filtered_history = st.session_state.results_history.copy()
-
-            # Apply search filter
-            if search_term:
-                filtered_history = [
-                    entry for entry in filtered_history
-                    if search_term.lower() in entry['timestamp'].lower()
-                ]
-
-            # Apply sorting
-            if sort_order == "Oldest First":
-                filtered_history = list(reversed(filtered_history))
-            elif sort_order == "Most Violations":
-                filtered_history = sorted(filtered_history,
-                                        key=lambda x: x['results'].get('total_violations', 0),
-                                        reverse=True)
-            elif sort_order == "Best Compliance":
-                filtered_history = sorted(filtered_history,
-                                        key=lambda x: x['results'].get('average_compliance_rate', 0),
-                                        reverse=True)
-            else:  # Newest First (default)
-                filtered_history = list(reversed(filtered_history))
-
-            # Show filtered results count
-            if search_term or sort_order != "Newest First":
-                st.markdown(f"**📊 Showing {len(filtered_history)} of {len(st.session_state.results_history)} sessions**")
-
-            # Display filtered history entries with enhanced design
-            for i, entry in enumerate(filtered_history):
-                # Calculate original session number
-                original_index = st.session_state.results_history.index(entry)
-                session_num = len(st.session_state.results_history) - original_index
-
-                # Create enhanced session card with modern styling
-                with st.expander(
-                    f"🎬 Session {session_num} • {entry['timestamp']}",
-                    expanded=(i == 0 and len(filtered_history) <= 3)
-                ):
-
-                    # Session metrics with improved layout
-                    st.markdown("""
-                    <div class="session-metrics">
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                    col_a, col_b, col_c, col_d = st.columns(4)
-
-                    with col_a:
-                        frames = entry['results']['processed_frames']
-                        st.markdown(f"""
-                        <div class="metric-card" style="--metric-color: #667eea; --metric-color-light: #764ba2;">
-                            <div class="metric-value">{frames:,}</div>
-                            <div class="metric-label">📹 Total Frames</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                    with col_b:
-                        violations = entry['results']['total_violations']
-                        if violations == 0:
-                            violation_color = "#10b981"
-                            violation_light = "#34d399"
-                            icon = "✅"
-                        else:
-                            violation_color = "#ef4444"
-                            violation_light = "#f87171"
-                            icon = "⚠️"
-                        st.markdown(f"""
-                        <div class="metric-card" style="--metric-color: {violation_color}; --metric-color-light: {violation_light};">
-                            <div class="metric-value">{violations:,}</div>
-                            <div class="metric-label">{icon} Safety Violations</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                    with col_c:
-                        avg_compliance = entry['results'].get('average_compliance_rate', 0)
-                        if avg_compliance >= 90:
-                            compliance_color = "#10b981"
-                            compliance_light = "#34d399"
-                            icon = "🏆"
-                        elif avg_compliance >= 75:
-                            compliance_color = "#f59e0b"
-                            compliance_light = "#fbbf24"
-                            icon = "📊"
-                        else:
-                            compliance_color = "#ef4444"
-                            compliance_light = "#f87171"
-                            icon = "📉"
-                        st.markdown(f"""
-                        <div class="metric-card" style="--metric-color: {compliance_color}; --metric-color-light: {compliance_light};">
-                            <div class="metric-value">{avg_compliance:.0f}%</div>
-                            <div class="metric-label">{icon} Compliance Rate</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                    with col_d:
-                        processing_time = entry['processing_time']
-                        if processing_time < 30:
-                            time_color = "#8b5cf6"
-                            time_light = "#a78bfa"
-                            icon = "⚡"
-                        elif processing_time < 120:
-                            time_color = "#06b6d4"
-                            time_light = "#22d3ee"
-                            icon = "⏱️"
-                        else:
-                            time_color = "#f59e0b"
-                            time_light = "#fbbf24"
-                            icon = "🕐"
-                        st.markdown(f"""
-                        <div class="metric-card" style="--metric-color: {time_color}; --metric-color-light: {time_light};">
-                            <div class="metric-value">{processing_time:.1f}s</div>
-                            <div class="metric-label">{icon} Processing Time</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                    # Enhanced action buttons with better container
-                    st.markdown("""
-                    <div class="action-buttons-container">
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                    col_btn1, col_btn2, col_btn3 = st.columns(3)
-
-                    with col_btn1:
-                        if st.button(f"👁️ View Results",
-                                   key=f"view_{i}",
-                                   use_container_width=True,
-                                   type="primary",
-                                   help="View complete analysis results for this session"):
-                            try:
-                                # Set session state to show results in broader tabs below
-                                st.session_state.video_results = entry['results']
-                                st.session_state.processed_video_data = entry['video_data']
-                                st.session_state.show_results = True
-                                st.session_state[f'show_history_results_{i}'] = True
-                                st.session_state[f'history_entry_{i}'] = entry
-
-                                # Create temporary file for video display with better error handling
-                                temp_path = None
-                                if entry['video_data']:
-                                    try:
-                                        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-                                            tmp_file.write(entry['video_data'])
-                                            temp_path = tmp_file.name
-                                        st.session_state[f'history_temp_path_{i}'] = temp_path
-                                    except Exception as e:
-                                        st.error(f"❌ Could not create video file: {str(e)}")
-                                        temp_path = None
-
-                                # Enhanced success message with better visual design
-                                st.markdown(f"""
-                                <div style="
-                                    background: linear-gradient(135deg, {theme_config['success_color']}15 0%, {theme_config['info_color']}10 100%);
-                                    border: 2px solid {theme_config['success_color']};
-                                    border-radius: 16px;
-                                    padding: 1.5rem;
-                                    margin: 1rem 0;
-                                    text-align: center;
-                                    animation: slideIn 0.5s ease-out;
-                                ">
-                                    <div style="
-                                        color: {theme_config['success_color']};
-                                        font-size: 1.2rem;
-                                        font-weight: 700;
-                                        margin-bottom: 0.5rem;
-                                    ">✅ Success!</div>
-                                    <div style="
-                                        color: {theme_config['text_primary']};
-                                        font-size: 1rem;
-                                    ">Detection results will be displayed in broader horizontal tabs below</div>
-                                </div>
-
-                                <style>
-                                @keyframes slideIn {{
-                                    from {{ opacity: 0; transform: translateY(-20px); }}
-                                    to {{ opacity: 1; transform: translateY(0); }}
-                                }}
-                                </style>
-                                """, unsafe_allow_html=True)
-                                st.rerun()
-
-                            except Exception as e:
-                                st.error(f"❌ Failed to load results: {str(e)}")
-
-                    with col_btn2:
-                        if entry['video_data']:
-                            st.download_button(
-                                "📥 Download Video",
-                                entry['video_data'],
-                                file_name=f"ppe_session_{entry['timestamp'].replace(':', '-').replace(' ', '_')}.mp4",
-                                mime="video/mp4",
-                                key=f"download_{i}",
-                                use_container_width=True,
-                                help="Download the processed video with PPE detection overlays"
-                            )
-                        else:
-                            st.button("📥 No Video",
-                                    key=f"no_video_{i}",
-                                    use_container_width=True,
-                                    disabled=True,
-                                    help="Video data not available for this session")
-
-                    with col_btn3:
-                        # Enhanced download report with better data
-                        report_data = {
-                            'session_info': {
-                                'session_number': session_num,
-                                'timestamp': entry['timestamp'],
-                                'processing_time': entry['processing_time'],
-                                'settings': entry['settings']
-                            },
-                            'results': entry['results'],
-                            'summary': {
-                                'total_frames': entry['results']['processed_frames'],
-                                'total_violations': entry['results']['total_violations'],
-                                'compliance_rate': entry['results'].get('average_compliance_rate', 0),
-                                'processing_speed': f"{entry['results']['processed_frames'] / entry['processing_time']:.1f} FPS" if entry['processing_time'] > 0 else "N/A"
-                            }
-                        }
-
-                        import json
-                        st.download_button(
-                            "📄 Download Report",
-                            json.dumps(report_data, indent=2, default=str),
-                            file_name=f"ppe_report_session_{session_num}_{entry['timestamp'].replace(':', '-').replace(' ', '_')}.json",
-                            mime="application/json",
-                            key=f"report_{i}",
-                            use_container_width=True,
-                            help="Download comprehensive analysis report in JSON format"
-                        )
-
-                    # Display broader horizontal detection results tabs below buttons if requested
-                    if st.session_state.get(f'show_history_results_{i}', False):
-                        st.markdown("---")
-
-
-
-                        # Enhanced broader tab styling for history results with improved visual design
-                        st.markdown(f"""
-                        <style>
-                        .history-detection-results-{i} .stTabs [data-baseweb="tab-list"] {{
-                            gap: 20px;
-                            background: linear-gradient(135deg, {theme_config['card_bg']}98 0%, {theme_config['secondary_bg']}85 100%);
-                            border-radius: 28px;
-                            padding: 24px;
-                            margin: 2.5rem 0;
-                            box-shadow: 0 12px 40px {theme_config['shadow']};
-                            backdrop-filter: blur(25px);
-                            border: 2px solid {theme_config['border_color']};
-                            display: flex;
-                            justify-content: center;
-                            align-items: center;
-                            width: 100%;
-                            overflow-x: auto;
-                        }}
-
-                        .history-detection-results-{i} .stTabs [data-baseweb="tab"] {{
-                            background: linear-gradient(135deg, {theme_config['accent_color']}25 0%, {theme_config['info_color']}20 100%);
-                            border: 2px solid {theme_config['border_color']};
-                            border-radius: 20px;
-                            padding: 0 3rem;
-                            margin: 0 6px;
-                            min-width: 240px;
-                            height: 75px;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            font-weight: 700;
-                            font-size: 1.2rem;
-                            color: {theme_config['text_primary']};
-                            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-                            position: relative;
-                            overflow: hidden;
-                            backdrop-filter: blur(15px);
-                            text-shadow: 0 1px 2px rgba(0,0,0,0.1);
-                            cursor: pointer;
-                        }}
-
-                        .history-detection-results-{i} .stTabs [data-baseweb="tab"]:before {{
-                            content: '';
-                            position: absolute;
-                            top: 0;
-                            left: -100%;
-                            width: 100%;
-                            height: 100%;
-                            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-                            transition: left 0.5s;
-                        }}
-
-                        .history-detection-results-{i} .stTabs [data-baseweb="tab"]:hover {{
-                            transform: translateY(-3px) scale(1.02);
-                            box-shadow: 0 12px 35px {theme_config['shadow']};
-                            background: linear-gradient(135deg, {theme_config['accent_color']}35 0%, {theme_config['info_color']}30 100%);
-                            border-color: {theme_config['accent_color']};
-                        }}
-
-                        .history-detection-results-{i} .stTabs [data-baseweb="tab"]:hover:before {{
-                            left: 100%;
-                        }}
-
-                        .history-detection-results-{i} .stTabs [data-baseweb="tab"][aria-selected="true"] {{
-                            background: linear-gradient(135deg, {theme_config['accent_color']} 0%, {theme_config['info_color']} 100%);
-                            color: white;
-                            border-color: {theme_config['accent_color']};
-                            box-shadow: 0 12px 35px {theme_config['accent_color']}50;
-                            transform: translateY(-2px) scale(1.05);
-                            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-                        }}
-
-                        .history-detection-results-{i} .stTabs [data-baseweb="tab-panel"] {{
-                            background: {theme_config['card_bg']};
-                            border-radius: 24px;
-                            padding: 3rem;
-                            margin-top: 1.5rem;
-                            box-shadow: 0 12px 40px {theme_config['shadow']};
-                            border: 2px solid {theme_config['border_color']};
-                            backdrop-filter: blur(15px);
-                            min-height: 400px;
-                        }}
-
-                        /* Enhanced responsive design for broader tabs */
-                        @media (max-width: 768px) {{
-                            .history-detection-results-{i} .stTabs [data-baseweb="tab-list"] {{
-                                gap: 16px;
-                                padding: 20px;
-                                flex-wrap: wrap;
-                                justify-content: center;
-                            }}
-
-                            .history-detection-results-{i} .stTabs [data-baseweb="tab"] {{
-                                font-size: 1.1rem;
-                                padding: 0 2rem;
-                                min-width: 180px;
-                                height: 65px;
-                            }}
-
-                            .history-detection-results-{i} .stTabs [data-baseweb="tab-panel"] {{
-                                padding: 2rem;
-                            }}
-                        }}
-
-                        @media (max-width: 480px) {{
-                            .history-detection-results-{i} .stTabs [data-baseweb="tab"] {{
-                                font-size: 1rem;
-                                padding: 0 1.5rem;
-                                min-width: 160px;
-                                height: 60px;
-                            }}
-
-                            .history-detection-results-{i} .stTabs [data-baseweb="tab-list"] {{
-                                gap: 12px;
-                                padding: 16px;
-                            }}
-
-                            .history-detection-results-{i} .stTabs [data-baseweb="tab-panel"] {{
-                                padding: 1.5rem;
-                            }}
-                        }}
-                        </style>
-                        """, unsafe_allow_html=True)
-
-                        # Create broader detection results tabs with perfect styling and enhanced layout
-                        with st.container():
-                            # Add animation for the detection results section
-                            st.markdown(f"""
-                            <style>
-                            .history-detection-results-{i} {{
-                                animation: fadeInUp 0.6s ease-out;
-                            }}
-
-                            @keyframes fadeInUp {{
-                                from {{
-                                    opacity: 0;
-                                    transform: translateY(30px);
-                                }}
-                                to {{
-                                    opacity: 1;
-                                    transform: translateY(0);
-                                }}
-                            }}
-                            </style>
-                            """, unsafe_allow_html=True)
-
-                            st.markdown(f'<div class="history-detection-results-{i}">', unsafe_allow_html=True)
-
-                            # Get the stored entry data
-                            stored_entry = st.session_state.get(f'history_entry_{i}', entry)
-                            temp_path = st.session_state.get(f'history_temp_path_{i}', None)
-
-                            # Display results using the enhanced dashboard with broader tabs
-                            create_results_dashboard(
-                                stored_entry['results'],
-                                temp_path,
-                                stored_entry['processing_time'],
-                                stored_entry['settings'],
-                                unique_id=f"history_{i}"
-                            )
-
-                            st.markdown('</div>', unsafe_allow_html=True)
-
-        else:
-            # Enhanced empty state with attractive design
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-                border-radius: 25px;
-                padding: 4rem 2rem;
-                text-align: center;
-                margin: 2rem 0;
-                border: 1px solid rgba(102, 126, 234, 0.1);
-                box-shadow: 0 10px 30px rgba(0, 0, 0, 0.05);
-            ">
-                <div style="font-size: 4rem; margin-bottom: 1rem;">🎬</div>
-                <h3 style="color: #475569; margin-bottom: 1rem; font-weight: 700;">
-                    No Processing History Yet
-                </h3>
-                <p style="color: #64748b; font-size: 1.1rem; margin-bottom: 2rem; max-width: 500px; margin-left: auto; margin-right: auto;">
-                    Start processing videos to build your analysis history. All your sessions will appear here with detailed insights and downloadable results.
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-
-            # Feature showcase with modern cards
-            st.markdown("### ✨ What You'll Get")
-
-            feature_col1, feature_col2 = st.columns(2)
-
-            with feature_col1:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 2rem;
-                    border-radius: 20px;
-                    margin: 1rem 0;
-                    box-shadow: 0 8px 25px rgba(102, 126, 234, 0.3);
-                ">
-                    <h4 style="margin: 0 0 1rem 0; display: flex; align-items: center; gap: 0.5rem;">
-                        📊 <span>Detailed Analytics</span>
-                    </h4>
-                    <ul style="margin: 0; padding-left: 1rem; line-height: 1.6;">
-                        <li>Frame-by-frame analysis</li>
-                        <li>Compliance rate tracking</li>
-                        <li>Violation timeline</li>
-                        <li>Performance metrics</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
-
-            with feature_col2:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
-                    color: white;
-                    padding: 2rem;
-                    border-radius: 20px;
-                    margin: 1rem 0;
-                    box-shadow: 0 8px 25px rgba(255, 107, 107, 0.3);
-                ">
-                    <h4 style="margin: 0 0 1rem 0; display: flex; align-items: center; gap: 0.5rem;">
-                        📥 <span>Export Options</span>
-                    </h4>
-                    <ul style="margin: 0; padding-left: 1rem; line-height: 1.6;">
-                        <li>Download processed videos</li>
-                        <li>JSON analysis reports</li>
-                        <li>Session comparisons</li>
-                        <li>Historical data access</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
+                    png_data = get_png_bytes(processed_image)
 
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #10b981 0%, #059669 100%);
-                color: white;
-                padding: 1.5rem;
-                border-radius: 15px;
-                margin: 2rem 0;
-                text-align: center;
-                box-shadow: 0 6px 20px rgba(16, 185, 129, 0.3);
-            ">
-                <strong>💡 Pro Tip:</strong> History automatically keeps your last 10 processing sessions with full data retention
-            </div>
-            """, unsafe_allow_html=True)
+                    st.download_button(
+                        "📥 Download Analyzed Image",
+                        png_data,
+                        file_name=f"ppe_analysis_{analysis_timestamp}.png",
+                        mime="image/png",
+                        use_container_width=True,
+                        help="Download the image with PPE detection annotations"
+                    )
+                else:
+                    st.error(f"❌ Analysis failed: {results['error']}")
+
+    with tab4:
+        render_history_tab()
 
     with tab5:
         # Enhanced Export Session Data Tab with improved UI
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1.5rem 2rem;
-            border-radius: 15px;
-            text-align: center;
-            margin-bottom: 2rem;
-            box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
-            position: relative;
-            overflow: hidden;
-        ">
-            <div style="
-                position: absolute;
-                top: -50%;
-                left: -50%;
-                width: 200%;
-                height: 200%;
-                background: linear-gradient(45deg, transparent, rgba(255,255,255,0.1), transparent);
-                animation: shimmer 3s ease-in-out infinite;
-            "></div>
-            <div style="position: relative; z-index: 1;">
-                <h2 style="margin: 0 0 0.5rem 0; font-size: 2rem; text-shadow: 0 2px 10px rgba(0,0,0,0.3);">
-                    📊 Export Session Data
-                </h2>
-                <p style="margin: 0; font-size: 1.1rem; opacity: 0.9; text-shadow: 0 1px 5px rgba(0,0,0,0.3);">
-                    Comprehensive analytics and download center
-                </p>
-            </div>
-        </div>
-
-        <style>
-        @keyframes shimmer {
-            0% { transform: translateX(-100%) translateY(-100%) rotate(45deg); }
-            100% { transform: translateX(100%) translateY(100%) rotate(45deg); }
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(EXPORT_TAB_BANNER, unsafe_allow_html=True)
 
 
 
@@ -3875,16 +4935,13 @@ def main():
             3. Wait for some frames to be processed
             4. Return here to export your session data
             """)
-
-            # Add a button to switch to Live Detection tab
-            if st.button("🎯 Go to Live Detection", type="primary", use_container_width=True):
-                st.switch_page("📹 Live Detection")
             return
 
         # Get webcam detector and stats
         webcam_detector = st.session_state.webcam_detector
         latest_stats = webcam_detector.get_latest_stats()
         frame_count = webcam_detector.frame_count
+        history_len = len(webcam_detector.compliance_history)
 
         # Check if there's data to export
         if frame_count == 0:
@@ -3900,452 +4957,39 @@ def main():
             """)
             return
 
-        # Enhanced CSS for export tab with animations
-        st.markdown("""
-        <style>
-        @keyframes fadeInUp {
-            from {
-                opacity: 0;
-                transform: translateY(30px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-
-        @keyframes slideInLeft {
-            from {
-                opacity: 0;
-                transform: translateX(-30px);
-            }
-            to {
-                opacity: 1;
-                transform: translateX(0);
-            }
-        }
-
-        @keyframes pulse {
-            0% {
-                box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
-            }
-            50% {
-                box-shadow: 0 12px 40px rgba(102, 126, 234, 0.5);
-            }
-            100% {
-                box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
-            }
-        }
-
-        .export-header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 2rem;
-            border-radius: 20px;
-            text-align: center;
-            margin-bottom: 2rem;
-            box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
-            animation: fadeInUp 0.8s ease-out, pulse 3s ease-in-out infinite;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .export-header::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: linear-gradient(45deg, transparent, rgba(255,255,255,0.1), transparent);
-            transform: rotate(45deg);
-            animation: shimmer 3s ease-in-out infinite;
-        }
-
-        @keyframes shimmer {
-            0% {
-                transform: translateX(-100%) translateY(-100%) rotate(45deg);
-            }
-            50% {
-                transform: translateX(100%) translateY(100%) rotate(45deg);
-            }
-            100% {
-                transform: translateX(-100%) translateY(-100%) rotate(45deg);
-            }
-        }
-
-        .export-metric-card {
-            background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-            border: 2px solid #e9ecef;
-            border-radius: 20px;
-            padding: 1.8rem;
-            text-align: center;
-            box-shadow: 0 6px 20px rgba(0,0,0,0.08);
-            transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-            min-height: 140px;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            position: relative;
-            overflow: hidden;
-            animation: slideInLeft 0.6s ease-out;
-            backdrop-filter: blur(10px);
-        }
-
-        .export-metric-card:hover {
-            transform: translateY(-8px) scale(1.02);
-            box-shadow: 0 15px 35px rgba(0,0,0,0.15);
-            border-color: var(--card-accent, #667eea);
-            background: linear-gradient(135deg, #ffffff 0%, #f0f8ff 100%);
-        }
-
-        .export-metric-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 5px;
-            background: linear-gradient(90deg, var(--card-accent, #667eea), var(--card-accent-light, #8fa4f3));
-            border-radius: 20px 20px 0 0;
-            transition: height 0.3s ease;
-        }
-
-        .export-metric-card:hover::before {
-            height: 8px;
-        }
-
-        .export-metric-card::after {
-            content: '';
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            width: 0;
-            height: 0;
-            background: radial-gradient(circle, rgba(102, 126, 234, 0.1) 0%, transparent 70%);
-            border-radius: 50%;
-            transform: translate(-50%, -50%);
-            transition: all 0.4s ease;
-            z-index: 0;
-        }
-
-        .export-metric-card:hover::after {
-            width: 200px;
-            height: 200px;
-        }
-
-        .export-metric-value {
-            font-size: clamp(2rem, 4vw, 3rem);
-            font-weight: 900;
-            margin: 0 0 0.5rem 0;
-            color: #2c3e50;
-            line-height: 1;
-            position: relative;
-            z-index: 1;
-            transition: all 0.3s ease;
-            background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            word-break: keep-all;
-            white-space: nowrap;
-            overflow: hidden;
-            text-overflow: ellipsis;
-        }
-
-        .export-metric-card:hover .export-metric-value {
-            transform: scale(1.05);
-            background: linear-gradient(135deg, var(--card-accent, #667eea) 0%, var(--card-accent-light, #8fa4f3) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-
-        .export-metric-label {
-            font-size: 0.85rem;
-            color: #6c757d;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            position: relative;
-            z-index: 1;
-            transition: all 0.3s ease;
-            line-height: 1.2;
-            word-wrap: break-word;
-            overflow-wrap: break-word;
-            hyphens: auto;
-        }
-
-        .export-metric-card:hover .export-metric-label {
-            color: var(--card-accent, #667eea);
-            transform: translateY(-2px);
-        }
-
-        .download-section {
-            background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
-            border: 2px solid #dee2e6;
-            border-radius: 20px;
-            padding: 2.5rem;
-            margin: 2rem 0;
-            box-shadow: 0 8px 25px rgba(0,0,0,0.08);
-            animation: fadeInUp 0.8s ease-out 0.2s both;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .download-section::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 4px;
-            background: linear-gradient(90deg, #667eea, #764ba2, #667eea);
-            background-size: 200% 100%;
-            animation: gradientShift 3s ease-in-out infinite;
-        }
-
-        @keyframes gradientShift {
-            0%, 100% {
-                background-position: 0% 50%;
-            }
-            50% {
-                background-position: 100% 50%;
-            }
-        }
-
-        .download-card {
-            background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-            border: 2px solid #e9ecef;
-            border-radius: 18px;
-            padding: 2rem;
-            text-align: center;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.06);
-            transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-            height: 100%;
-            position: relative;
-            overflow: hidden;
-            backdrop-filter: blur(5px);
-        }
-
-        .download-card:hover {
-            transform: translateY(-8px) scale(1.02);
-            box-shadow: 0 12px 30px rgba(0,0,0,0.15);
-            border-color: #667eea;
-            background: linear-gradient(135deg, #ffffff 0%, #f0f8ff 100%);
-        }
-
-        .download-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(102, 126, 234, 0.1), transparent);
-            transition: left 0.5s ease;
-        }
-
-        .download-card:hover::before {
-            left: 100%;
-        }
-
-        .download-icon {
-            font-size: 3rem;
-            margin-bottom: 1.2rem;
-            display: block;
-            transition: all 0.3s ease;
-            filter: drop-shadow(0 2px 4px rgba(0,0,0,0.1));
-        }
-
-        .download-card:hover .download-icon {
-            transform: scale(1.1) rotate(5deg);
-            filter: drop-shadow(0 4px 8px rgba(102, 126, 234, 0.3));
-        }
-
-        .download-title {
-            font-size: 1.2rem;
-            font-weight: 800;
-            color: #2c3e50;
-            margin-bottom: 0.8rem;
-            transition: all 0.3s ease;
-            position: relative;
-            z-index: 1;
-        }
-
-        .download-card:hover .download-title {
-            color: #667eea;
-            transform: translateY(-2px);
-        }
-
-        .download-description {
-            font-size: 0.9rem;
-            color: #6c757d;
-            margin-bottom: 1.5rem;
-            line-height: 1.5;
-            transition: all 0.3s ease;
-            position: relative;
-            z-index: 1;
-            word-wrap: break-word;
-            overflow-wrap: break-word;
-            hyphens: auto;
-        }
-
-        .download-card:hover .download-description {
-            color: #5a6c7d;
-        }
-
-        .status-indicator {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.8rem;
-            padding: 0.8rem 1.5rem;
-            border-radius: 30px;
-            font-weight: 700;
-            font-size: 1rem;
-            transition: all 0.3s ease;
-            animation: fadeInUp 0.6s ease-out 0.4s both;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-            backdrop-filter: blur(10px);
-        }
-
-        .status-indicator:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 6px 18px rgba(0,0,0,0.15);
-        }
-
-        .status-ready {
-            background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-            color: #155724;
-            border: 2px solid #28a745;
-            animation: pulse 2s ease-in-out infinite;
-        }
-
-        .status-processing {
-            background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
-            color: #856404;
-            border: 2px solid #ffc107;
-            animation: pulse 2s ease-in-out infinite;
-        }
-
-        .chart-container {
-            background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-            border-radius: 20px;
-            padding: 1.5rem;
-            box-shadow: 0 6px 20px rgba(0,0,0,0.08);
-            border: 2px solid #e9ecef;
-            transition: all 0.3s ease;
-            animation: fadeInUp 0.8s ease-out 0.6s both;
-            backdrop-filter: blur(5px);
-        }
-
-        .chart-container:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 10px 30px rgba(0,0,0,0.12);
-            border-color: #667eea;
-        }
-
-        /* Responsive design improvements */
-        @media (max-width: 768px) {
-            .export-metric-card {
-                min-height: 120px;
-                padding: 1.2rem;
-            }
-
-            .export-metric-value {
-                font-size: 1.8rem;
-            }
-
-            .export-metric-label {
-                font-size: 0.75rem;
-            }
-
-            .download-card {
-                padding: 1.5rem;
-            }
-
-            .download-icon {
-                font-size: 2.5rem;
-            }
-
-            .download-title {
-                font-size: 1rem;
-            }
-
-            .download-description {
-                font-size: 0.8rem;
-            }
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Export header with session info
-        session_duration = latest_stats.get('session_duration', 0) if latest_stats else time.time() - webcam_detector.start_time
-        minutes = int(session_duration // 60)
-        seconds = int(session_duration % 60)
-
-        st.markdown(f"""
-        <div class="export-header">
-            <h2 style="margin: 0 0 1rem 0;">📊 Session Export Ready</h2>
-            <p style="margin: 0; font-size: 1.1rem; opacity: 0.9;">
-                {frame_count:,} frames processed • {minutes:02d}:{seconds:02d} session duration
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        # Session figures, read once for the header, metric cards and summary report
+        if latest_stats:
+            session_duration = latest_stats.get('session_duration', 0)
+            total_people = latest_stats.get('total_people_session', 0)
+            total_violations = latest_stats.get('total_violations_session', 0)
+            compliance_rate = latest_stats.get('compliance_rate', 100.0)
+        else:
+            session_duration = time.time() - webcam_detector.start_time
+            total_people = webcam_detector.total_people_detected
+            total_violations = webcam_detector.total_violations_detected
+            compliance_rate = 100.0
+        minutes, seconds = divmod(int(session_duration), 60)
+        duration_text = f"{minutes:02d}:{seconds:02d}"
+
+        # Export tab styles and header with session info in one element
+        st.markdown(EXPORT_TAB_CSS + EXPORT_HEADER_TMPL.format_map({
+            'frame_count': frame_count,
+            'duration_text': duration_text,
+        }), unsafe_allow_html=True)
 
         # Enhanced Session metrics overview with better spacing
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
-            border-radius: 15px;
-            padding: 1.5rem;
-            margin: 1.5rem 0;
-            border-left: 5px solid #667eea;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.05);
-        ">
-            <h4 style="margin: 0 0 1rem 0; color: #2c3e50; font-size: 1.3rem;">
-                📈 Session Overview & Key Metrics
-            </h4>
-        </div>
-        """, unsafe_allow_html=True)
-
-        col1, col2, col3, col4 = st.columns(4, gap="medium")
-
-        with col1:
-            st.markdown(f"""
-            <div class="export-metric-card" style="--card-accent: #2196F3;">
-                <div class="export-metric-value">{frame_count:,}</div>
-                <div class="export-metric-label">Frames Processed</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            total_people = latest_stats.get('total_people_session', 0) if latest_stats else webcam_detector.total_people_detected
-            st.markdown(f"""
-            <div class="export-metric-card" style="--card-accent: #4CAF50;">
-                <div class="export-metric-value">{total_people:,}</div>
-                <div class="export-metric-label">People Detected</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            total_violations = latest_stats.get('total_violations_session', 0) if latest_stats else webcam_detector.total_violations_detected
-            st.markdown(f"""
-            <div class="export-metric-card" style="--card-accent: #FF9800;">
-                <div class="export-metric-value">{total_violations:,}</div>
-                <div class="export-metric-label">Violations Found</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            compliance_rate = latest_stats.get('compliance_rate', 100.0) if latest_stats else 100.0
-            st.markdown(f"""
-            <div class="export-metric-card" style="--card-accent: #9C27B0;">
-                <div class="export-metric-value">{compliance_rate:.1f}%</div>
-                <div class="export-metric-label">Compliance Rate</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(EXPORT_OVERVIEW_HEADING, unsafe_allow_html=True)
+
+        cards = "".join(
+            EXPORT_METRIC_CARD_TMPL.format(accent=accent, value=value, label=label)
+            for accent, value, label in (
+                ('#2196F3', f"{frame_count:,}", 'Frames Processed'),
+                ('#4CAF50', f"{total_people:,}", 'People Detected'),
+                ('#FF9800', f"{total_violations:,}", 'Violations Found'),
+                ('#9C27B0', f"{compliance_rate:.1f}%", 'Compliance Rate'),
+            )
+        )
+        st.markdown(METRIC_GRID_TMPL.format(cards=cards), unsafe_allow_html=True)
 
         st.markdown("---")
 
@@ -4371,160 +5015,80 @@ def main():
 
         st.markdown("<br>", unsafe_allow_html=True)
 
-        # Enhanced Download section with better visual hierarchy
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
-            border-radius: 15px;
-            padding: 2rem;
-            margin: 2rem 0;
-            border-left: 5px solid #28a745;
-            box-shadow: 0 6px 20px rgba(0,0,0,0.08);
-            position: relative;
-            overflow: hidden;
-        ">
-            <div style="
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                height: 3px;
-                background: linear-gradient(90deg, #28a745, #20c997, #28a745);
-                background-size: 200% 100%;
-                animation: gradientShift 3s ease-in-out infinite;
-            "></div>
-            <h4 style="margin: 0 0 1rem 0; color: #2c3e50; font-size: 1.4rem; display: flex; align-items: center; gap: 0.5rem;">
-                📥 Download Center
-                <span style="font-size: 0.8rem; background: #28a745; color: white; padding: 0.2rem 0.6rem; border-radius: 12px; font-weight: 600;">
-                    Ready
-                </span>
-            </h4>
-            <p style="margin: 0; color: #6c757d; font-size: 1rem;">
-                Export your session data in multiple formats for analysis and reporting
-            </p>
-        </div>
-
-        <style>
-        @keyframes gradientShift {
-            0%, 100% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Import the export function
-        from webcam_component import create_comprehensive_export_data
+        # Download section heading and format cards in one element
+        st.markdown(EXPORT_DOWNLOAD_HEADING + EXPORT_DOWNLOAD_CARDS_HTML, unsafe_allow_html=True)
 
         try:
-            # Create export data
-            export_data = create_comprehensive_export_data(latest_stats, webcam_detector)
+            # Create export data (reused across reruns until new frames arrive)
+            export_data = get_export_data(latest_stats, webcam_detector)
+            export_timestamp = datetime.now()
+            file_stamp = export_timestamp.strftime('%Y%m%d_%H%M%S')
 
             col_d1, col_d2, col_d3 = st.columns(3)
 
             with col_d1:
-                st.markdown("""
-                <div class="download-card">
-                    <div class="download-icon">📄</div>
-                    <div class="download-title">JSON Report</div>
-                    <div class="download-description">Complete detection data in JSON format for developers and analysts</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-                import json
-                # Ensure datetime is available (defensive import)
-                try:
-                    export_timestamp = datetime.now()
-                except NameError:
-                    from datetime import datetime
-                    export_timestamp = datetime.now()
-                json_data = json.dumps(export_data, indent=2, default=str)
+                pretty_json = st.checkbox("Pretty-print JSON", value=False, help="Indent the report for reading; compact output is smaller and faster")
+                json_bytes = get_export_json(export_data, pretty_json)
 
                 st.download_button(
                     label="📥 Download JSON Report",
-                    data=json_data,
-                    file_name=f"ppe_detection_report_{export_timestamp.strftime('%Y%m%d_%H%M%S')}.json",
+                    data=json_bytes,
+                    file_name=f"ppe_detection_report_{file_stamp}.json",
                     mime="application/json",
                     use_container_width=True,
                     help="Complete detection data in JSON format"
                 )
-                st.caption(f"📊 Size: {len(json_data)/1024:.1f} KB")
+                st.download_button(
+                    label="🗜️ Download JSON (gz)",
+                    data=gzip_download(json_bytes),
+                    file_name=f"ppe_detection_report_{file_stamp}.json.gz",
+                    mime="application/gzip",
+                    use_container_width=True,
+                    help="Gzip-compressed JSON report for large sessions"
+                )
+                st.caption(f"📊 Size: {len(json_bytes)/1024:.1f} KB")
 
             with col_d2:
-                st.markdown("""
-                <div class="download-card">
-                    <div class="download-icon">📊</div>
-                    <div class="download-title">CSV Data</div>
-                    <div class="download-description">Timeline data for spreadsheet analysis and further processing</div>
-                </div>
-                """, unsafe_allow_html=True)
-
                 # Create CSV data
                 if webcam_detector.compliance_history:
-                    import pandas as pd
-
-                    # Create DataFrame with timeline data
-                    df_data = {
-                        'Frame': list(range(1, len(webcam_detector.compliance_history) + 1)),
-                        'Compliance_Rate': webcam_detector.compliance_history,
-                        'People_Count': webcam_detector.people_history[:len(webcam_detector.compliance_history)] if webcam_detector.people_history else [0] * len(webcam_detector.compliance_history),
-                        'Violations': webcam_detector.violation_history[:len(webcam_detector.compliance_history)] if webcam_detector.violation_history else [0] * len(webcam_detector.compliance_history)
-                    }
-
-                    df = pd.DataFrame(df_data)
-                    csv_data = df.to_csv(index=False)
+                    csv_data = get_timeline_csv(webcam_detector)
 
                     st.download_button(
                         label="📥 Download CSV Data",
                         data=csv_data,
-                        file_name=f"ppe_detection_data_{export_timestamp.strftime('%Y%m%d_%H%M%S')}.csv",
+                        file_name=f"ppe_detection_data_{file_stamp}.csv",
                         mime="text/csv",
                         use_container_width=True,
                         help="Timeline data for Excel/Google Sheets"
                     )
-                    st.caption(f"📈 {len(webcam_detector.compliance_history)} data points")
+                    st.download_button(
+                        label="🗜️ Download CSV (gz)",
+                        data=gzip_download(csv_data),
+                        file_name=f"ppe_detection_data_{file_stamp}.csv.gz",
+                        mime="application/gzip",
+                        use_container_width=True,
+                        help="Gzip-compressed timeline data"
+                    )
+                    st.caption(f"📈 {history_len} data points")
                 else:
                     st.info("⏳ CSV data will be available after more frames are processed")
 
             with col_d3:
-                st.markdown("""
-                <div class="download-card">
-                    <div class="download-icon">📋</div>
-                    <div class="download-title">Summary Report</div>
-                    <div class="download-description">Human-readable executive summary with key insights and recommendations</div>
-                </div>
-                """, unsafe_allow_html=True)
-
                 # Create summary text
-                summary_text = f"""PPE Detection Session Summary
-Generated: {export_timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-
-SESSION OVERVIEW
-================
-• Total Frames Processed: {frame_count:,}
-• Session Duration: {minutes:02d}:{seconds:02d}
-• People Detected: {total_people:,}
-• Violations Found: {total_violations:,}
-• Compliance Rate: {compliance_rate:.1f}%
-
-PERFORMANCE METRICS
-==================
-• Average FPS: {frame_count / session_duration if session_duration > 0 else 0:.1f}
-• Detection Accuracy: High
-• System Status: Operational
-
-RECOMMENDATIONS
-===============
-• Continue monitoring for optimal safety compliance
-• Review violation patterns for improvement opportunities
-• Regular equipment checks recommended
-
-Generated by PPE Monitor Pro v2.1
-"""
+                summary_text = EXPORT_SUMMARY_TMPL.format_map({
+                    'generated': export_timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                    'frame_count': frame_count,
+                    'duration_text': duration_text,
+                    'total_people': total_people,
+                    'total_violations': total_violations,
+                    'compliance_rate': compliance_rate,
+                    'average_fps': frame_count / session_duration if session_duration > 0 else 0,
+                })
 
                 st.download_button(
                     label="📥 Download Summary",
                     data=summary_text,
-                    file_name=f"ppe_detection_summary_{export_timestamp.strftime('%Y%m%d_%H%M%S')}.txt",
+                    file_name=f"ppe_detection_summary_{file_stamp}.txt",
                     mime="text/plain",
                     use_container_width=True,
                     help="Executive summary report"
@@ -4535,286 +5099,11 @@ Generated by PPE Monitor Pro v2.1
             st.error(f"❌ Export preparation failed: {str(e)}")
             st.info("💡 Please ensure the detection session is active and try again.")
 
-        # Enhanced Charts section with better visual organization
-        if webcam_detector.compliance_history and len(webcam_detector.compliance_history) > 1:
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
-                border-radius: 15px;
-                padding: 1.5rem;
-                margin: 2rem 0 1rem 0;
-                border-left: 5px solid #6f42c1;
-                box-shadow: 0 4px 15px rgba(0,0,0,0.05);
-            ">
-                <h4 style="margin: 0 0 0.5rem 0; color: #2c3e50; font-size: 1.3rem; display: flex; align-items: center; gap: 0.5rem;">
-                    📈 Live Analytics Dashboard
-                    <span style="font-size: 0.7rem; background: #6f42c1; color: white; padding: 0.2rem 0.5rem; border-radius: 10px; font-weight: 600;">
-                        LIVE
-                    </span>
-                </h4>
-                <p style="margin: 0; color: #6c757d; font-size: 0.95rem;">
-                    Real-time visualization of detection performance and trends
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-
-            import plotly.graph_objects as go
-            from plotly.subplots import make_subplots
-
-            # Enhanced chart layout with better spacing
-            col_chart1, col_chart2 = st.columns(2, gap="large")
-
-            with col_chart1:
-                st.markdown("""
-                <div class="chart-container" style="
-                    background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-                    border-radius: 15px;
-                    padding: 1.5rem;
-                    box-shadow: 0 6px 20px rgba(0,0,0,0.08);
-                    border: 2px solid #e9ecef;
-                    transition: all 0.3s ease;
-                    margin-bottom: 1rem;
-                ">
-                """, unsafe_allow_html=True)
-
-                # Compliance timeline chart
-                fig_compliance = go.Figure()
-                fig_compliance.add_trace(go.Scatter(
-                    y=webcam_detector.compliance_history,
-                    mode='lines+markers',
-                    name='Compliance Rate',
-                    line=dict(color='#4CAF50', width=3),
-                    marker=dict(size=6, color='#4CAF50'),
-                    fill='tonexty',
-                    fillcolor='rgba(76, 175, 80, 0.1)'
-                ))
-
-                fig_compliance.update_layout(
-                    title={
-                        'text': "📊 Compliance Rate Timeline",
-                        'x': 0.5,
-                        'font': {'size': 16, 'color': '#2c3e50'}
-                    },
-                    yaxis_title="Compliance Rate (%)",
-                    xaxis_title="Frame Number",
-                    height=350,
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='#2c3e50'),
-                    yaxis=dict(range=[0, 100], gridcolor='rgba(0,0,0,0.1)'),
-                    xaxis=dict(gridcolor='rgba(0,0,0,0.1)'),
-                    margin=dict(l=40, r=40, t=60, b=40)
-                )
-
-                st.plotly_chart(fig_compliance, use_container_width=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-
-            with col_chart2:
-                st.markdown("""
-                <div class="chart-container" style="
-                    background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-                    border-radius: 15px;
-                    padding: 1.5rem;
-                    box-shadow: 0 6px 20px rgba(0,0,0,0.08);
-                    border: 2px solid #e9ecef;
-                    transition: all 0.3s ease;
-                    margin-bottom: 1rem;
-                ">
-                """, unsafe_allow_html=True)
-
-                # People detection chart
-                if webcam_detector.people_history:
-                    fig_people = go.Figure()
-                    fig_people.add_trace(go.Scatter(
-                        y=webcam_detector.people_history,
-                        mode='lines+markers',
-                        name='People Detected',
-                        line=dict(color='#2196F3', width=3),
-                        marker=dict(size=6, color='#2196F3'),
-                        fill='tonexty',
-                        fillcolor='rgba(33, 150, 243, 0.1)'
-                    ))
-
-                    fig_people.update_layout(
-                        title={
-                            'text': "👥 People Detection Timeline",
-                            'x': 0.5,
-                            'font': {'size': 16, 'color': '#2c3e50'}
-                        },
-                        yaxis_title="Number of People",
-                        xaxis_title="Frame Number",
-                        height=350,
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        font=dict(color='#2c3e50'),
-                        yaxis=dict(gridcolor='rgba(0,0,0,0.1)'),
-                        xaxis=dict(gridcolor='rgba(0,0,0,0.1)'),
-                        margin=dict(l=40, r=40, t=60, b=40)
-                    )
-
-                    st.plotly_chart(fig_people, use_container_width=True)
-                else:
-                    # Show placeholder for people detection
-                    st.info("👥 People detection chart will appear as data becomes available")
-
-                st.markdown('</div>', unsafe_allow_html=True)
-
-            # Enhanced Combined analytics chart
-            if len(webcam_detector.compliance_history) > 5:
-                st.markdown("""
-                <div style="
-                    background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-                    border-radius: 15px;
-                    padding: 1.5rem;
-                    margin: 1.5rem 0;
-                    box-shadow: 0 8px 25px rgba(0,0,0,0.1);
-                    border: 2px solid #e9ecef;
-                    border-left: 5px solid #17a2b8;
-                ">
-                    <h5 style="margin: 0 0 1rem 0; color: #2c3e50; display: flex; align-items: center; gap: 0.5rem;">
-                        📊 Combined Analytics Overview
-                        <span style="font-size: 0.7rem; background: #17a2b8; color: white; padding: 0.2rem 0.5rem; border-radius: 10px; font-weight: 600;">
-                            ADVANCED
-                        </span>
-                    </h5>
-                </div>
-                <div class="chart-container" style="
-                    background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-                    border-radius: 15px;
-                    padding: 1.5rem;
-                    box-shadow: 0 6px 20px rgba(0,0,0,0.08);
-                    border: 2px solid #e9ecef;
-                    margin-top: 1rem;
-                ">
-                """, unsafe_allow_html=True)
-
-                # Create subplot with secondary y-axis
-                fig_combined = make_subplots(
-                    specs=[[{"secondary_y": True}]],
-                    subplot_titles=["📊 Combined Analytics Overview"]
-                )
-
-                # Add compliance rate
-                fig_combined.add_trace(
-                    go.Scatter(
-                        y=webcam_detector.compliance_history,
-                        mode='lines',
-                        name='Compliance Rate (%)',
-                        line=dict(color='#4CAF50', width=2)
-                    ),
-                    secondary_y=False,
-                )
-
-                # Add people count if available
-                if webcam_detector.people_history:
-                    fig_combined.add_trace(
-                        go.Scatter(
-                            y=webcam_detector.people_history[:len(webcam_detector.compliance_history)],
-                            mode='lines',
-                            name='People Count',
-                            line=dict(color='#2196F3', width=2)
-                        ),
-                        secondary_y=True,
-                    )
-
-                # Update layout
-                fig_combined.update_layout(
-                    height=400,
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='#2c3e50'),
-                    margin=dict(l=40, r=40, t=60, b=40)
-                )
-
-                fig_combined.update_yaxes(title_text="Compliance Rate (%)", secondary_y=False)
-                fig_combined.update_yaxes(title_text="Number of People", secondary_y=True)
-                fig_combined.update_xaxes(title_text="Frame Number")
-
-                st.plotly_chart(fig_combined, use_container_width=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-
-        else:
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #e3f2fd 0%, #f3e5f5 100%);
-                border-radius: 15px;
-                padding: 2rem;
-                margin: 2rem 0;
-                border-left: 5px solid #2196f3;
-                box-shadow: 0 4px 15px rgba(33, 150, 243, 0.1);
-                text-align: center;
-            ">
-                <h4 style="margin: 0 0 1rem 0; color: #1976d2; display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
-                    📊 Analytics Dashboard
-                    <span style="font-size: 0.7rem; background: #ff9800; color: white; padding: 0.2rem 0.5rem; border-radius: 10px; font-weight: 600;">
-                        BUILDING
-                    </span>
-                </h4>
-                <p style="margin: 0 0 1.5rem 0; color: #424242; font-size: 1.1rem;">
-                    Charts will appear after more detection data is collected
-                </p>
-                <div style="
-                    background: rgba(255,255,255,0.7);
-                    border-radius: 10px;
-                    padding: 1.5rem;
-                    margin: 1rem 0;
-                    text-align: left;
-                ">
-                    <h5 style="margin: 0 0 1rem 0; color: #2c3e50;">📈 Available Charts:</h5>
-                    <ul style="margin: 0; color: #424242; line-height: 1.8;">
-                        <li>🔄 Compliance rate timeline</li>
-                        <li>👥 People detection trends</li>
-                        <li>📊 Combined analytics overview</li>
-                        <li>📈 Real-time performance metrics</li>
-                    </ul>
-                </div>
-                <div style="
-                    background: rgba(255, 193, 7, 0.1);
-                    border: 1px solid #ffc107;
-                    border-radius: 8px;
-                    padding: 1rem;
-                    margin-top: 1rem;
-                ">
-                    <strong style="color: #856404;">⏱️ Minimum data needed:</strong>
-                    <span style="color: #424242;"> 2+ processed frames with analytics</span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        # Live analytics charts rerun on their own when the chart toggle changes
+        render_export_charts(webcam_detector)
 
-        # Enhanced Success message with better styling
-        st.markdown("""
-        <div style="
-            background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-            border: 2px solid #28a745;
-            border-radius: 15px;
-            padding: 1.5rem 2rem;
-            margin: 2rem 0;
-            text-align: center;
-            box-shadow: 0 6px 20px rgba(40, 167, 69, 0.2);
-            position: relative;
-            overflow: hidden;
-        ">
-            <div style="
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                height: 3px;
-                background: linear-gradient(90deg, #28a745, #20c997, #28a745);
-                background-size: 200% 100%;
-                animation: gradientShift 2s ease-in-out infinite;
-            "></div>
-            <h4 style="margin: 0 0 0.5rem 0; color: #155724; font-size: 1.3rem; display: flex; align-items: center; justify-content: center; gap: 0.5rem;">
-                ✅ Export Interface Ready!
-                <span style="font-size: 0.7rem; background: #28a745; color: white; padding: 0.2rem 0.5rem; border-radius: 10px; font-weight: 600;">
-                    ACTIVE
-                </span>
-            </h4>
-            <p style="margin: 0; color: #155724; font-size: 1rem; opacity: 0.9;">
-                All download options and analytics are available above. Your session data is ready for export!
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        # Export ready banner
+        st.markdown(EXPORT_READY_HTML, unsafe_allow_html=True)
 
     with tab6:
         # Face Recognition Management Tab
@@ -5159,40 +5448,46 @@ Generated by PPE Monitor Pro v2.1
                 # Get employee data from attendance manager
                 employees_data = {}
                 if st.session_state.attendance_manager:
-                    all_employees = st.session_state.attendance_manager.get_all_employees()
+                    all_employees = get_all_employees(st.session_state.attendance_manager)
                     employees_data = {emp['name']: emp for emp in all_employees}
 
+                # One table row per person; Retrain/Delete act on the selected row
+                employee_rows = []
                 for person in dataset_info['people']:
                     employee_info = employees_data.get(person['name'], {})
+                    face_trained = employee_info.get('face_trained', False)
+                    employee_rows.append({
+                        'Name': person['name'],
+                        'Employee ID': employee_info.get('employee_id', 'N/A'),
+                        'Department': employee_info.get('department', 'Not Specified'),
+                        'Samples': person['samples'],
+                        'Status': "✅ Face Trained" if face_trained else "⚠️ Needs Training"
+                    })
+
+                employee_table = st.dataframe(
+                    employee_rows,
+                    hide_index=True,
+                    use_container_width=True,
+                    on_select="rerun",
+                    selection_mode="single-row",
+                    key="employee_table"
+                )
+                selected_rows = [row for row in employee_table.selection.rows if row < len(employee_rows)]
+                selected_person = employee_rows[selected_rows[0]]['Name'] if selected_rows else None
 
-                    with st.container():
-                        col1, col2, col3 = st.columns([3, 1, 1])
-
-                        with col1:
-                            employee_id = employee_info.get('employee_id', 'N/A')
-                            department = employee_info.get('department', 'Not Specified')
-                            face_trained = employee_info.get('face_trained', False)
-
-                            status_icon = "✅" if face_trained else "⚠️"
-                            status_text = "Face Trained" if face_trained else "Needs Training"
-
-                            st.markdown(f"""
-                            <div class="person-card">
-                                <div class="person-name">👤 {person['name']} {status_icon}</div>
-                                <div class="person-samples">🆔 ID: {employee_id} | 🏢 {department}</div>
-                                <div class="person-samples">📸 {person['samples']} samples | 🎯 {status_text}</div>
-                            </div>
-                            """, unsafe_allow_html=True)
-
-                        with col2:
-                            if st.button("🔄 Retrain", key=f"retrain_{person['name']}", help=f"Collect more samples for {person['name']}"):
-                                st.session_state[f"retrain_person"] = person['name']
-                                st.rerun()
+                col1, col2 = st.columns(2)
+                with col1:
+                    if st.button("🔄 Retrain", key="retrain_selected", disabled=selected_person is None,
+                                 help="Collect more samples for the selected person", use_container_width=True):
+                        st.session_state["retrain_person"] = selected_person
+                        st.rerun()
 
-                        with col3:
-                            if st.button("🗑️ Delete", key=f"delete_{person['name']}", help=f"Delete {person['name']} from dataset", type="secondary"):
-                                st.session_state[f"confirm_delete"] = person['name']
-                                st.rerun()
+                with col2:
+                    if st.button("🗑️ Delete", key="delete_selected", disabled=selected_person is None,
+                                 help="Delete the selected person from the dataset", type="secondary",
+                                 use_container_width=True):
+                        st.session_state["confirm_delete"] = selected_person
+                        st.rerun()
 
                 # Handle delete confirmation
                 if 'confirm_delete' in st.session_state:
@@ -5326,7 +5621,7 @@ Generated by PPE Monitor Pro v2.1
                             if results['status'] == 'completed':
                                 # Update face training status for all trained employees
                                 if st.session_state.attendance_manager:
-                                    all_employees = st.session_state.attendance_manager.get_all_employees()
+                                    all_employees = get_all_employees(st.session_state.attendance_manager)
                                     for employee in all_employees:
                                         st.session_state.attendance_manager.update_employee_face_status(
                                             employee['employee_id'], True
@@ -5352,7 +5647,7 @@ Generated by PPE Monitor Pro v2.1
                             if results['status'] == 'completed':
                                 # Update face training status for all trained employees
                                 if st.session_state.attendance_manager:
-                                    all_employees = st.session_state.attendance_manager.get_all_employees()
+                                    all_employees = get_all_employees(st.session_state.attendance_manager)
                                     for employee in all_employees:
                                         st.session_state.attendance_manager.update_employee_face_status(
                                             employee['employee_id'], True
@@ -5439,11 +5734,7 @@ Generated by PPE Monitor Pro v2.1
                         if st.button("🔍 Test Recognition", type="primary", use_container_width=True, key="test_recognition_btn"):
                             with st.spinner("Testing face recognition..."):
                                 # Convert PIL image to numpy array
-                                try:
-                                    img_array = np.array(image)
-                                except NameError:
-                                    import numpy as np
-                                    img_array = np.array(image)
+                                img_array = np.array(image)
 
                                 # Perform face recognition
                                 face_results = face_engine.recognize_faces(img_array)
@@ -5525,121 +5816,16 @@ Generated by PPE Monitor Pro v2.1
 
         # Get attendance data
         attendance_manager = st.session_state.attendance_manager
-        today_attendance = attendance_manager.get_today_attendance()
-        attendance_stats = attendance_manager.get_attendance_stats()
-
-        # Real-time notifications area
-        notification_container = st.container()
-
-        # Check for real-time attendance updates
-        attendance_updated = False
-        if hasattr(st.session_state, 'webcam_detector') and st.session_state.webcam_detector:
-            attendance_summary = st.session_state.webcam_detector.get_attendance_summary()
-            attendance_updated = attendance_summary.get('attendance_updated', False)
-
-            if attendance_updated:
-                # Get the latest detection
-                recent_detections = attendance_summary.get('recent_detections', [])
-                if recent_detections:
-                    latest_detection = recent_detections[-1]
-                    with notification_container:
-                        st.success(f"🎉 **New Attendance Recorded!** {latest_detection['name']} ({latest_detection['confidence']:.0f}% confidence) at {datetime.fromtimestamp(latest_detection['timestamp']).strftime('%H:%M:%S')}")
-
-                # Reset the flag and refresh data
-                st.session_state.webcam_detector.attendance_updated = False
-                today_attendance = attendance_manager.get_today_attendance()
-                attendance_stats = attendance_manager.get_attendance_stats()
-                time.sleep(1)  # Brief pause to show the notification
-                st.rerun()
-
-        # Live detection status indicator
-        if hasattr(st.session_state, 'webcam_detector') and st.session_state.webcam_detector:
-            latest_stats = st.session_state.webcam_detector.get_latest_stats()
-            if latest_stats and latest_stats.get('frame_count', 0) > 0:
-                st.info(f"📹 **Live Camera Active** - Processing frames in real-time | Last update: {time.strftime('%H:%M:%S')}")
-            else:
-                st.warning("📹 **Camera Inactive** - Start the camera in the Live Detection tab to enable real-time attendance tracking")
-        else:
-            st.info("📹 **Camera Status** - Go to Live Detection tab to start real-time face recognition")
-
-        # Create attendance dashboard layout
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.markdown(f"""
-            <div style="
-                background: {theme_config['card_bg']};
-                border-radius: 15px;
-                padding: 1.5rem;
-                text-align: center;
-                border: 1px solid {theme_config['border_color']};
-                box-shadow: 0 4px 20px {theme_config['shadow']};
-            ">
-                <div style="font-size: 2rem; color: {theme_config['success_color']}; margin-bottom: 0.5rem;">
-                    {attendance_stats['present_count']}
-                </div>
-                <div style="color: {theme_config['text_secondary']}; font-size: 0.9rem;">
-                    Present Today
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown(f"""
-            <div style="
-                background: {theme_config['card_bg']};
-                border-radius: 15px;
-                padding: 1.5rem;
-                text-align: center;
-                border: 1px solid {theme_config['border_color']};
-                box-shadow: 0 4px 20px {theme_config['shadow']};
-            ">
-                <div style="font-size: 2rem; color: {theme_config['warning_color']}; margin-bottom: 0.5rem;">
-                    {attendance_stats['absent_count']}
-                </div>
-                <div style="color: {theme_config['text_secondary']}; font-size: 0.9rem;">
-                    Absent Today
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            st.markdown(f"""
-            <div style="
-                background: {theme_config['card_bg']};
-                border-radius: 15px;
-                padding: 1.5rem;
-                text-align: center;
-                border: 1px solid {theme_config['border_color']};
-                box-shadow: 0 4px 20px {theme_config['shadow']};
-            ">
-                <div style="font-size: 2rem; color: {theme_config['info_color']}; margin-bottom: 0.5rem;">
-                    {attendance_stats['attendance_rate']:.1f}%
-                </div>
-                <div style="color: {theme_config['text_secondary']}; font-size: 0.9rem;">
-                    Attendance Rate
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        db_version = attendance_manager.data_version()
+        today = date.today()
+        today_attendance = load_today_attendance(attendance_manager.db_path, db_version, today, attendance_manager)
+        attendance_stats = load_attendance_stats(attendance_manager.db_path, db_version, today, attendance_manager)
 
-        with col4:
-            st.markdown(f"""
-            <div style="
-                background: {theme_config['card_bg']};
-                border-radius: 15px;
-                padding: 1.5rem;
-                text-align: center;
-                border: 1px solid {theme_config['border_color']};
-                box-shadow: 0 4px 20px {theme_config['shadow']};
-            ">
-                <div style="font-size: 2rem; color: {theme_config['accent_color']}; margin-bottom: 0.5rem;">
-                    {attendance_stats['total_employees']}
-                </div>
-                <div style="color: {theme_config['text_secondary']}; font-size: 0.9rem;">
-                    Total Employees
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        # Live status and counters; polls every 5 seconds when auto-refresh is on
+        st.fragment(
+            render_attendance_live_panel,
+            run_every=5 if st.session_state.get('auto_refresh_attendance', False) else None
+        )(attendance_manager)
 
         st.markdown("---")
 
@@ -5673,25 +5859,13 @@ Generated by PPE Monitor Pro v2.1
                 st.rerun()
 
         with col4:
-            # Auto-refresh toggle
-            auto_refresh = st.checkbox("🔄 Auto", value=st.session_state.get('auto_refresh_attendance', False),
-                                     help="Auto-refresh every 5 seconds")
-            st.session_state.auto_refresh_attendance = auto_refresh
-
-        # Auto-refresh functionality
-        if st.session_state.get('auto_refresh_attendance', False):
-            # Add auto-refresh timer
-            if 'last_refresh_time' not in st.session_state:
-                st.session_state.last_refresh_time = time.time()
-
-            current_time = time.time()
-            if current_time - st.session_state.last_refresh_time > 5:  # Refresh every 5 seconds
-                st.session_state.last_refresh_time = current_time
-                st.rerun()
+            # Auto-refresh toggle; the live panel above reads it through its key
+            st.checkbox("🔄 Auto", key='auto_refresh_attendance',
+                        help="Auto-refresh every 5 seconds")
 
         # Employee Database Display
         if st.session_state.get('show_employee_database', False):
-            all_employees = attendance_manager.get_all_employees()
+            all_employees = get_all_employees(attendance_manager)
 
             if all_employees:
                 st.markdown(f"""
@@ -5760,7 +5934,7 @@ Generated by PPE Monitor Pro v2.1
 
         # Employee Statistics Display
         if st.session_state.get('show_employee_stats', False):
-            all_employees = attendance_manager.get_all_employees()
+            all_employees = get_all_employees(attendance_manager)
 
             if all_employees:
                 st.markdown(f"""
@@ -6077,7 +6251,7 @@ Generated by PPE Monitor Pro v2.1
             </div>
             """, unsafe_allow_html=True)
 
-            all_employees = attendance_manager.get_all_employees()
+            all_employees = get_all_employees(attendance_manager)
 
             if all_employees:
                 # Calculate department statistics
@@ -6116,9 +6290,7 @@ Generated by PPE Monitor Pro v2.1
                             x=dept_names,
                             y=dept_rates,
                             marker_color=[
-                                theme_config['success_color'] if rate >= 80 else
-                                theme_config['warning_color'] if rate >= 60 else
-                                theme_config['danger_color']
+                                theme_config[COMPLIANCE_COLOR_KEYS[compliance_band(rate)]]
                                 for rate in dept_rates
                             ],
                             text=[f"{rate:.1f}%" for rate in dept_rates],
@@ -6318,7 +6490,7 @@ Generated by PPE Monitor Pro v2.1
         """, unsafe_allow_html=True)
 
         # Get all employees for manual management
-        all_employees = attendance_manager.get_all_employees()
+        all_employees = get_all_employees(attendance_manager)
 
         if all_employees:
             # Manual attendance marking
@@ -87,6 +87,17 @@ class AttendanceManager:
             logging.error(f"Error initializing attendance database: {e}")
             raise
     
+    def data_version(self) -> int:
+        """Get a token that changes whenever the database file is written
+
+        Returns:
+            Modification time of the database file in nanoseconds, or 0 if missing
+        """
+        try:
+            return os.stat(self.db_path).st_mtime_ns
+        except OSError:
+            return 0
+
     def add_employee(self, employee_id: str, name: str, department: str = None) -> bool:
         """Add a new employee to the database
         
@@ -501,6 +501,21 @@ class FaceRecognitionEngine:
 
         return False
 
+    def data_version(self) -> Tuple:
+        """Get a token that changes whenever recognition results could change
+
+        Returns:
+            Tuple of training state, confidence threshold and the modification
+            times of the saved model and the dataset directory
+        """
+        mtimes = []
+        for path in (self.model_path, self.dataset_path):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(0)
+        return (self.is_trained, self.confidence_threshold, *mtimes)
+
     def update_confidence_threshold(self, threshold: int) -> None:
         """Update the confidence threshold for recognition
 
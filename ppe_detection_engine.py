@@ -128,6 +128,7 @@ class PPEDetectionEngine:
                 'total_people': 0,
                 'compliant_people': 0,
                 'violations': [],
+                'violations_count': 0,
                 'compliance_rate': 100.0,
                 'people_with_violations': 0
             }
@@ -215,6 +216,7 @@ class PPEDetectionEngine:
                             })
 
                     # Calculate accurate compliance statistics
+                    compliance_stats['violations_count'] = len(compliance_stats['violations'])
                     compliance_stats['people_with_violations'] = len(people_with_violations)
 
                     if compliance_stats['total_people'] > 0:
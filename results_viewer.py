@@ -13,8 +13,8 @@ import json
 from datetime import datetime
 
 
-def create_results_dashboard(results, output_path, processing_time, settings, unique_id=None):
-    """Create a comprehensive results dashboard"""
+def create_results_dashboard(results, output_path, processing_time, settings, unique_id=None, video_data=None):
+    """Create a comprehensive results dashboard; video_data, if given, is used instead of reading output_path"""
 
     # Generate unique identifier for charts if not provided
     if unique_id is None:
@@ -420,7 +420,7 @@ def create_results_dashboard(results, output_path, processing_time, settings, un
         display_statistics(results, processing_time, settings)
 
     with tab4:
-        display_download_options(results, output_path, processing_time, settings, unique_id)
+        display_download_options(results, output_path, processing_time, settings, unique_id, video_data)
 
 
 def display_processed_video(output_path, unique_id=None):
@@ -958,7 +958,7 @@ def display_statistics(results, processing_time, settings):
             """, unsafe_allow_html=True)
 
 
-def display_download_options(results, output_path, processing_time, settings, unique_id=None):
+def display_download_options(results, output_path, processing_time, settings, unique_id=None, video_data=None):
     """Display comprehensive download options"""
 
     st.markdown("### 📥 Download All Results")
@@ -973,14 +973,13 @@ def display_download_options(results, output_path, processing_time, settings, un
     with col1:
         st.markdown("#### 📹 Video Downloads")
 
-        # Download processed video
-        video_data = None
-
-        if os.path.exists(output_path):
-            with open(output_path, 'rb') as f:
-                video_data = f.read()
-        elif hasattr(st.session_state, 'processed_video_data') and st.session_state.processed_video_data:
-            video_data = st.session_state.processed_video_data
+        # Download processed video, from memory when the caller already holds the bytes
+        if not video_data:
+            if output_path and os.path.exists(output_path):
+                with open(output_path, 'rb') as f:
+                    video_data = f.read()
+            elif hasattr(st.session_state, 'processed_video_data') and st.session_state.processed_video_data:
+                video_data = st.session_state.processed_video_data
 
         if video_data:
             file_size = len(video_data) / (1024 * 1024)
@@ -246,9 +246,29 @@ def validate_video(uploaded_file) -> Tuple[bool, str]:
     if uploaded_file.type not in allowed_types:
         return False, f"Invalid file type. Allowed: {', '.join(allowed_types)}"
     
+    # Sniff the container header instead of reading the whole upload
+    header = uploaded_file.read(32)
+    uploaded_file.seek(0)
+    if not _is_video_header(header):
+        return False, "Invalid video file: unrecognized container format"
+    
     return True, ""
 
 
+def _is_video_header(header: bytes) -> bool:
+    """Check leading bytes for MP4/MOV, AVI or Matroska/WebM magic numbers"""
+    if len(header) < 12:
+        return False
+    # MP4/MOV: box size followed by an ISO-BMFF/QuickTime atom type
+    if header[4:8] in (b'ftyp', b'moov', b'mdat', b'wide', b'free', b'skip'):
+        return True
+    # AVI: RIFF container with AVI form type
+    if header[:4] == b'RIFF' and header[8:12] == b'AVI ':
+        return True
+    # MKV/WebM: EBML magic
+    return header[:4] == b'\x1a\x45\xdf\xa3'
+
+
 def create_status_indicator(status: str, label: str = "") -> str:
     """Create a colored status indicator
     